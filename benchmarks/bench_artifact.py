@@ -0,0 +1,86 @@
+"""*Loading a template from its precompiled artifact against parsing and validating its yaml or json source, in process and as the cold start of a fresh interpreter.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_artifact`.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from templatr.artifacts import (
+    artifact_path,
+    compile_source,
+    load_artifact,
+    load_template_file,
+)
+from templatr.template import load_json_template, load_yaml_template
+
+from benchmarks.common import ops_per_second, report, resource
+
+RUNS = 7
+
+
+def _cold_start(code: str) -> float:
+    """*Median milliseconds for a fresh interpreter to run code, interpreter startup included.*"""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main() -> None:
+    directory = tempfile.mkdtemp()
+    try:
+        yaml_source = shutil.copy(resource("example.yaml"), directory)
+        json_source = shutil.copy(resource("example.json"), directory)
+        compile_source(yaml_source)
+        artifact = artifact_path(yaml_source)
+
+        report(
+            "example.yaml load",
+            [
+                (
+                    "load_yaml_template",
+                    ops_per_second(lambda: load_yaml_template(yaml_source), 2_000),
+                ),
+                (
+                    "load_json_template",
+                    ops_per_second(lambda: load_json_template(json_source), 2_000),
+                ),
+                (
+                    "load_artifact",
+                    ops_per_second(lambda: load_artifact(artifact), 2_000),
+                ),
+                (
+                    "load_template_file (hash checked)",
+                    ops_per_second(lambda: load_template_file(yaml_source), 2_000),
+                ),
+            ],
+        )
+
+        print(f"cold start, median of {RUNS} fresh interpreters")
+        for name, code in [
+            ("python", "pass"),
+            (
+                "load_yaml_template",
+                f"from templatr import load_yaml_template\nload_yaml_template({yaml_source!r})",
+            ),
+            (
+                "load_template_file",
+                f"from templatr.artifacts import load_template_file\nload_template_file({yaml_source!r})",
+            ),
+        ]:
+            print(f"  {name:<40} {_cold_start(code):>8.1f} ms")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""*Records per second of a naive `Template.format` loop against `Template.format_many`.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_batch`.
+"""
+
+from collections import deque
+
+from templatr.template import load_yaml_template
+
+from benchmarks.common import ops_per_second, report, resource
+
+RECORDS = [
+    {"name": f"user {index}", "age": index, "reasons": ["fast", "simple"]}
+    for index in range(10_000)
+]
+
+
+def naive_loop(template) -> None:
+    for record in RECORDS:
+        template.format(record)
+
+
+def format_many(template) -> None:
+    # drain the generator without keeping the output around.
+    deque(template.format_many(RECORDS), maxlen=0)
+
+
+def main() -> None:
+    template = load_yaml_template(resource("example.yaml"))
+    compiled = load_yaml_template(resource("example.yaml"))
+    compiled.compile()
+
+    records = len(RECORDS)
+    report(
+        f"example.yaml over {records:,} records (records/s)",
+        [
+            (
+                "for loop over Template.format",
+                records * ops_per_second(lambda: naive_loop(template), number=5),
+            ),
+            (
+                "Template.format_many",
+                records * ops_per_second(lambda: format_many(template), number=5),
+            ),
+            (
+                "compiled Template.format_many",
+                records * ops_per_second(lambda: format_many(compiled), number=5),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""*Records per second of rendering column oriented data through `Template.format_columns` against building a dict per row for `Template.format_many`.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_columns`.
+"""
+
+from collections import deque
+
+from templatr.template import load_yaml_template
+
+from benchmarks.common import ops_per_second, report, resource
+
+ROWS = 10_000
+COLUMNS = {
+    "name": [f"user {index}" for index in range(ROWS)],
+    "age": list(range(ROWS)),
+    "reasons": [["fast", "simple"]] * ROWS,
+}
+
+
+def row_dicts(template) -> None:
+    records = (dict(zip(COLUMNS, row)) for row in zip(*COLUMNS.values()))
+    deque(template.format_many(records), maxlen=0)
+
+
+def columns(template) -> None:
+    deque(template.format_columns(COLUMNS), maxlen=0)
+
+
+def main() -> None:
+    template = load_yaml_template(resource("example.yaml"))
+    report(
+        f"example.yaml over {ROWS:,} rows (records/s)",
+        [
+            (
+                "dict per row into format_many",
+                ROWS * ops_per_second(lambda: row_dicts(template), number=5),
+            ),
+            (
+                "Template.format_columns",
+                ROWS * ops_per_second(lambda: columns(template), number=5),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
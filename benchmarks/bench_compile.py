@@ -0,0 +1,32 @@
+"""*Compares `Template.format` before and after `Template.compile()`.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_compile`.
+"""
+
+from templatr.template import load_yaml_template
+
+from benchmarks.common import ops_per_second, report, resource
+
+DATA = {"name": "Jeffery", "age": 20, "reasons": ["fast", "simple", "typed"]}
+
+
+def main() -> None:
+    interpreted = load_yaml_template(resource("example.yaml"))
+    compiled = load_yaml_template(resource("example.yaml"))
+    compiled.compile()
+
+    assert compiled.format(DATA) == interpreted.format(DATA)
+    report(
+        "example.yaml render",
+        [
+            ("Template.format(data)", ops_per_second(lambda: interpreted.format(DATA))),
+            (
+                "compiled Template.format(data)",
+                ops_per_second(lambda: compiled.format(DATA)),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""*Compares a costly formatter called directly with the same formatter wrapped in a `CachedFormatter`, over a handful of repeated values.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_formatter_cache`.
+"""
+
+from decimal import Decimal
+from typing import Any
+import itertools
+
+from templatr.formatter import CachedFormatter, VariableFormatter
+
+from benchmarks.common import ops_per_second, report
+
+
+class CurrencyFormatter(VariableFormatter):
+    """*Stands in for localization work, groups digits and rounds with Decimal.*"""
+
+    def format(self, value: Any) -> str:
+        amount = Decimal(str(value)).quantize(Decimal("0.01"))
+        whole, cents = f"{amount:f}".split(".")
+        groups = []
+        while whole:
+            groups.insert(0, whole[-3:])
+            whole = whole[:-3]
+        return "$" + ",".join(groups) + "." + cents
+
+
+def main() -> None:
+    values = itertools.cycle([1999.5, 25.0, 100000.25, 3.14, 42.0])
+    formatter = CurrencyFormatter()
+    cached = CachedFormatter(CurrencyFormatter(), max_size=16)
+
+    report(
+        "currency formatting over 5 repeated values",
+        [
+            ("CurrencyFormatter", ops_per_second(lambda: formatter(next(values)))),
+            (
+                "CachedFormatter(CurrencyFormatter)",
+                ops_per_second(lambda: cached(next(values))),
+            ),
+        ],
+    )
+    print(f"  hit rate {cached.stats.hit_rate:.4f}")
+
+
+if __name__ == "__main__":
+    main()
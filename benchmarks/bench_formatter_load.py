@@ -0,0 +1,44 @@
+"""*Cost of loading the formatters of many variables with and without the class cache and instance interning.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_formatter_load`.
+"""
+
+from templatr.formatter import clear_formatter_cache, load_formatter
+
+from benchmarks.common import ops_per_second, report
+
+
+def uncached() -> None:
+    clear_formatter_cache()
+    load_formatter("ListFormatter", ["\n"], {})
+
+
+def main() -> None:
+    uncached_ops = ops_per_second(uncached, number=20_000)
+    # loaded templates keep their formatters alive, interned instances are only shared while in use.
+    in_use = load_formatter("ListFormatter", ["\n"], {}, intern=True)
+    report(
+        "load_formatter('ListFormatter', ['\\n'], {})",
+        [
+            ("resolve class every load", uncached_ops),
+            (
+                "cached class",
+                ops_per_second(
+                    lambda: load_formatter("ListFormatter", ["\n"], {}),
+                    number=20_000,
+                ),
+            ),
+            (
+                "cached class + interned",
+                ops_per_second(
+                    lambda: load_formatter("ListFormatter", ["\n"], {}, intern=True),
+                    number=20_000,
+                ),
+            ),
+        ],
+    )
+    del in_use
+
+
+if __name__ == "__main__":
+    main()
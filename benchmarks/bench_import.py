@@ -0,0 +1,93 @@
+"""*Cold start cost of importing templatr, measured with `python -X importtime` in fresh interpreters, against the budget for processes that only render.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_import`, `--check` exits with 1 when rendering a template built in code goes over budget.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+RUNS = 7
+
+# milliseconds of imports a process that only renders templates built in code may pay.
+BUDGET_MS = 75.0
+
+SCENARIOS = {
+    "import templatr": "import templatr",
+    "render template built in code": (
+        "from templatr import Template, Variable\n"
+        "Template([Variable('name')], 'Hi {name}').format({'name': 'x'})"
+    ),
+    "load json template": (
+        "import io\n"
+        "from templatr import load_json_template\n"
+        'load_json_template(io.BytesIO(b\'{"text": "Hi {name}", "variables": [{"key": "name"}]}\'))'
+    ),
+    "load yaml template": (
+        "import io\n"
+        "from templatr import load_yaml_template\n"
+        "load_yaml_template(io.StringIO('text: Hi {name}\\nvariables:\\n  - key: name\\n'))"
+    ),
+}
+
+# heavy dependencies reported when a scenario imports them.
+WATCHED = ("pydantic", "yaml", "asyncio", "concurrent.futures")
+
+
+def _importtime(code: str) -> List[Tuple[int, str]]:
+    """*Top level imports of a fresh interpreter running code, as cumulative microseconds and module name.*"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # nested imports are indented past the single space of top level ones.
+        imports.append((int(cumulative), name[1:].rstrip()))
+    return imports
+
+
+def _measure(code: str, startup: Set[str]) -> Tuple[float, Set[str]]:
+    """*Median milliseconds spent importing modules the interpreter doesn't import on its own, and the modules imported.*"""
+    totals = []
+    for _ in range(RUNS):
+        imports = _importtime(code)
+        totals.append(
+            sum(
+                cumulative
+                for cumulative, name in imports
+                if not name.startswith(" ") and name.strip() not in startup
+            )
+        )
+    return statistics.median(totals) / 1000, {name.strip() for _, name in imports}
+
+
+def main() -> None:
+    startup = {name.strip() for _, name in _importtime("pass")}
+    results: Dict[str, float] = {}
+    print(f"import time, median of {RUNS} fresh interpreters")
+    for name, code in SCENARIOS.items():
+        ms, modules = _measure(code, startup)
+        results[name] = ms
+        watched = ", ".join(module for module in WATCHED if module in modules)
+        print(f"  {name:<40} {ms:>8.1f} ms  imports: {watched or '-'}")
+
+    render_ms = results["render template built in code"]
+    within = render_ms <= BUDGET_MS
+    print(
+        f"render budget {BUDGET_MS:.0f} ms: {'ok' if within else 'over'} ({render_ms:.1f} ms)"
+    )
+    if "--check" in sys.argv and not within:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
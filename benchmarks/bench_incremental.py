@@ -0,0 +1,57 @@
+"""*Keeping the rendered view of a large state up to date when one field changes, `Template.format` of the whole state against `IncrementalRender.update` with the changed path.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_incremental`.
+"""
+
+from templatr.formatter import ListFormatter
+from templatr.template import Template
+from templatr.variable import Variable
+
+from benchmarks.common import ops_per_second, report
+
+ROWS = 200
+
+
+def main() -> None:
+    variables = []
+    lines = []
+    for row in range(ROWS):
+        variables.append(Variable(f"name_{row}", path=f"rows.{row}.name"))
+        variables.append(Variable(f"count_{row}", path=f"rows.{row}.count", default=0))
+        variables.append(
+            Variable(
+                f"tags_{row}", path=f"rows.{row}.tags", formatter=ListFormatter(", ")
+            )
+        )
+        lines.append(
+            f"<tr><td>{{name_{row}}}</td><td>{{count_{row}:>6}}</td><td>{{tags_{row}}}</td></tr>"
+        )
+    template = Template(variables, "<table>" + "\n".join(lines) + "</table>")
+    state = {
+        "rows": {
+            str(row): {"name": f"row {row}", "count": row, "tags": ["a", "b", "c"]}
+            for row in range(ROWS)
+        }
+    }
+    handle = template.incremental(state)
+    changed = ["rows.100.count"]
+
+    def update():
+        state["rows"]["100"]["count"] += 1
+        return handle.update(state, changed)
+
+    assert update() == template.format(state)
+    report(
+        f"{len(variables)} variables, one changed",
+        [
+            (
+                "Template.format",
+                ops_per_second(lambda: template.format(state), number=2_000),
+            ),
+            ("IncrementalRender.update", ops_per_second(update, number=2_000)),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
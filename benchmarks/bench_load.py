@@ -0,0 +1,59 @@
+"""*Template loading throughput with the previous `yaml.safe_load` based loaders against the json parser and libyaml backed loader now used.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_load`.
+"""
+
+import io
+
+from yaml import safe_load
+
+from templatr.loaders import _load_json
+from templatr.template import Template, load_json_template, load_yaml_template
+
+from benchmarks.common import ops_per_second, report, resource
+
+
+def main() -> None:
+    with open(resource("example.json"), "rb") as fp:
+        json_content = fp.read()
+    with open(resource("example.yaml"), "rb") as fp:
+        yaml_content = fp.read()
+
+    report(
+        f"example.json parse + validate (json_loads={_load_json().__module__})",
+        [
+            (
+                "yaml.safe_load",
+                ops_per_second(
+                    lambda: Template.from_dict(safe_load(json_content)), number=2_000
+                ),
+            ),
+            (
+                "load_json_template",
+                ops_per_second(
+                    lambda: load_json_template(io.BytesIO(json_content)), number=2_000
+                ),
+            ),
+        ],
+    )
+    report(
+        "example.yaml parse + validate",
+        [
+            (
+                "yaml.safe_load",
+                ops_per_second(
+                    lambda: Template.from_dict(safe_load(yaml_content)), number=2_000
+                ),
+            ),
+            (
+                "load_yaml_template",
+                ops_per_second(
+                    lambda: load_yaml_template(io.BytesIO(yaml_content)), number=2_000
+                ),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""*Records per second of `Template.format_many` over a broadcast where most records share the fields the template reads, with and without the output cache.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_output_cache`.
+"""
+
+from collections import deque
+
+from templatr.template import Template
+from templatr.variable import Variable
+
+from benchmarks.common import ops_per_second, report
+
+FIELDS = ["title", "summary", "price", "cta", "footer"]
+RECORDS = [
+    {
+        "user": index,
+        "product": {field: f"{field} of product {index % 5} " * 20 for field in FIELDS},
+    }
+    for index in range(10_000)
+]
+
+
+def _template() -> Template:
+    return Template(
+        variables=[Variable(key=field, path=["product", field]) for field in FIELDS],
+        text="\n".join(f"<p class='{field}'>{{{field}}}</p>" for field in FIELDS * 4),
+    )
+
+
+def main() -> None:
+    template = _template()
+    cached = _template()
+    cache = cached.enable_output_cache()
+
+    records = len(RECORDS)
+    report(
+        f"broadcast of 5 distinct products to {records:,} users (records/s)",
+        [
+            (
+                "Template.format_many",
+                records
+                * ops_per_second(
+                    lambda: deque(template.format_many(RECORDS), maxlen=0), number=5
+                ),
+            ),
+            (
+                "Template.format_many with output cache",
+                records
+                * ops_per_second(
+                    lambda: deque(cached.format_many(RECORDS), maxlen=0), number=5
+                ),
+            ),
+        ],
+    )
+    print(f"  hit rate {cache.stats.hit_rate:.4f}")
+
+
+if __name__ == "__main__":
+    main()
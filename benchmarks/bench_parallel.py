@@ -0,0 +1,56 @@
+"""*Throughput of `Template.format_parallel` as the number of worker processes grows.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_parallel`.
+"""
+
+from collections import deque
+import os
+import time
+
+from templatr.template import load_yaml_template
+
+from benchmarks.common import report, resource
+
+RECORDS = [
+    {"name": f"user {index}", "age": index, "reasons": ["fast", "simple"]}
+    for index in range(200_000)
+]
+
+
+def records_per_second(run) -> float:
+    start = time.perf_counter()
+    run()
+    return len(RECORDS) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    template = load_yaml_template(resource("example.yaml"))
+    template.compile()
+
+    rows = [
+        (
+            "format_many (single process)",
+            records_per_second(lambda: deque(template.format_many(RECORDS), maxlen=0)),
+        )
+    ]
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        rows.append(
+            (
+                f"format_parallel workers={workers}",
+                records_per_second(
+                    lambda: deque(
+                        template.format_parallel(
+                            RECORDS, workers=workers, chunksize=2000
+                        ),
+                        maxlen=0,
+                    )
+                ),
+            )
+        )
+        workers *= 2
+    report(f"compiled example.yaml over {len(RECORDS):,} records (records/s)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""*Compares re-parsing template text with `str.format` against rendering the pre-tokenized segments.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_parse`.
+"""
+
+from templatr.template import load_yaml_template
+
+from benchmarks.common import ops_per_second, report, resource
+
+DATA = {"name": "Jeffery", "age": 20, "reasons": ["fast", "simple", "typed"]}
+
+
+def main() -> None:
+    template = load_yaml_template(resource("example.yaml"))
+    values = {variable.key: variable.resolve(DATA) for variable in template.variables}
+    parsed = template._parsed
+
+    assert parsed.render(values) == template.text.format(**values)
+    report(
+        "example.yaml interpolation",
+        [
+            (
+                "str.format(**values)",
+                ops_per_second(lambda: template.text.format(**values)),
+            ),
+            (
+                "ParsedText.render(values)",
+                ops_per_second(lambda: parsed.render(values)),
+            ),
+        ],
+    )
+    report(
+        "example.yaml end to end",
+        [("Template.format(data)", ops_per_second(lambda: template.format(DATA)))],
+    )
+
+
+if __name__ == "__main__":
+    main()
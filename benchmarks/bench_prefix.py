@@ -0,0 +1,92 @@
+"""*Compares resolving every variable path from the root with `Template.format`, which reads prefixes shared between paths once per render.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_prefix`.
+"""
+
+from templatr.template import Template
+from templatr.variable import Variable
+
+from benchmarks.common import ops_per_second, report
+
+PATHS = [
+    "order.id",
+    "order.customer.name",
+    "order.customer.email",
+    "order.customer.address.street",
+    "order.customer.address.city",
+    "order.customer.address.zip",
+    "order.customer.address.country",
+    "order.total",
+    "order.currency",
+    "order.status",
+]
+
+
+class Lazy:
+    """*Object whose attributes are computed properties, like lazily loaded relationships.*"""
+
+    def __init__(self, values: dict) -> None:
+        self._values = values
+
+    def __getattr__(self, name: str):
+        value = self._values[name]
+        return Lazy(value) if isinstance(value, dict) else value
+
+
+DATA = {
+    "order": {
+        "id": 1,
+        "customer": {
+            "name": "Jeffery",
+            "email": "jeffery@example.com",
+            "address": {
+                "street": "1 Main St",
+                "city": "Austin",
+                "zip": "78701",
+                "country": "US",
+            },
+        },
+        "total": 9.99,
+        "currency": "USD",
+        "status": "paid",
+    }
+}
+
+INPUTS = {"dict": DATA, "computed attributes": Lazy(DATA)}
+
+
+def main() -> None:
+    template = Template(
+        variables=[
+            Variable(key=f"V{index}", path=path) for index, path in enumerate(PATHS)
+        ],
+        text=" ".join(f"{{V{index}}}" for index in range(len(PATHS))),
+    )
+    compiled = Template(variables=template.variables, text=template.text)
+    compiled.compile()
+    render = template._parsed.render
+
+    def per_variable(data) -> str:
+        return render(
+            {variable.key: variable.resolve(data) for variable in template.variables}
+        )
+
+    for name, data in INPUTS.items():
+        report(
+            f"{len(PATHS)} variables sharing prefixes through {name}",
+            [
+                (
+                    "each variable from the root",
+                    ops_per_second(lambda: per_variable(data)),
+                ),
+                ("Template.format", ops_per_second(lambda: template.format(data))),
+                (
+                    "compiled Template.format",
+                    ops_per_second(lambda: compiled.format(data)),
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
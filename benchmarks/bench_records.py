@@ -0,0 +1,100 @@
+"""*Reading and rendering a large jsonl file with file iteration plus `json.loads` per line against the memory mapped `MappedJsonl` reader, with and without dropping the fields the template doesn't read, and parallel rendering with records sent to the workers against workers reading their own byte ranges.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_records`.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Iterable
+
+from templatr.parallel import format_jsonl_parallel, format_parallel
+from templatr.records import MappedJsonl, read_jsonl, record_fields
+from templatr.template import Template
+
+RECORDS = 50_000
+# unused fields per record, wide records are where dropping fields pays off.
+PADDING = 40
+
+TEMPLATE = Template(
+    [{"key": "name", "path": "user.name"}, {"key": "total", "path": "order.total"}],
+    "{name} owes {total}",
+)
+
+
+def _write(path: str) -> None:
+    with open(path, "w") as fp:
+        for index in range(RECORDS):
+            record = {
+                "user": {"name": f"user {index}"},
+                "order": {"total": index},
+                **{f"field_{field}": ["padding", field] for field in range(PADDING)},
+            }
+            fp.write(json.dumps(record) + "\n")
+
+
+def _stdlib(path: str) -> Iterable:
+    with open(path, "rb") as fp:
+        for line in fp:
+            yield json.loads(line)
+
+
+def _measure(name: str, records: Callable[[], Iterable]) -> None:
+    start = time.perf_counter()
+    for _ in TEMPLATE.format_many(records()):
+        pass
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in TEMPLATE.format_many(records()):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {name:<40} {RECORDS / seconds:>10,.0f} records/s  peak {peak / 1024:>8,.0f} KiB"
+    )
+
+
+def main() -> None:
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "records.jsonl")
+        _write(path)
+        size = os.path.getsize(path) / 1024 / 1024
+        print(f"read and render {RECORDS:,} records, {size:.0f} MiB")
+
+        def per_line():
+            with open(path, "rb") as fp:
+                yield from read_jsonl(fp)
+
+        fields = record_fields(TEMPLATE)
+        _measure("file iteration + json.loads", lambda: _stdlib(path))
+        _measure("file iteration + read_jsonl", per_line)
+        _measure("MappedJsonl", lambda: MappedJsonl(path))
+        _measure("MappedJsonl(fields)", lambda: MappedJsonl(path, fields))
+
+        print("parallel render, 2 workers")
+        for name, run in [
+            (
+                "format_parallel(read_jsonl)",
+                lambda: format_parallel(TEMPLATE, per_line(), workers=2),
+            ),
+            (
+                "format_jsonl_parallel",
+                lambda: format_jsonl_parallel(TEMPLATE, path, workers=2),
+            ),
+        ]:
+            start = time.perf_counter()
+            for _ in run():
+                pass
+            seconds = time.perf_counter() - start
+            print(f"  {name:<40} {RECORDS / seconds:>10,.0f} records/s")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""*Compares the generic per-call type dispatch of `_resolve_value` with the cached accessor chain used by `Variable.resolve`.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_resolve`.
+"""
+
+from collections import namedtuple
+from dataclasses import dataclass
+
+from templatr.variable import Variable, _resolve_value
+
+from benchmarks.common import ops_per_second, report
+
+Address = namedtuple("Address", ["city", "zip"])
+
+
+@dataclass
+class Customer:
+    name: str
+    address: Address
+
+
+INPUTS = {
+    "dict": {"order": {"customer": {"address": {"city": "Austin"}}}},
+    "object": {"order": {"customer": Customer("Jeffery", Address("Austin", "78701"))}},
+}
+
+
+def main() -> None:
+    variable = Variable(key="city", path="order.customer.address.city")
+    for name, data in INPUTS.items():
+        report(
+            f"4 level path through {name}",
+            [
+                (
+                    "_resolve_value(data, path)",
+                    ops_per_second(lambda: _resolve_value(data, variable.path)),
+                ),
+                (
+                    "Variable.resolve(data)",
+                    ops_per_second(lambda: variable.resolve(data)),
+                ),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
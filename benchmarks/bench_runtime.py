@@ -0,0 +1,73 @@
+"""*Memory kept per loaded template and render throughput of the runtime `Template` and `Variable` objects.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_runtime`.
+"""
+
+import gc
+import tracemalloc
+
+from templatr.template import Template
+
+from benchmarks.common import ops_per_second, report
+
+TEMPLATES = 20_000
+
+
+def _definition(index: int) -> dict:
+    return {
+        "text": f"Template {index}: {{name}} {{city}} {{total}} {{tags}}",
+        "variables": [
+            {"key": "name", "path": "user.name"},
+            {"key": "city", "path": "user.address.city", "default": "unknown"},
+            {"key": "total", "path": "order.total"},
+            {
+                "key": "tags",
+                "path": "order.tags",
+                "formatter": {"cls": "ListFormatter", "args": [", "]},
+            },
+        ],
+    }
+
+
+DATA = {
+    "user": {"name": "Jeffery", "address": {"city": "Austin"}},
+    "order": {"total": 9.99, "tags": ["a", "b"]},
+}
+
+
+def bytes_per_template() -> float:
+    definitions = [_definition(index) for index in range(TEMPLATES)]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        templates = [Template.from_dict(definition) for definition in definitions]
+        for template in templates:
+            template.format(DATA)
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current / len(templates)
+
+
+def main() -> None:
+    print(f"{bytes_per_template():,.0f} bytes kept per loaded and rendered template")
+    template = Template.from_dict(_definition(0))
+    variable = template.variables[0]
+    report(
+        "render",
+        [
+            ("Template.format(data)", ops_per_second(lambda: template.format(DATA))),
+            ("Variable.resolve(data)", ops_per_second(lambda: variable.resolve(DATA))),
+            (
+                "Template.from_dict(definition)",
+                ops_per_second(
+                    lambda: Template.from_dict(_definition(0)), number=5_000
+                ),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
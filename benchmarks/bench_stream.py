@@ -0,0 +1,81 @@
+"""*Peak memory of writing a large document with `Template.format` against streaming it with `Template.render_to`, with and without a streamed `ListFormatter`.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_stream`.
+"""
+
+import os
+import tracemalloc
+
+from templatr.formatter import ListFormatter
+from templatr.template import Template
+from templatr.variable import Variable
+
+SECTIONS = 50
+SECTION = "x" * 100_000
+ROWS = 200_000
+
+
+def peak_bytes(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    template = Template(
+        variables=[
+            Variable(key=f"S{index}", path=["section"]) for index in range(SECTIONS)
+        ],
+        text="\n".join(f"== {index} ==\n{{S{index}}}" for index in range(SECTIONS)),
+    )
+    data = {"section": SECTION}
+
+    with open(os.devnull, "w") as fp:
+        rows = [
+            (
+                "fp.write(Template.format(data))",
+                peak_bytes(lambda: fp.write(template.format(data))),
+            ),
+            (
+                "Template.render_to(data, fp)",
+                peak_bytes(lambda: template.render_to(data, fp)),
+            ),
+        ]
+    print(f"{SECTIONS} sections of {len(SECTION):,} characters (peak bytes allocated)")
+    for name, peak in rows:
+        print(f"  {name:<40} {peak:>14,}")
+
+    rows_data = lambda: {"rows": (f"row {index}" for index in range(ROWS))}
+    joined = Template(
+        variables=[Variable(key="ROWS", path=["rows"], formatter=ListFormatter("\n"))],
+        text="report\n{ROWS}\nend",
+    )
+    streamed = Template(
+        variables=[
+            Variable(
+                key="ROWS", path=["rows"], formatter=ListFormatter("\n", stream=True)
+            )
+        ],
+        text="report\n{ROWS}\nend",
+    )
+    with open(os.devnull, "w") as fp:
+        rows = [
+            (
+                "render_to with ListFormatter",
+                peak_bytes(lambda: joined.render_to(rows_data(), fp)),
+            ),
+            (
+                "render_to with streamed ListFormatter",
+                peak_bytes(lambda: streamed.render_to(rows_data(), fp)),
+            ),
+        ]
+    print(f"list of {ROWS:,} rows from a generator (peak bytes allocated)")
+    for name, peak in rows:
+        print(f"  {name:<40} {peak:>14,}")
+
+
+if __name__ == "__main__":
+    main()
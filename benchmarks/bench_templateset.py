@@ -0,0 +1,92 @@
+"""*Rendering the subject, html body, text body and sms of a notification from one payload with four `Template.format` calls against one `TemplateSet.format`.*
+
+Run with `PYTHONPATH=src python -m benchmarks.bench_templateset`.
+"""
+
+from templatr.template import Template
+from templatr.templateset import TemplateSet
+
+from benchmarks.common import ops_per_second, report
+
+_ITEMS = {
+    "key": "items",
+    "path": "order.items",
+    "formatter": {
+        "cls": "ListFormatter",
+        "kwargs": {
+            "seperator": ", ",
+            "item_formatter": {"cls": "ListFormatter", "args": [" x "]},
+        },
+    },
+}
+_NAME = {"key": "name", "path": "user.profile.first_name"}
+_TOTAL = {"key": "total", "path": "order.total", "default": 0}
+_ORDER = {"key": "order", "path": "order.id"}
+
+MEMBERS = {
+    "subject": {"text": "Order {order} for {name}", "variables": [_ORDER, _NAME]},
+    "html": {
+        "text": "<p>Hi {name},</p><p>Order {order}: {items}</p><p>Total {total}</p>",
+        "variables": [_NAME, _ORDER, _ITEMS, _TOTAL],
+    },
+    "text": {
+        "text": "Hi {name},\nOrder {order}: {items}\nTotal {total}",
+        "variables": [_NAME, _ORDER, _ITEMS, _TOTAL],
+    },
+    "sms": {
+        "text": "{name}, order {order} ({total}) shipped",
+        "variables": [_NAME, _ORDER, _TOTAL],
+    },
+}
+
+DATA = {
+    "user": {"profile": {"first_name": "Ann"}},
+    "order": {"id": 1234, "total": 56.7, "items": [["2", "apples"], ["1", "pear"]] * 4},
+}
+
+
+def main() -> None:
+    templates = {
+        name: Template.from_dict(member, intern=True)
+        for name, member in MEMBERS.items()
+    }
+    template_set = TemplateSet(templates)
+    records = [DATA] * 1_000
+
+    def separately():
+        return {name: template.format(DATA) for name, template in templates.items()}
+
+    assert separately() == template_set.format(DATA)
+    report(
+        f"4 members, {sum(len(t._used_variables) for t in templates.values())} variables, "
+        f"{len(template_set.variables)} distinct",
+        [
+            ("Template.format per member", ops_per_second(separately, number=20_000)),
+            (
+                "TemplateSet.format",
+                ops_per_second(lambda: template_set.format(DATA), number=20_000),
+            ),
+        ],
+    )
+    report(
+        "1,000 records",
+        [
+            (
+                "Template.format_many per member",
+                ops_per_second(
+                    lambda: [list(t.format_many(records)) for t in templates.values()],
+                    number=20,
+                ),
+            ),
+            (
+                "TemplateSet.format_many",
+                ops_per_second(
+                    lambda: list(template_set.format_many(records)), number=20
+                ),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import os
+import timeit
+from typing import Callable, List, Tuple
+
+RESOURCES_PATH = os.path.join(os.path.dirname(__file__), "..", "tests", "resources")
+
+
+def resource(name: str) -> str:
+    """*Path of a file in the shared test resources directory.*"""
+    return os.path.join(RESOURCES_PATH, name)
+
+
+def ops_per_second(
+    fn: Callable[[], object], number: int = 100_000, repeat: int = 5
+) -> float:
+    """*Best ops/sec of `repeat` timing runs calling `fn` `number` times each.*"""
+    best = min(timeit.repeat(fn, number=number, repeat=repeat))
+    return number / best
+
+
+def report(title: str, rows: List[Tuple[str, float]]) -> None:
+    """*Prints ops/sec for each row along with the speedup relative to the first row.*"""
+    print(title)
+    baseline = rows[0][1]
+    for name, ops in rows:
+        print(f"  {name:<40} {ops:>14,.0f} ops/s  x{ops / baseline:.2f}")
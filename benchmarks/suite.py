@@ -0,0 +1,438 @@
+"""*Reproducible benchmark suite over loading, rendering and batch scenarios, with a stored baseline to catch regressions.*
+
+Every scenario reports ops/sec, the best of several timing runs, and the peak memory allocated by a single op traced with `tracemalloc`. Load scenarios over many templates also report the memory the loaded templates keep.
+
+Run with `PYTHONPATH=src python -m benchmarks.suite run [--output results.json] [--filter render/]`.
+
+Compare against the stored baseline with `PYTHONPATH=src python -m benchmarks.suite compare [--baseline benchmarks/baseline.json] [--threshold 0.15]`, it exits with status 1 when a scenario is slower or uses more memory than the baseline by more than the threshold. Refresh the baseline with `run --output benchmarks/baseline.json` on the reference machine.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+
+from pydantic import BaseModel
+import yaml
+
+import templatr
+from templatr.formatter import ListFormatter
+from templatr.template import Template, load_json_template, load_yaml_template
+from templatr.variable import Variable
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+# memory differences below this many bytes are noise and never flagged.
+MEMORY_SLACK = 4096
+
+
+class Scenario(NamedTuple):
+    """*A named operation to measure.*
+
+    **Args**
+    - **name (str)**: unique name of the scenario, `group/variant`.
+    - **setup (Callable[[], Callable[[], Any]])**: builds the data for the scenario outside of timing and returns the op to measure.
+    - **retained (bool)**: When True, also reports the memory still held by the result of the op.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    retained: bool = False
+
+
+class Result(NamedTuple):
+    ops: float
+    peak_bytes: int
+    retained_bytes: Optional[int]
+
+
+# -- data -------------------------------------------------------------------
+
+
+def _template_dict(index: int, variables: int = 4) -> Dict[str, Any]:
+    return {
+        "text": f"Template {index}: "
+        + " ".join(f"{{v{number}}}" for number in range(variables)),
+        "variables": [
+            {
+                "key": f"v{number}",
+                "path": f"record.field{number}",
+                "default": "unset" if number % 2 else None,
+                "formatter": {"cls": "DefaultFormatter"},
+            }
+            for number in range(variables)
+        ],
+    }
+
+
+def _yaml(data: Dict[str, Any]) -> bytes:
+    # block style so the yaml parser does the work a hand written template needs.
+    return yaml.safe_dump(data, sort_keys=False).encode()
+
+
+def _nested(depth: int, leaf: Any, key: str = "level") -> Dict[str, Any]:
+    value = leaf
+    for _ in range(depth - 1):
+        value = {key: value}
+    return value
+
+
+class _Object:
+    def __init__(self, **values: Any) -> None:
+        self.__dict__.update(values)
+
+
+class _Address(BaseModel):
+    city: str
+    zip: str
+    street: str
+
+
+class _Customer(BaseModel):
+    name: str
+    email: str
+    address: _Address
+
+
+class _Order(BaseModel):
+    id: int
+    total: float
+    status: str
+    customer: _Customer
+
+
+ORDER_PATHS = [
+    "order.id",
+    "order.total",
+    "order.status",
+    "order.customer.name",
+    "order.customer.email",
+    "order.customer.address.city",
+    "order.customer.address.zip",
+    "order.customer.address.street",
+]
+
+
+def _order_dict() -> Dict[str, Any]:
+    return {
+        "order": {
+            "id": 7,
+            "total": 9.99,
+            "status": "paid",
+            "customer": {
+                "name": "Jeffery",
+                "email": "jeffery@example.com",
+                "address": {"city": "Austin", "zip": "78701", "street": "1 Main St"},
+            },
+        }
+    }
+
+
+def _as_objects(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _Object(**{key: _as_objects(item) for key, item in value.items()})
+    return value
+
+
+ORDER_INPUTS: Dict[str, Callable[[], Any]] = {
+    "dict": _order_dict,
+    "object": lambda: _as_objects(_order_dict()),
+    "pydantic": lambda: {"order": _Order.model_validate(_order_dict()["order"])},
+}
+
+
+def _order_template() -> Template:
+    return Template(
+        variables=[
+            Variable(key=f"v{index}", path=path)
+            for index, path in enumerate(ORDER_PATHS)
+        ],
+        text=" | ".join(f"{{v{index}}}" for index in range(len(ORDER_PATHS))),
+    )
+
+
+# -- scenarios --------------------------------------------------------------
+
+
+def _load_scenarios() -> Iterator[Scenario]:
+    loaders = {"json": (load_json_template, lambda data: json.dumps(data).encode())}
+    loaders["yaml"] = (load_yaml_template, _yaml)
+    for kind, (load, dump) in loaders.items():
+        for count in (1, 10_000):
+
+            def setup(load=load, dump=dump, count=count) -> Callable[[], Any]:
+                sources = [dump(_template_dict(index)) for index in range(count)]
+                return lambda: [load(io.BytesIO(source)) for source in sources]
+
+            yield Scenario(f"load/{kind}/templates={count}", setup, retained=count > 1)
+
+
+def _render_scenarios() -> Iterator[Scenario]:
+    for count in (1, 10, 50):
+
+        def setup(count=count) -> Callable[[], Any]:
+            template = Template(
+                variables=[Variable(key=f"v{index}") for index in range(count)],
+                text=" ".join(f"{{v{index}}}" for index in range(count)),
+            )
+            data = {f"v{index}": index for index in range(count)}
+            return lambda: template.format(data)
+
+        yield Scenario(f"render/variables={count}", setup)
+
+    for depth in (1, 4, 8):
+
+        def setup(depth=depth) -> Callable[[], Any]:
+            template = Template(
+                variables=[Variable(key="value", path=["level"] * depth)],
+                text="{value}",
+            )
+            data = _nested(depth + 1, "leaf")
+            return lambda: template.format(data)
+
+        yield Scenario(f"render/path_depth={depth}", setup)
+
+    for size in (10, 1_000, 100_000):
+
+        def setup(size=size) -> Callable[[], Any]:
+            template = Template(
+                variables=[Variable(key="items", formatter=ListFormatter(", "))],
+                text="Items: {items}",
+            )
+            data = {"items": [f"item {index}" for index in range(size)]}
+            return lambda: template.format(data)
+
+        yield Scenario(f"render/list_size={size}", setup)
+
+    for kind, build in ORDER_INPUTS.items():
+        for compiled in (False, True):
+
+            def setup(build=build, compiled=compiled) -> Callable[[], Any]:
+                template = _order_template()
+                if compiled:
+                    template.compile()
+                data = build()
+                return lambda: template.format(data)
+
+            mode = "compiled" if compiled else "interpreted"
+            yield Scenario(f"render/input={kind}/{mode}", setup)
+
+
+def _batch_scenarios() -> Iterator[Scenario]:
+    for compiled in (False, True):
+
+        def setup(compiled=compiled) -> Callable[[], Any]:
+            template = _order_template()
+            if compiled:
+                template.compile()
+            records = [_order_dict() for _ in range(10_000)]
+            for index, record in enumerate(records):
+                record["order"]["id"] = index
+            return lambda: deque(template.format_many(records), maxlen=0)
+
+        mode = "compiled" if compiled else "interpreted"
+        yield Scenario(f"batch/format_many/records=10000/{mode}", setup)
+
+
+def scenarios() -> List[Scenario]:
+    """*Every scenario of the suite in a stable order.*"""
+    return [*_load_scenarios(), *_render_scenarios(), *_batch_scenarios()]
+
+
+# -- measuring --------------------------------------------------------------
+
+
+def measure(scenario: Scenario, repeat: int = 5) -> Result:
+    """*Times the op of scenario, calibrated to run about 0.2 seconds per timing run, then traces the memory of one more call.*
+
+    **Args**
+    - **scenario (Scenario)**: scenario to measure.
+    - **repeat (int)**: number of timing runs, the best one is reported. defaults to: `5`
+
+    **Returns**
+    - **(Result)**: ops/sec, peak bytes allocated by one op and bytes retained by its result.
+    """
+    op = scenario.setup()
+    op()  # warm up caches specialized on first use.
+    timer = timeit.Timer(op)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = op()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return Result(
+        ops=number / best,
+        peak_bytes=peak,
+        retained_bytes=current if scenario.retained else None,
+    )
+
+
+def run(pattern: Optional[str] = None, repeat: int = 5) -> Dict[str, Any]:
+    """*Measures every scenario whose name contains pattern and prints each result as it finishes.*
+
+    **Args**
+    - **pattern (str, None)**: only scenarios with this in their name are run, all when None. defaults to: `None`
+    - **repeat (int)**: number of timing runs per scenario. defaults to: `5`
+
+    **Returns**
+    - **(dict)**: the environment the suite ran in and the results keyed by scenario name, the format stored as the baseline.
+    """
+    results: Dict[str, Any] = {}
+    for scenario in scenarios():
+        if pattern is not None and pattern not in scenario.name:
+            continue
+        result = measure(scenario, repeat)
+        results[scenario.name] = result._asdict()
+        retained = (
+            ""
+            if result.retained_bytes is None
+            else f"  retained {result.retained_bytes:>14,} B"
+        )
+        print(
+            f"{scenario.name:<45} {result.ops:>14,.1f} ops/s"
+            f"  peak {result.peak_bytes:>14,} B{retained}",
+            flush=True,
+        )
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "templatr": templatr.__version__,
+        },
+        "results": results,
+    }
+
+
+@dataclass
+class Change:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Change]:
+    """*Compares the results of two runs scenario by scenario.*
+
+    A scenario regressed when its ops/sec dropped, or its peak or retained memory grew by more than `MEMORY_SLACK` bytes, by more than threshold relative to the baseline. Scenarios missing from either run are skipped.
+
+    **Args**
+    - **baseline (dict)**: results of the reference run, as returned by `run`.
+    - **current (dict)**: results of the run being checked.
+    - **threshold (float)**: allowed relative change, e.g. `0.15` for 15%.
+
+    **Returns**
+    - **(list[Change])**: the change of every metric of every scenario in both runs.
+    """
+    changes = []
+    for name, before in baseline["results"].items():
+        after = current["results"].get(name)
+        if after is None:
+            continue
+        changes.append(
+            Change(
+                name,
+                "ops",
+                before["ops"],
+                after["ops"],
+                after["ops"] < before["ops"] * (1 - threshold),
+            )
+        )
+        for metric in ("peak_bytes", "retained_bytes"):
+            if before.get(metric) is None or after.get(metric) is None:
+                continue
+            changes.append(
+                Change(
+                    name,
+                    metric,
+                    before[metric],
+                    after[metric],
+                    after[metric] > before[metric] * (1 + threshold)
+                    and after[metric] - before[metric] > MEMORY_SLACK,
+                )
+            )
+    return changes
+
+
+def _read(path: str) -> Dict[str, Any]:
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description=__doc__.splitlines()[0]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="measure the scenarios")
+    run_parser.add_argument("--output", help="write the results as json to this file")
+    run_parser.add_argument("--filter", help="only run scenarios containing this")
+    run_parser.add_argument("--repeat", type=int, default=5)
+
+    compare_parser = commands.add_parser(
+        "compare", help="measure the scenarios and compare them with a baseline"
+    )
+    compare_parser.add_argument("--baseline", default=BASELINE_PATH)
+    compare_parser.add_argument(
+        "--current", help="compare these stored results instead of measuring"
+    )
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+    compare_parser.add_argument("--filter", help="only run scenarios containing this")
+    compare_parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        results = run(args.filter, args.repeat)
+        if args.output:
+            with open(args.output, "w") as fp:
+                json.dump(results, fp, indent=2, sort_keys=True)
+                fp.write("\n")
+        return 0
+
+    baseline = _read(args.baseline)
+    current = _read(args.current) if args.current else run(args.filter, args.repeat)
+    if current["environment"] != baseline["environment"]:
+        print(
+            f"warning: baseline ran on {baseline['environment']}, "
+            f"compared with {current['environment']}"
+        )
+    changes = compare(baseline, current, args.threshold)
+    print(f"\n{'scenario':<45} {'metric':<15} {'baseline':>16} {'current':>16}  change")
+    for change in changes:
+        flag = "  REGRESSED" if change.regressed else ""
+        print(
+            f"{change.name:<45} {change.metric:<15} {change.baseline:>16,.1f}"
+            f" {change.current:>16,.1f}  x{change.ratio:.2f}{flag}"
+        )
+    regressions = [change for change in changes if change.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) past {args.threshold:.0%}")
+        return 1
+    print(f"\nno regressions past {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,37 @@
 __version__ = "0.0.0"
 
-from .exceptions import TemplatrException
-from .formatter import VariableFormatter, load_formatter
-from .template import load_json_template, load_yaml_template, Template
-from .variable import Variable
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .exceptions import TemplatrException
+    from .formatter import VariableFormatter, load_formatter
+    from .template import load_json_template, load_yaml_template, Template
+    from .registry import TemplateRegistry
+    from .templateset import TemplateSet
+    from .variable import Variable
+
+# modules are imported on first access of their names, so `import templatr` stays cheap for processes that only render a few templates. pydantic and PyYAML are only imported once a template is loaded from a definition.
+_EXPORTS = {
+    "TemplatrException": "exceptions",
+    "VariableFormatter": "formatter",
+    "load_formatter": "formatter",
+    "load_json_template": "template",
+    "load_yaml_template": "template",
+    "Template": "template",
+    "TemplateRegistry": "registry",
+    "TemplateSet": "templateset",
+    "Variable": "variable",
+}
+
+_MODULES = (
+    "exceptions",
+    "formatter",
+    "registry",
+    "template",
+    "templateset",
+    "variable",
+)
 
 __all__ = [
     "TemplatrException",
@@ -12,9 +40,29 @@ __all__ = [
     "load_json_template",
     "load_yaml_template",
     "Template",
+    "TemplateRegistry",
+    "TemplateSet",
     "Variable",
     "exceptions",
     "formatter",
+    "registry",
     "template",
+    "templateset",
     "variable",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _MODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cached on the module so __getattr__ only runs on first access.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
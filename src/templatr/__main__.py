@@ -0,0 +1,5 @@
+import sys
+
+from templatr.cli import main
+
+sys.exit(main())
@@ -0,0 +1,244 @@
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from templatr.helpers import build_function
+
+_UNSET = object()
+
+# shapes of data a single chain specializes for before it stops specializing.
+MAX_SHAPES = 8
+
+Accessor = Callable[[Any], Any]
+
+
+def _mapping_accessor(section: str) -> Accessor:
+    def access(value: Mapping) -> Any:
+        try:
+            return value[section]
+        except KeyError:
+            return _UNSET
+
+    return access
+
+
+def _namedtuple_index(cls: type, section: str) -> Optional[int]:
+    fields = getattr(cls, "_fields", None)
+    if issubclass(cls, tuple) and isinstance(fields, tuple) and section in fields:
+        return fields.index(section)
+    return None
+
+
+def _build_accessor(cls: type, section: str) -> Accessor:
+    if issubclass(cls, dict):
+        return lambda value: value.get(section, _UNSET)
+    if issubclass(cls, Mapping):
+        return _mapping_accessor(section)
+    index = _namedtuple_index(cls, section)
+    if index is not None:
+        return lambda value: value[index]
+    # dataclasses, pydantic models, __slots__ and plain objects all read by attribute.
+    return lambda value: getattr(value, section, _UNSET)
+
+
+_ACCESSORS: Dict[Tuple[type, str], Accessor] = {}
+
+
+def accessor_for(cls: type, section: str) -> Accessor:
+    """*Returns the function that reads `section` from values of type `cls`, built once per type and section.*
+
+    Dicts read with `get`, other mappings by key, namedtuples by field position and every other object by attribute. Each accessor returns `_UNSET` instead of raising when the section is missing.
+
+    **Args**
+    - **cls (type)**: concrete type of the value we are reading from.
+    - **section (str)**: the key or attribute we are reading.
+
+    **Returns**
+    - **(Callable[[Any], Any])**: accessor that takes the value and returns what is stored under section.
+    """
+    accessor = _ACCESSORS.get((cls, section))
+    if accessor is None:
+        accessor = _ACCESSORS[(cls, section)] = _build_accessor(cls, section)
+    return accessor
+
+
+def access(value: Any, section: str) -> Any:
+    """*Reads section from value using the accessor for the type of value.*
+
+    **Args**
+    - **value (Any)**: The value we are reading from.
+    - **section (str)**: The key or attribute to read.
+
+    **Returns**
+    - **(_UNSET)**: Singleton representing no value being found.
+    - **(Any)**: the value stored under section.
+    """
+    return accessor_for(value.__class__, section)(value)
+
+
+def resolve_path(data: Any, path: Sequence[str]) -> Any:
+    """*Resolves the value at the end of path, dispatching on the type of the value at every step.*
+
+    **Args**
+    - **data (Any)**: The data that will be checked for the path.
+    - **path (list[str])**: The path parts to look into on the object.
+
+    **Returns**
+    - **(_UNSET)**: Singleton of class representing no value being able to parsed.
+    - **(Any)**: Value that we resolved from data.
+    """
+    value = data
+    for section in path:
+        value = accessor_for(value.__class__, section)(value)
+        if value is _UNSET:
+            return _UNSET
+    return value
+
+
+def _shape_of(data: Any, path: Sequence[str]) -> Tuple[type, ...]:
+    """*Types of the values walked through while resolving path, up to where the path ends or a section was missing.*"""
+    shape = []
+    value = data
+    for section in path:
+        shape.append(value.__class__)
+        value = access(value, section)
+        if value is _UNSET:
+            break
+    return tuple(shape)
+
+
+def _specialize(
+    path: Tuple[str, ...], shape: Tuple[type, ...], miss: Accessor
+) -> Accessor:
+    """*Generates a resolver for data of the given shape. Every step checks the type it was specialized for and hands the data to miss when it doesn't match.*"""
+    names: Dict[str, Any] = {"_UNSET": _UNSET, "miss": miss}
+    lines: List[str] = ["value = data"]
+    for index, cls in enumerate(shape):
+        section = names[f"S{index}"] = path[index]
+        names[f"T{index}"] = cls
+        lines.append(f"if value.__class__ is not T{index}:")
+        lines.append("    return miss(data)")
+        tuple_index = _namedtuple_index(cls, section)
+        if issubclass(cls, dict):
+            lines.append(f"value = value.get(S{index}, _UNSET)")
+        elif issubclass(cls, Mapping):
+            names[f"A{index}"] = _mapping_accessor(section)
+            lines.append(f"value = A{index}(value)")
+        elif tuple_index is not None:
+            names[f"I{index}"] = tuple_index
+            lines.append(f"value = value[I{index}]")
+        else:
+            lines.append(f"value = getattr(value, S{index}, _UNSET)")
+        if index < len(path) - 1:
+            lines.append("if value is _UNSET:")
+            lines.append("    return _UNSET")
+    if len(shape) < len(path):
+        # specialized on data that was missing part of the path, anything reaching further is a new shape.
+        lines.append("return miss(data)")
+    else:
+        lines.append("return value")
+    return build_function("data", lines, names)
+
+
+class AccessorChain:
+    """*Resolves a path through data using resolvers specialized to the concrete types seen along the path. Data with the same shape as a previous call skips the type dispatch and runs the accessors for those types directly.*
+
+    Chains stop specializing once they have seen `MAX_SHAPES` different shapes and dispatch on type at every step from then on.
+
+    **Args**
+    - **path (Sequence[str])**: The path parts to look into on the data.
+    """
+
+    __slots__ = ("path", "resolve", "_resolvers")
+
+    path: Tuple[str, ...]
+    resolve: Accessor
+    _resolvers: Dict[Tuple[type, ...], Accessor]
+
+    def __init__(self, path: Sequence[str]) -> None:
+        self.path = tuple(path)
+        self._resolvers = {}
+        # first call specializes the chain for the data it is given.
+        self.resolve = self._miss
+
+    def _miss(self, data: Any) -> Any:
+        """*Switches resolve over to the resolver for the shape of data, specializing one if it hasn't been seen yet.*"""
+        shape = _shape_of(data, self.path)
+        resolver = self._resolvers.get(shape)
+        if resolver is None:
+            if len(self._resolvers) >= MAX_SHAPES:
+                resolver = self._generic
+            else:
+                resolver = _specialize(self.path, shape, self._miss)
+                self._resolvers[shape] = resolver
+        self.resolve = resolver
+        return resolver(data)
+
+    def _generic(self, data: Any) -> Any:
+        return resolve_path(data, self.path)
+
+
+def walk_paths(
+    paths: Sequence[Sequence[str]], name: Callable[[str, Any], str]
+) -> Tuple[List[str], List[str]]:
+    """*Generates the lines that resolve every path through `data`, paths with the same leading sections share the locals holding them so each shared prefix is read once.*
+
+    Plain dicts are read inline, everything else through the accessor for its type. A local is `_UNSET` once any section up to it is missing.
+
+    **Args**
+    - **paths (Sequence[Sequence[str]])**: The paths to resolve.
+    - **name (Callable[[str, Any], str])**: binds a value the lines reference to a new name and returns that name, `_UNSET` and `_access` must already be bound.
+
+    **Returns**
+    - **(tuple[list[str], list[str]])**: the lines, and the local holding the value of each path in the same order as paths.
+    """
+    lines: List[str] = []
+    locals_by_prefix: Dict[Tuple[str, ...], str] = {}
+    results: List[str] = []
+    for path in paths:
+        parent = "data"
+        for end in range(1, len(path) + 1):
+            prefix = tuple(path[:end])
+            local = locals_by_prefix.get(prefix)
+            if local is None:
+                local = locals_by_prefix[prefix] = f"n{len(locals_by_prefix)}"
+                section = name("P", path[end - 1])
+                read = (
+                    f"{parent}.get({section}, _UNSET) if {parent}.__class__ is dict "
+                    f"else _access({parent}, {section})"
+                )
+                if end == 1:
+                    lines.append(f"{local} = {read}")
+                else:
+                    lines.append(
+                        f"{local} = _UNSET if {parent} is _UNSET else ({read})"
+                    )
+            parent = local
+        results.append(parent)
+    return lines, results
+
+
+class PathTrie:
+    """*Resolves a group of paths through the same data in one call. Paths are merged on their leading sections, so a prefix shared by several paths, e.g. `order.customer` in `order.customer.name` and `order.customer.address.city`, is read from the data once per call.*
+
+    **Args**
+    - **paths (Sequence[Sequence[str]])**: The paths to resolve.
+    """
+
+    __slots__ = ("paths", "resolve")
+
+    paths: Tuple[Tuple[str, ...], ...]
+    resolve: Callable[[Any], Tuple[Any, ...]]
+
+    def __init__(self, paths: Sequence[Sequence[str]]) -> None:
+        self.paths = tuple(tuple(path) for path in paths)
+        names: Dict[str, Any] = {"_UNSET": _UNSET, "_access": access}
+
+        def name(prefix: str, value: Any) -> str:
+            bound = f"{prefix}{len(names)}"
+            names[bound] = value
+            return bound
+
+        lines, results = walk_paths(self.paths, name)
+        lines.append(f"return ({''.join(f'{result}, ' for result in results)})")
+        # returns the value of each path, or `_UNSET` when it is missing, in the order of paths.
+        self.resolve = build_function("data", lines, names)
@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING, List, NamedTuple, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from templatr.template import Template
+    from templatr.variable import Variable
+
+
+class TemplateAnalysis(NamedTuple):
+    """*What a template reads, worked out from its text and variables without rendering it.*
+
+    **Args**
+    - **tokenized (bool)**: False when the text could only be checked by `str.format`, in that case every variable is treated as used.
+    - **fields (list[str])**: keys the text references, in order of first appearance.
+    - **unused_variables (list[str])**: keys of variables the text never references, these are skipped when rendering.
+    - **undeclared_fields (list[str])**: keys the text references that no variable defines, rendering raises KeyError for these.
+    - **read_paths (list[str])**: dotted paths read from the data by the variables that are used.
+    """
+
+    tokenized: bool
+    fields: List[str]
+    unused_variables: List[str]
+    undeclared_fields: List[str]
+    read_paths: List[str]
+
+
+def used_variables(template: "Template") -> List["Variable"]:
+    """*Variables of the template that its text references, in the order they are defined.*
+
+    **Args**
+    - **template (Template)**: template to check.
+
+    **Returns**
+    - **(list[Variable])**: the referenced variables, every variable when the text could not be tokenized.
+    """
+    keys = _field_keys(template)
+    if keys is None:
+        return list(template.variables)
+    return [variable for variable in template.variables if variable.key in keys]
+
+
+def analyze_template(template: "Template") -> TemplateAnalysis:
+    """*Works out the fields, unused variables, undeclared fields and data paths of a template.*
+
+    **Args**
+    - **template (Template)**: template to analyze.
+
+    **Returns**
+    - **(TemplateAnalysis)**: the analysis.
+    """
+    keys = _field_keys(template)
+    declared = {variable.key for variable in template.variables}
+    fields = [] if keys is None else keys
+    read_paths: List[str] = []
+    for variable in used_variables(template):
+        path = ".".join(variable.path or [variable.key])
+        if path not in read_paths:
+            read_paths.append(path)
+    return TemplateAnalysis(
+        tokenized=keys is not None,
+        fields=fields,
+        unused_variables=[
+            variable.key
+            for variable in template.variables
+            if keys is not None and variable.key not in keys
+        ],
+        undeclared_fields=[key for key in fields if key not in declared],
+        read_paths=read_paths,
+    )
+
+
+def _field_keys(template: "Template") -> Optional[List[str]]:
+    parsed = template._parsed
+    if parsed.segments is None:
+        return None
+    return list(dict.fromkeys(field.key for field in parsed.fields))
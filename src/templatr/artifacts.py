@@ -0,0 +1,206 @@
+from typing import Optional, Tuple, Union
+import hashlib
+import marshal
+import os
+
+from templatr import __version__
+from templatr.exceptions import StaleArtifact, UnserializableVariable
+from templatr.registry import _parse
+from templatr.template import Template
+from templatr.variable import Variable, _load_formatter
+
+# first bytes of every artifact, so other files are rejected before unmarshalling them.
+MAGIC = b"TPLC"
+# bumped whenever the layout of the payload changes.
+FORMAT = 1
+# extension added to the source path for the artifact path.
+SUFFIX = ".tplc"
+
+
+def source_hash(content: Union[str, bytes]) -> str:
+    """*Hash of the content of a template source, artifacts are only used for the exact content they were built from.*
+
+    **Args**
+    - **content (str, bytes)**: content of the source.
+
+    **Returns**
+    - **(str)**: sha256 hex digest of the content.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def artifact_path(source: str) -> str:
+    """*Default path of the artifact of a template source, next to it.*
+
+    **Args**
+    - **source (str)**: path of the template source.
+
+    **Returns**
+    - **(str)**: path of the artifact.
+    """
+    return source + SUFFIX
+
+
+def _key() -> Tuple[int, int, str]:
+    """*What an artifact has to have been built with to be loaded here.*"""
+    return FORMAT, marshal.version, __version__
+
+
+def dump_artifact(template: Template, content_hash: str, path: str) -> None:
+    """*Writes a loaded template to an artifact that `load_artifact` reads back without parsing or validating it. Formatters are stored by their definition, their class by name or dotted path.*
+
+    **Args**
+    - **template (Template)**: template to write.
+    - **content_hash (str)**: `source_hash` of the source the template was loaded from.
+    - **path (str)**: path the artifact is written to, replaced atomically.
+
+    ***Raises***
+    - **UnserializableVariable**: When the default or formatter arguments of a variable are not made of plain python values, e.g. str, int, list or dict.
+    """
+    variables = []
+    for variable in template.variables:
+        definition = variable.formatter.definition()
+        variables.append(
+            (
+                variable.key,
+                variable.path,
+                variable.default,
+                definition["cls"],
+                definition["args"],
+                definition["kwargs"],
+                definition.get("cache", False),
+            )
+        )
+    try:
+        payload = marshal.dumps((_key(), content_hash, template.text, tuple(variables)))
+    except ValueError:
+        for key, _, default, *formatter in variables:
+            for part, value in (("default", default), ("formatter", formatter)):
+                try:
+                    marshal.dumps(value)
+                except ValueError:
+                    raise UnserializableVariable(key, part)
+        raise
+
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as fp:
+            fp.write(MAGIC)
+            fp.write(payload)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def load_artifact(
+    path: str, content_hash: Optional[str] = None, intern: bool = False
+) -> Template:
+    """*Reads a template written by `dump_artifact`, only formatters are loaded, the definition is not parsed or validated again.*
+
+    Artifacts can load any formatter class by name, only load artifacts you built.
+
+    **Args**
+    - **path (str)**: path of the artifact.
+    - **content_hash (str, None)**: `source_hash` of the current source, the artifact is rejected when it was built from other content. Not checked when None. defaults to: `None`
+    - **intern (bool)**: When True, variables share one formatter instance per formatter definition, see `load_formatter`. defaults to: `False`
+
+    ***Raises***
+    - **FileNotFoundError**: When there is no artifact at path.
+    - **StaleArtifact**: When the artifact was built from other content or by another version of templatr, or is not an artifact.
+
+    **Returns**
+    - **(Template)**: the template.
+    """
+    with open(path, "rb") as fp:
+        content = fp.read()
+    if not content.startswith(MAGIC):
+        raise StaleArtifact(path, "not a template artifact")
+    try:
+        key, built_hash, text, variables = marshal.loads(content[len(MAGIC) :])
+        stale = tuple(key) != _key()
+    except (EOFError, ValueError, TypeError):
+        raise StaleArtifact(path, "artifact is corrupt")
+    if stale:
+        raise StaleArtifact(path, "built by another version of templatr")
+    if content_hash is not None and built_hash != content_hash:
+        raise StaleArtifact(path, "source changed since the artifact was built")
+
+    return Template(
+        [
+            Variable(
+                key,
+                path=variable_path,
+                default=default,
+                formatter=_load_formatter(cls_name, args, kwargs, cache, intern),
+            )
+            for (
+                key,
+                variable_path,
+                default,
+                cls_name,
+                args,
+                kwargs,
+                cache,
+            ) in variables
+        ],
+        text,
+    )
+
+
+def compile_source(
+    source: str, output: Optional[str] = None, strict: bool = False
+) -> str:
+    """*Loads a yaml or json template file and writes its artifact, e.g. at build time so workers start without parsing or validating templates.*
+
+    **Args**
+    - **source (str)**: path of the template file, `.json` files are parsed as json and everything else as yaml.
+    - **output (str, None)**: path the artifact is written to. defaults to: `artifact_path(source)`
+    - **strict (bool)**: When True, checks every field of the text has a variable. defaults to: `False`
+
+    ***Raises***
+    - **UndeclaredFields**: When strict and the text references keys that no variable defines.
+
+    **Returns**
+    - **(str)**: path of the artifact written.
+    """
+    with open(source, "rb") as fp:
+        content = fp.read()
+    output = output or artifact_path(source)
+    dump_artifact(_parse(source, content, strict), source_hash(content), output)
+    return output
+
+
+def load_template_file(
+    source: str,
+    artifact: Optional[str] = None,
+    strict: bool = False,
+    intern: bool = False,
+) -> Template:
+    """*Loads a yaml or json template file from its artifact when it was built from the current content by this version of templatr, otherwise parses and validates the file.*
+
+    **Args**
+    - **source (str)**: path of the template file, `.json` files are parsed as json and everything else as yaml.
+    - **artifact (str, None)**: path of the artifact. defaults to: `artifact_path(source)`
+    - **strict (bool)**: When True, checks every field of the text has a variable. defaults to: `False`
+    - **intern (bool)**: When True, variables share one formatter instance per formatter definition, see `load_formatter`. defaults to: `False`
+
+    ***Raises***
+    - **UndeclaredFields**: When strict and the text references keys that no variable defines.
+
+    **Returns**
+    - **(Template)**: the template.
+    """
+    with open(source, "rb") as fp:
+        content = fp.read()
+    try:
+        template = load_artifact(
+            artifact or artifact_path(source), source_hash(content), intern
+        )
+    except (FileNotFoundError, StaleArtifact):
+        return _parse(source, content, strict, intern)
+    if strict:
+        template.check()
+    return template
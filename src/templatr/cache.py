@@ -0,0 +1,165 @@
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Sequence, Tuple
+import sys
+import threading
+
+# types whose equal values always format the same.
+_EXACT_TYPES = frozenset((str, int, bool, bytes, type(None)))
+
+
+def _exact_key(value: Any) -> Hashable:
+    """*Key of a value that only equals the key of values that format identically. `1`, `1.0` and `True`, `0.0` and `-0.0`, `Decimal("1.5")` and `Decimal("1.50")` compare equal but are all kept apart.*
+
+    ***Raises***
+    - **TypeError**: When value is not a str, int, bool, bytes, None, float, Decimal, Enum member or a tuple of those, the values whose formatting is known to follow from their key.
+    """
+    cls = value.__class__
+    if cls in _EXACT_TYPES:
+        return cls, value
+    if cls is float:
+        # 0.0 and -0.0 are the only equal floats that print differently.
+        return (cls, value) if value else (cls, repr(value))
+    if cls is tuple:
+        return cls, tuple(map(_exact_key, value))
+    # decimal is only imported by the application, values can't be Decimals before it is.
+    decimal = sys.modules.get("decimal")
+    if decimal is not None and cls is decimal.Decimal:
+        # keeps the exponent, 1.5 and 1.50 format differently.
+        return cls, str(value)
+    if isinstance(value, Enum):
+        # members only equal themselves.
+        return cls, value
+    raise TypeError(f"{cls.__name__} values are not cached")
+
+
+def _sizeof(value: Any) -> int:
+    """*Memory used by a key built from formatted values, the classes it refers to are shared and not counted.*"""
+    if isinstance(value, type):
+        return 0
+    size = sys.getsizeof(value)
+    if value.__class__ is tuple:
+        size += sum(map(_sizeof, value))
+    return size
+
+
+class OutputCacheStats(NamedTuple):
+    """*Snapshot of how an OutputCache has been used.*
+
+    **Args**
+    - **hits (int)**: renders served from the cache.
+    - **misses (int)**: renders that built the output and cached it.
+    - **bypassed (int)**: renders that skipped the cache because a formatted value is not of a type that is cached.
+    - **evictions (int)**: outputs dropped to stay within the configured bounds.
+    - **size (int)**: outputs currently cached.
+    - **size_bytes (int)**: memory used by the outputs currently cached and the values they are keyed by.
+    """
+
+    hits: int
+    misses: int
+    bypassed: int
+    evictions: int
+    size: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """*Share of cacheable renders served from the cache, 0 before anything was rendered.*"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class OutputCache:
+    """*Least recently used cache of rendered output keyed by the formatted values of a template, so records that format to the same values skip building the string.*
+
+    Only renders whose values all format the same whenever they are equal are cached, str, int, bool, bytes, None, float, Decimal, Enum members and tuples of those. Equal values that print differently, e.g. `1` and `1.0`, `0.0` and `-0.0` or `Decimal("1.5")` and `Decimal("1.50")`, render apart. Renders with other values are never cached. Shared between threads safely.
+
+    **Args**
+    - **max_entries (int)**: most outputs kept. defaults to: `1024`
+    - **max_bytes (int, None)**: most memory used by the outputs kept and the values they are keyed by, unbounded when None. defaults to: `None`
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: Optional[int] = None
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._outputs: "OrderedDict[Hashable, Tuple[str, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._bypassed = self._evictions = 0
+
+    @property
+    def stats(self) -> OutputCacheStats:
+        """*Snapshot of the hit, miss, bypass and eviction counters.*"""
+        with self._lock:
+            return OutputCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                bypassed=self._bypassed,
+                evictions=self._evictions,
+                size=len(self._outputs),
+                size_bytes=self._bytes,
+            )
+
+    def clear(self) -> None:
+        """*Drops every cached output, counters are kept.*"""
+        with self._lock:
+            self._outputs.clear()
+            self._bytes = 0
+
+    def render(
+        self,
+        keys: Sequence[str],
+        values: Tuple[Any, ...],
+        render: Callable[[Dict[str, Any]], str],
+    ) -> str:
+        """*Returns the output cached for values, rendering and caching it when there is none.*
+
+        **Args**
+        - **keys (Sequence[str])**: template key of each value.
+        - **values (tuple[Any, ...])**: formatted values in the same order as keys.
+        - **render (Callable[[dict[str, Any]], str])**: renders the output from the values keyed by template key.
+
+        **Returns**
+        - **(str)**: the rendered output.
+        """
+        types = tuple(map(type, values))
+        try:
+            if _EXACT_TYPES.issuperset(types):
+                key = (types, values)
+            else:
+                key = (types, tuple(map(_exact_key, values)))
+            with self._lock:
+                output = self._outputs[key][0]
+                self._outputs.move_to_end(key)
+                self._hits += 1
+            return output
+        except KeyError:
+            pass
+        except TypeError:
+            with self._lock:
+                self._bypassed += 1
+            return render(dict(zip(keys, values)))
+
+        output = render(dict(zip(keys, values)))
+        size = sys.getsizeof(output) + _sizeof(key)
+        with self._lock:
+            self._misses += 1
+            if self.max_bytes is not None and size > self.max_bytes:
+                # would evict everything else and still not fit.
+                return output
+            previous = self._outputs.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._outputs[key] = (output, size)
+            self._bytes += size
+            while len(self._outputs) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, evicted) = self._outputs.popitem(last=False)
+                self._bytes -= evicted
+                self._evictions += 1
+        return output
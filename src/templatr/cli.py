@@ -0,0 +1,371 @@
+from itertools import islice
+from time import perf_counter
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import json
+import os
+import sys
+
+from templatr.exceptions import TemplatrException
+
+
+def _positive_int(value: str) -> int:
+    """*Argument type of counts that have to be at least 1.*"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _template_files(sources: Sequence[str]) -> Iterator[Tuple[str, str]]:
+    """*Template files of the sources given, with the path relative to the directory given they were found in.*"""
+    from templatr.registry import EXTENSIONS
+
+    for source in sources:
+        if not os.path.isdir(source):
+            yield source, os.path.basename(source)
+            continue
+        for directory, _, files in os.walk(source):
+            for file in sorted(files):
+                if os.path.splitext(file)[1] in EXTENSIONS:
+                    path = os.path.join(directory, file)
+                    yield path, os.path.relpath(path, source)
+
+
+def _compile(args: argparse.Namespace) -> int:
+    from templatr.artifacts import SUFFIX, artifact_path, compile_source
+
+    for source, relative in _template_files(args.sources):
+        if args.output_dir is None:
+            output = artifact_path(source)
+        else:
+            output = os.path.join(args.output_dir, relative + SUFFIX)
+            os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        print(compile_source(source, output, strict=args.strict))
+    return 0
+
+
+class _Checkpoint:
+    """*Progress of a render job saved every few records, so running the same job again picks up after the last record saved.*"""
+
+    def __init__(self, path: str, job: Dict[str, Any]) -> None:
+        self.path = path
+        self.job = job
+
+    def load(self) -> Dict[str, Any]:
+        """*Progress saved by an earlier run of the job, none when there was no earlier run.*"""
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                saved = json.load(fp)
+        except FileNotFoundError:
+            return {"records": 0, "errors": 0, "offset": None}
+        if saved.get("job") != self.job:
+            raise ValueError(f"checkpoint {self.path} was saved by another job")
+        return saved
+
+    def save(self, records: int, errors: int, offset: Optional[int]) -> None:
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as fp:
+            json.dump(
+                {
+                    "job": self.job,
+                    "records": records,
+                    "errors": errors,
+                    "offset": offset,
+                },
+                fp,
+            )
+        os.replace(temporary, self.path)
+
+
+class _StreamOutput:
+    """*Writes outputs one after the other to stdout or a file, as text followed by a separator or as jsonl.*"""
+
+    def __init__(
+        self, path: str, jsonl: bool, separator: str, offset: Optional[int]
+    ) -> None:
+        self.jsonl = jsonl
+        self.separator = separator.encode("utf-8")
+        if path == "-":
+            self.fp: IO[bytes] = sys.stdout.buffer
+            self.file = False
+            return
+        self.file = True
+        if offset is None or not os.path.exists(path):
+            self.fp = open(path, "wb")
+        else:
+            # drop whatever was written after the last checkpoint.
+            self.fp = open(path, "r+b")
+            self.fp.truncate(offset)
+            self.fp.seek(offset)
+
+    def write(self, index: int, output: Any) -> None:
+        if self.jsonl:
+            if isinstance(output, Exception):
+                line = {"index": index, "error": str(output)}
+            else:
+                line = {"index": index, "output": output}
+            self.fp.write(json.dumps(line, ensure_ascii=False).encode("utf-8") + b"\n")
+        elif not isinstance(output, Exception):
+            self.fp.write(output.encode("utf-8") + self.separator)
+
+    def flush(self) -> Optional[int]:
+        """*Flushes the outputs written to disk and returns the size of the file, None for stdout.*"""
+        self.fp.flush()
+        if not self.file:
+            return None
+        os.fsync(self.fp.fileno())
+        return self.fp.tell()
+
+    def close(self) -> None:
+        if self.file:
+            self.fp.close()
+
+
+class _FilesOutput:
+    """*Writes each output to its own file in a directory, named by the index of its record.*"""
+
+    def __init__(self, directory: str, name: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.name = name
+
+    def write(self, index: int, output: Any) -> None:
+        if isinstance(output, Exception):
+            return
+        path = os.path.join(self.directory, self.name.format(index=index))
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write(output)
+
+    def flush(self) -> Optional[int]:
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+def _render(args: argparse.Namespace) -> int:
+    from templatr.artifacts import load_template_file
+    from templatr.parallel import format_jsonl_parallel
+    from templatr.records import input_format, read_records, record_fields
+
+    template = load_template_file(args.template, strict=args.strict)
+    checkpoint = None
+    progress: Dict[str, Any] = {"records": 0, "errors": 0, "offset": None}
+    if args.checkpoint is not None:
+        checkpoint = _Checkpoint(
+            args.checkpoint,
+            {
+                "template": os.path.abspath(args.template),
+                "inputs": [
+                    path if path == "-" else os.path.abspath(path)
+                    for path in args.inputs
+                ],
+                "output": (
+                    args.output if args.output == "-" else os.path.abspath(args.output)
+                ),
+                "output_format": args.output_format,
+            },
+        )
+        try:
+            progress = checkpoint.load()
+        except ValueError as error:
+            print(f"templatr render: {error}", file=sys.stderr)
+            return 2
+
+    if args.output_format == "files":
+        output: Any = _FilesOutput(args.output, args.name)
+    else:
+        output = _StreamOutput(
+            args.output,
+            args.output_format == "jsonl",
+            args.separator,
+            progress["offset"],
+        )
+
+    start = count = progress["records"]
+    errors = progress["errors"]
+    fields = record_fields(template)
+    if (
+        args.workers > 1
+        and start == 0
+        and len(args.inputs) == 1
+        and args.inputs[0] != "-"
+        and (args.input_format or input_format(args.inputs[0])) == "jsonl"
+    ):
+        # workers read their own byte ranges of the file instead of being sent records.
+        outputs = format_jsonl_parallel(
+            template,
+            args.inputs[0],
+            args.workers,
+            args.chunk_bytes,
+            return_exceptions=True,
+        )
+    elif args.workers > 1:
+        records = islice(
+            read_records(args.inputs, args.input_format, fields), start, None
+        )
+        outputs = template.format_parallel(
+            records, args.workers, args.chunksize, return_exceptions=True
+        )
+    else:
+        records = islice(
+            read_records(args.inputs, args.input_format, fields), start, None
+        )
+        outputs = template.format_many(records, return_exceptions=True)
+
+    began = perf_counter()
+    try:
+        for rendered in outputs:
+            if isinstance(rendered, Exception):
+                errors += 1
+                if not args.quiet:
+                    print(f"record {count}: {rendered!r}", file=sys.stderr)
+            output.write(count, rendered)
+            count += 1
+            if checkpoint is not None and (count - start) % args.checkpoint_every == 0:
+                checkpoint.save(count, errors, output.flush())
+    finally:
+        offset = output.flush()
+        output.close()
+        if checkpoint is not None:
+            checkpoint.save(count, errors, offset)
+        if not args.quiet:
+            seconds = perf_counter() - began
+            print(
+                f"rendered {count - start} records with {errors} errors in {seconds:.2f}s"
+                f" ({(count - start) / seconds if seconds else 0:,.0f} records/s)"
+                + (f", resumed after record {start}" if start else ""),
+                file=sys.stderr,
+            )
+    return 1 if errors else 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="templatr")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile",
+        help="precompile template files into artifacts that load without parsing or validation",
+    )
+    compile_parser.add_argument(
+        "sources",
+        nargs="+",
+        help="yaml or json template files, or directories searched for them",
+    )
+    compile_parser.add_argument(
+        "-o",
+        "--output-dir",
+        help="directory artifacts are written to, next to each template file by default",
+    )
+    compile_parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="fail on templates referencing fields no variable defines",
+    )
+    compile_parser.set_defaults(run=_compile)
+
+    render_parser = commands.add_parser(
+        "render", help="render a template for every record of jsonl or csv inputs"
+    )
+    render_parser.add_argument(
+        "template",
+        help="yaml or json template file, loaded from its artifact when it is current",
+    )
+    render_parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help="jsonl or csv files of records, - for stdin. defaults to stdin",
+    )
+    render_parser.add_argument(
+        "--input-format",
+        choices=["jsonl", "csv"],
+        help="format of the inputs, by extension by default and jsonl for stdin",
+    )
+    render_parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="file outputs are written to, or the directory of the files output format. defaults to stdout",
+    )
+    render_parser.add_argument(
+        "--output-format",
+        choices=["text", "jsonl", "files"],
+        default="text",
+        help="text: outputs followed by --separator, jsonl: an index and output or error per line, files: a file per record. defaults to text",
+    )
+    render_parser.add_argument(
+        "--separator",
+        default="\n",
+        help="written after each output in the text output format. defaults to a newline",
+    )
+    render_parser.add_argument(
+        "--name",
+        default="{index}.txt",
+        help="name of the file of each record in the files output format. defaults to {index}.txt",
+    )
+    render_parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="worker processes rendering records, outputs stay in the order of the records. defaults to 1",
+    )
+    render_parser.add_argument(
+        "--chunksize",
+        type=_positive_int,
+        default=1000,
+        help="records sent to a worker at a time, unused when workers read a single jsonl file themselves, see --chunk-bytes. defaults to 1000",
+    )
+    render_parser.add_argument(
+        "--chunk-bytes",
+        type=_positive_int,
+        default=1 << 20,
+        help="bytes of a single jsonl input file a worker reads at a time, used in place of --chunksize for a fresh run with workers. defaults to 1048576",
+    )
+    render_parser.add_argument(
+        "--checkpoint",
+        help="file progress is saved to, running the same job again resumes after the last record saved",
+    )
+    render_parser.add_argument(
+        "--checkpoint-every",
+        type=_positive_int,
+        default=10_000,
+        help="records rendered between saves of the checkpoint. defaults to 10000",
+    )
+    render_parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="fail on a template referencing fields no variable defines",
+    )
+    render_parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="don't report failed records and throughput on stderr",
+    )
+    render_parser.set_defaults(run=_render)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """*Entry point of the `templatr` command.*
+
+    **Args**
+    - **argv (list[str], None)**: arguments after the program name. defaults to: `sys.argv[1:]`
+
+    **Returns**
+    - **(int)**: exit status, 1 when a template could not be handled or records failed to render, 2 when the checkpoint belongs to another job.
+    """
+    args = _parser().parse_args(argv)
+    run: Callable[[argparse.Namespace], int] = args.run
+    try:
+        return run(args)
+    except (TemplatrException, OSError) as error:
+        print(f"templatr {args.command}: {error}", file=sys.stderr)
+        return 1
@@ -0,0 +1,116 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+from templatr.accessors import _UNSET, access, walk_paths
+from templatr.exceptions import MissingValue
+from templatr.formatter import DefaultFormatter, VariableFormatter
+from templatr.helpers import build_function
+from templatr.parser import Field, _field_format
+
+if TYPE_CHECKING:  # pragma: no cover
+    from templatr.template import Template
+
+
+def _raise_key_error(key: str):
+    """*Raises the same error `str.format` does for a key that has no value.*"""
+    raise KeyError(key)
+
+
+class _Source:
+    """*Collects generated source lines and the closure values they reference.*"""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.names: Dict[str, Any] = {}
+
+    def name(self, prefix: str, value: Any) -> str:
+        name = f"{prefix}{len(self.names)}"
+        self.names[name] = value
+        return name
+
+    def line(self, code: str) -> None:
+        self.lines.append(code)
+
+
+def _formatter_call(formatter: VariableFormatter):
+    """*Returns the callable to inline for the formatter or None when the formatter returns values as is.*"""
+    if type(formatter) is DefaultFormatter:
+        return None
+    if type(formatter).__call__ is VariableFormatter.__call__:
+        # skip the __call__ indirection and call format directly.
+        return formatter.format
+    return formatter
+
+
+def _field_expression(source: _Source, field: Field, locals_by_key: Dict[str, str]):
+    if field.key not in locals_by_key:
+        return f"{{_raise_key_error({source.name('K', field.key)})}}"
+    expression = locals_by_key[field.key]
+    for is_attr, name in field.lookups:
+        if is_attr:
+            expression = f"getattr({expression}, {source.name('A', name)})"
+        else:
+            expression = f"{expression}[{source.name('I', name)}]"
+    return _field_format(expression, field.conversion, field.spec, source.name)
+
+
+def _generate(template: "Template") -> _Source:
+    source = _Source()
+    source.names.update(
+        _UNSET=_UNSET,
+        _access=access,
+        _MissingValue=MissingValue,
+        _raise_key_error=_raise_key_error,
+    )
+    variables = template._used_variables
+    # every path is walked first, reading shared prefixes once, then defaults and formatters run in the order of the variables.
+    walk, resolved = walk_paths(
+        [variable.path or [variable.key] for variable in variables], source.name
+    )
+    source.lines.extend(walk)
+    locals_by_key: Dict[str, str] = {}
+    for index, (variable, value) in enumerate(zip(variables, resolved)):
+        value_path = variable.path or [variable.key]
+        source.line(f"value = {value}")
+        source.line("if value is _UNSET:")
+        if variable.default is None:
+            key = source.name("K", variable.key)
+            path = source.name("P", list(value_path))
+            source.line(f"    raise _MissingValue({key}, {path})")
+        else:
+            source.line(f"    value = {source.name('D', variable.default)}")
+        formatter = _formatter_call(variable.formatter)
+        if formatter is None:
+            source.line(f"v{index} = value")
+        else:
+            source.line(f"v{index} = {source.name('F', formatter)}(value)")
+        locals_by_key[variable.key] = f"v{index}"
+
+    segments = template._parsed.segments
+    if segments is None:
+        items = ", ".join(
+            f"{source.name('K', key)}: {local}" for key, local in locals_by_key.items()
+        )
+        source.line(f"return {source.name('T', template.text)}.format(**{{{items}}})")
+        return source
+
+    parts = []
+    for segment in segments:
+        if segment.__class__ is str:
+            parts.append(f"{{{source.name('L', segment)}}}")
+        else:
+            parts.append(_field_expression(source, segment, locals_by_key))
+    source.line(f'return f"{"".join(parts)}"')
+    return source
+
+
+def compile_template(template: "Template") -> Callable[[Any], str]:
+    """*Generates a python function specialized to the template that inlines path lookups, defaults and formatter calls and builds the output with a single f-string.*
+
+    **Args**
+    - **template (Template)**: template to generate the render function for.
+
+    **Returns**
+    - **(Callable[[Any], str])**: function that takes the data and returns the same output as `Template.format`.
+    """
+    source = _generate(template)
+    return build_function("data", source.lines, source.names)
@@ -26,6 +26,9 @@ class InvalidFormatter(TemplatrException):
         self.args = args
         self.kwargs = kwargs
 
+    def __reduce__(self):
+        return type(self), (self.formatter_cls, self.args, self.kwargs)
+
 
 class UnknownFormatter(TemplatrException):
     """*Exception Raised when formatter we tried to create did not exist to be loaded.*
@@ -38,6 +41,9 @@ class UnknownFormatter(TemplatrException):
         super().__init__(f"Unable to find formatter with name: {formatter_cls}")
         self.formatter_cls = formatter_cls
 
+    def __reduce__(self):
+        return type(self), (self.formatter_cls,)
+
 
 class UnsupportedSource(TemplatrException):
     """*Exception Raised when we are trying to parse json or yaml into template but are not able to use type for parsing.*
@@ -48,6 +54,10 @@ class UnsupportedSource(TemplatrException):
 
     def __init__(self, _type: type) -> None:
         super().__init__(f"Unable to parse from source: {_type}")
+        self._type = _type
+
+    def __reduce__(self):
+        return type(self), (self._type,)
 
 
 class MissingValue(TemplatrException):
@@ -66,3 +76,106 @@ class MissingValue(TemplatrException):
 
         self.key = key
         self.path = path
+
+    def __reduce__(self):
+        return type(self), (self.key, self.path)
+
+
+class MismatchedColumns(TemplatrException):
+    """*Exception Raised when columns given to render from do not all have the same number of rows.*
+
+    **Args**
+    - **lengths (dict[str, int])**: Number of rows in each column.
+    """
+
+    def __init__(self, lengths: Dict[str, int]) -> None:
+        super().__init__(f"Columns must all have the same number of rows: {lengths}")
+        self.lengths = lengths
+
+    def __reduce__(self):
+        return type(self), (self.lengths,)
+
+
+class UnknownTemplate(TemplatrException):
+    """*Exception Raised when a template registry has no template file for the requested name.*
+
+    **Args**
+    - **name (str)**: Name of the template we tried to get.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"Unable to find template with name: {name}")
+        self.name = name
+
+    def __reduce__(self):
+        return type(self), (self.name,)
+
+
+class UndeclaredFields(TemplatrException):
+    """*Exception Raised when template text references keys that none of its variables define.*
+
+    **Args**
+    - **fields (list[str])**: The keys that have no variable.
+    """
+
+    def __init__(self, fields: List[str]) -> None:
+        super().__init__(f"Template references undeclared fields: {', '.join(fields)}")
+        self.fields = fields
+
+    def __reduce__(self):
+        return type(self), (self.fields,)
+
+
+class StaleArtifact(TemplatrException):
+    """*Exception Raised when a precompiled template artifact can't be used, because it was built from other source content, by another version of templatr or is not an artifact at all.*
+
+    **Args**
+    - **path (str)**: Path of the artifact.
+    - **reason (str)**: Why the artifact was rejected.
+    """
+
+    def __init__(self, path: str, reason: str) -> None:
+        super().__init__(f"Unable to use template artifact {path}: {reason}")
+        self.path = path
+        self.reason = reason
+
+    def __reduce__(self):
+        return type(self), (self.path, self.reason)
+
+
+class UnserializableVariable(TemplatrException):
+    """*Exception Raised when a template artifact can't be written because the default or formatter arguments of a variable are not made of plain python values, e.g. a date loaded from yaml.*
+
+    **Args**
+    - **key (str)**: Key of the variable.
+    - **part (str)**: What can't be written, `default` or `formatter`.
+    """
+
+    def __init__(self, key: str, part: str) -> None:
+        super().__init__(
+            f"Unable to write variable {key} to an artifact: its {part} is not made of plain python values"
+        )
+        self.key = key
+        self.part = part
+
+    def __reduce__(self):
+        return type(self), (self.key, self.part)
+
+
+class InvalidRecord(TemplatrException):
+    """*Exception Raised when a record of an input file can't be parsed.*
+
+    **Args**
+    - **source (str)**: Name of the input the record was read from.
+    - **line (int)**: Line number of the record, starting at 1.
+    - **reason (str)**: Why the record couldn't be parsed.
+    """
+
+    def __init__(self, source: str, line: int, reason: str) -> None:
+        super().__init__(f"Unable to parse record on line {line} of {source}: {reason}")
+        self.source = source
+        self.line = line
+        self.reason = reason
+
+    def __reduce__(self):
+        return type(self), (self.source, self.line, self.reason)
@@ -1,16 +1,50 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+from weakref import WeakValueDictionary, ref
 import importlib
+import inspect
+import threading
 
+from templatr.cache import _EXACT_TYPES, _exact_key
 from templatr.exceptions import InvalidFormatter, UnknownFormatter
 
 
 class VariableFormatter(ABC):
-    """*Base Class for formatters that are used to coerce the value we define in our templates into a string for interpolation.*"""
+    """*Base Class for formatters that are used to coerce the value we define in our templates into a string for interpolation.*
+
+    `format` can be defined with `async def` for formatters that need I/O, those are awaited when rendering with `Template.aformat`.
+
+    Set `shareable` to False on formatters that keep state per instance so `load_formatter` never shares an instance between variables when interning is enabled.
+    """
+
+    shareable: ClassVar[bool] = True
 
     def __eq__(self, value: object) -> bool:
         return type(value) == type(self)
 
+    @classmethod
+    def _shareable_with(cls, args: list, kwargs: dict) -> bool:
+        """*Whether a formatter loaded with args and kwargs can be shared between variables, formatters wrapping other formatters also check the formatters they wrap.*"""
+        return cls.shareable
+
     @abstractmethod
     def format(self, value: Any) -> Any:  # pragma: no cover
         """*Format function that will manipulate the value into whatever shape you want it to with no restriction on the return type.*
@@ -34,6 +68,31 @@ class VariableFormatter(ABC):
         """
         return self.format(value)
 
+    def definition(self) -> Dict[str, Any]:
+        """*The `cls`, `args` and `kwargs` definition that `load_formatter` recreates an equal formatter from, as used in template files.*
+
+        Formatters loaded through `load_formatter` return the definition they were loaded with, others are defined by their class alone. Override for formatters that take arguments and are created directly.
+
+        **Returns**
+        - **(dict)**: the definition of the formatter.
+        """
+        definition = _DEFINITIONS.get(id(self))
+        if definition is not None:
+            _, cls_name, args, kwargs = definition
+            return {"cls": cls_name, "args": list(args), "kwargs": dict(kwargs)}
+        return {"cls": _class_name(type(self)), "args": [], "kwargs": {}}
+
+    def format_column(self, values: Sequence[Any]) -> List[Any]:
+        """*Formats a whole column of values at once, override when the formatter can do better than formatting one value at a time.*
+
+        **Args**
+        - **values (Sequence[Any])**: Values we want to format.
+
+        **Returns**
+        - **(list[Any])**: Formatted values in the same order.
+        """
+        return [self(value) for value in values]
+
 
 class DefaultFormatter(VariableFormatter):
     """*Default Formatter that will just return the value back as is making no modifications. This should be used if you don't need any special formatting for your variable value before it gets interpolated.*"""
@@ -49,51 +108,386 @@ class DefaultFormatter(VariableFormatter):
         """
         return value
 
+    def format_column(self, values: Sequence[Any]) -> Sequence[Any]:
+        """*Formats a column by returning it as is.*
+
+        **Args**
+        - **values (Sequence[Any])**: values to format.
+
+        **Returns**
+        - **(Sequence[Any])**: same as values arg.
+        """
+        return values
+
+
+class ChunkedValue:
+    """*Value a formatter can return to have `Template.iter_chunks` and `Template.render_to` write it piece by piece instead of building it as one string. Everywhere else it formats like the string its chunks join into.*
+
+    **Args**
+    - **chunks (Callable[[], Iterable[str]])**: returns the chunks of the value, called every time the value is written until it is converted to a string.
+    """
+
+    __slots__ = ("_chunks", "_text")
+
+    def __init__(self, chunks: Callable[[], Iterable[str]]) -> None:
+        self._chunks = chunks
+        self._text: Optional[str] = None
+
+    def __iter__(self) -> Iterator[str]:
+        if self._text is not None:
+            return iter((self._text,))
+        return iter(self._chunks())
+
+    def __str__(self) -> str:
+        # kept once built, the chunks may read items that can only be read once.
+        if self._text is None:
+            self._text = "".join(self._chunks())
+        return self._text
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+    def __repr__(self) -> str:
+        # `!r` and `!a` fields convert the value with repr, it reads like the string too.
+        return repr(str(self))
+
 
 class ListFormatter(VariableFormatter):
     """*Formatter used to join a list of items together for output.*
 
     **Args**
     - **seperator (str)**: The string you want to use to join the items in your list together with.
+    - **item_formatter (VariableFormatter, dict, None)**: formatter applied to each item before it is joined, or its `cls`, `args` and `kwargs` definition. defaults to: `None`
+    - **max_items (int, None)**: most items written, the rest are replaced by truncation. defaults to: `None`
+    - **truncation (str, None)**: item written after max_items when there are more items, nothing is written when None. defaults to: `"..."`
+    - **stream (bool)**: When True, `format` returns a `ChunkedValue` that reads the items lazily when it is written, so `Template.render_to` streams lists of any length item by item. defaults to: `False`
     """
 
     seperator: str
+    item_formatter: Optional[VariableFormatter]
+    max_items: Optional[int]
+    truncation: Optional[str]
+    stream: bool
 
-    def __init__(self, seperator: str) -> None:
+    def __init__(
+        self,
+        seperator: str,
+        item_formatter: Union[VariableFormatter, Dict[str, Any], None] = None,
+        max_items: Optional[int] = None,
+        truncation: Optional[str] = "...",
+        stream: bool = False,
+    ) -> None:
         self.seperator = seperator
+        self.item_formatter = (
+            None if item_formatter is None else _as_formatter(item_formatter)
+        )
+        self.max_items = max_items
+        self.truncation = truncation
+        self.stream = stream
+
+    @classmethod
+    def _shareable_with(cls, args: list, kwargs: dict) -> bool:
+        return cls.shareable and _wrapped_shareable(cls, "item_formatter", args, kwargs)
 
     def __eq__(self, value: object) -> bool:
-        return super().__eq__(value) and value.seperator == self.seperator
+        return (
+            super().__eq__(value)
+            and value.seperator == self.seperator
+            and value.item_formatter == self.item_formatter
+            and value.max_items == self.max_items
+            and value.truncation == self.truncation
+            and value.stream == self.stream
+        )
 
-    def format(self, value: list):
+    def definition(self) -> Dict[str, Any]:
+        """*The definition of the formatter, with only the options that differ from their defaults.*
+
+        **Returns**
+        - **(dict)**: the definition of the formatter.
+        """
+        kwargs: Dict[str, Any] = {"seperator": self.seperator}
+        if self.item_formatter is not None:
+            kwargs["item_formatter"] = self.item_formatter.definition()
+        if self.max_items is not None:
+            kwargs["max_items"] = self.max_items
+        if self.truncation != "...":
+            kwargs["truncation"] = self.truncation
+        if self.stream:
+            kwargs["stream"] = True
+        return {"cls": _class_name(type(self)), "args": [], "kwargs": kwargs}
+
+    def format(self, value: Iterable[Any]):
         """*Formats the list given as value into a single string of the items as a string joined with the configured seprator.*
 
         **Args**
-        - **value (list)**: List of items we are formatting.
+        - **value (Iterable[Any])**: Items we are formatting, only read up to max_items.
 
         **Returns**
         - **(str)**: Formatted string of list joined by seperator.
+        - **(ChunkedValue)**: the same string in chunks of one item, when stream is True.
         """
-        # coerce into string iterable and send it with join
-        return self.seperator.join((str(v) for v in value))
+        if self.stream:
+            return ChunkedValue(lambda: self._chunks(value))
+        if self.item_formatter is None and self.max_items is None:
+            # coerce into string iterable and send it with join
+            return self.seperator.join((str(v) for v in value))
+        return "".join(self._chunks(value))
 
+    def format_column(self, values: Sequence[Iterable[Any]]) -> List[Any]:
+        """*Joins each list in the column with the configured seperator.*
 
-def load_formatter(cls_name: str, args: list, kwargs: dict):
-    """*Loads a formatter dynamically by using the cls_name to dynamically discover the formatter cls_instance and passes in the args, and kwargs given to instance.*
+        **Args**
+        - **values (Sequence[Iterable[Any]])**: Lists of items we are formatting.
+
+        **Returns**
+        - **(list[str])**: Each list joined by seperator.
+        """
+        if self.stream or self.item_formatter is not None or self.max_items is not None:
+            return [self.format(value) for value in values]
+        join = self.seperator.join
+        return [join(map(str, value)) for value in values]
+
+    def _chunks(self, value: Iterable[Any]) -> Iterator[str]:
+        """*Lazily yields the first item and then each following item prefixed with the seperator, ending with truncation when items were left over.*"""
+        items = iter(value)
+        if self.max_items is not None:
+            written = islice(items, self.max_items)
+        else:
+            written = items
+        item_formatter = self.item_formatter
+        seperator = self.seperator
+        prefix = ""
+        for item in written:
+            if item_formatter is not None:
+                item = item_formatter(item)
+            yield prefix + str(item)
+            prefix = seperator
+        if self.max_items is not None and self.truncation is not None:
+            for _ in items:
+                # at least one item past max_items.
+                yield prefix + self.truncation
+                break
+
+
+class CacheStats(NamedTuple):
+    """*Snapshot of how a CachedFormatter has been used.*
 
     **Args**
-    - **cls_name (str)**: Fully-Qualified Classname for Formatter class or a Class Name for a formatter in the templatr formatter module.
-    - **args (list)**: Arguments you wish to pass to your formatter instance.
-    - **kwargs (dict)**: Key-Word Arguments you wish to pass to your formatter instance.
+    - **hits (int)**: values formatted from the cache.
+    - **misses (int)**: values that had to be formatted and were then cached.
+    - **bypassed (int)**: values formatted without the cache because they are not of a type that is cached.
+    - **evictions (int)**: cached results dropped to stay within max_size.
+    - **size (int)**: results currently cached.
+    - **max_size (int)**: most results kept cached at once.
+    """
 
-    ***Raises***
-    - **UnknownFormatter**: when given cls_name cannot be loaded correctly.
-    - **InvalidFormatter**: When given cls is not a variable formatter.
-    - **InvalidFormatter**: When given args and kwargs cannot create formatter class.
+    hits: int
+    misses: int
+    bypassed: int
+    evictions: int
+    size: int
+    max_size: int
 
-    **Returns**
-    - **(VariableFormatter)**: VariableFormatter that was instantiated from the given arguments.
+    @property
+    def hit_rate(self) -> float:
+        """*Share of cacheable values formatted from the cache, 0 before anything was formatted.*"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachedFormatter(VariableFormatter):
+    """*Formatter that remembers the results of another formatter for the most recently used values, for formatters doing costly work on the same few values over and over.*
+
+    Only values that format the same whenever they are equal are cached, str, int, bool, bytes, None, float, Decimal, Enum members and tuples of those. They are keyed so that equal values that print differently, e.g. `1` and `1.0`, `0.0` and `-0.0` or `Decimal("1.5")` and `Decimal("1.50")`, are cached apart. Other values, e.g. lists, and results that are awaitable are never cached. Shared between threads safely.
+
+    **Args**
+    - **formatter (VariableFormatter, dict)**: formatter whose results are cached, or its `cls`, `args` and `kwargs` definition.
+    - **max_size (int)**: most results kept, the least recently used is dropped past it. defaults to: `1024`
     """
+
+    formatter: VariableFormatter
+    max_size: int
+
+    def __init__(
+        self, formatter: Union[VariableFormatter, Dict[str, Any]], max_size: int = 1024
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.formatter = _as_formatter(formatter)
+        self.max_size = max_size
+        self._cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._bypassed = self._evictions = 0
+
+    @classmethod
+    def _shareable_with(cls, args: list, kwargs: dict) -> bool:
+        return cls.shareable and _wrapped_shareable(cls, "formatter", args, kwargs)
+
+    def __eq__(self, value: object) -> bool:
+        return (
+            super().__eq__(value)
+            and value.formatter == self.formatter
+            and value.max_size == self.max_size
+        )
+
+    def definition(self) -> Dict[str, Any]:
+        """*The definition of the wrapped formatter with `cache` set to max_size.*
+
+        **Returns**
+        - **(dict)**: the definition of the formatter.
+        """
+        return {**self.formatter.definition(), "cache": self.max_size}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks can't be pickled, copies start with an empty cache.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_cache"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """*Snapshot of the hit, miss, bypass and eviction counters.*"""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                bypassed=self._bypassed,
+                evictions=self._evictions,
+                size=len(self._cache),
+                max_size=self.max_size,
+            )
+
+    def clear(self) -> None:
+        """*Drops every cached result, counters are kept.*"""
+        with self._lock:
+            self._cache.clear()
+
+    def format(self, value: Any) -> Any:
+        """*Formats value with the wrapped formatter, reusing the result from the last time an identical value was formatted.*
+
+        **Args**
+        - **value (Any)**: Value we want to format.
+
+        **Returns**
+        - **(Any)**: the result of the wrapped formatter.
+        """
+        cls = value.__class__
+        try:
+            # the key _exact_key gives the most common values, without calling it.
+            if cls in _EXACT_TYPES or (cls is float and value):
+                key = (cls, value)
+            else:
+                key = _exact_key(value)
+            with self._lock:
+                result = self._cache[key]
+                self._cache.move_to_end(key)
+                self._hits += 1
+            return result
+        except KeyError:
+            pass
+        except TypeError:
+            with self._lock:
+                self._bypassed += 1
+            return self.formatter(value)
+
+        result = self.formatter(value)
+        if inspect.isawaitable(result):
+            # can only be awaited once.
+            return result
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = result
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+        return result
+
+
+def _class_name(cls: type) -> str:
+    """*Name load_formatter resolves cls by, formatters of this module go by their class name alone.*"""
+    if cls.__module__ == __name__:
+        return cls.__name__
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+@lru_cache(maxsize=None)
+def _parameter_index(cls: type, parameter: str) -> int:
+    """*Position of parameter in the arguments of cls.*"""
+    return list(inspect.signature(cls).parameters).index(parameter)
+
+
+def _wrapped_shareable(cls: type, parameter: str, args: list, kwargs: dict) -> bool:
+    """*Whether the formatter cls is given for parameter, or its definition, can be shared. A formatter keeping state per instance is only safe to share when nothing wrapping it is shared either.*"""
+    index = _parameter_index(cls, parameter)
+    wrapped = args[index] if index < len(args) else kwargs.get(parameter)
+    if wrapped is None:
+        return True
+    if not isinstance(wrapped, dict):
+        return getattr(wrapped, "shareable", False)
+    try:
+        wrapped_args = wrapped.get("args") or []
+        wrapped_kwargs = wrapped.get("kwargs") or {}
+        wrapped_cls = _formatter_class(wrapped["cls"], wrapped_args, wrapped_kwargs)
+    except Exception:
+        # creating the formatter fails on this definition, it is never shared.
+        return False
+    return wrapped_cls._shareable_with(wrapped_args, wrapped_kwargs)
+
+
+def _as_formatter(formatter: Union[VariableFormatter, Dict[str, Any]]):
+    """*Loads formatters given by their `cls`, `args` and `kwargs` definition, formatters are returned as is.*"""
+    if isinstance(formatter, dict):
+        return load_formatter(
+            formatter["cls"], formatter.get("args") or [], formatter.get("kwargs") or {}
+        )
+    return formatter
+
+
+# formatter classes resolved by the name they were loaded with.
+_FORMATTER_CLASSES: Dict[str, Type[VariableFormatter]] = {}
+# formatters shared between every load with equal arguments, dropped once no variable uses them.
+_FORMATTER_INSTANCES: "WeakValueDictionary[Hashable, VariableFormatter]" = (
+    WeakValueDictionary()
+)
+# definition each formatter was loaded with by id, so it can be written back out without storing anything on the formatter. The weak reference drops the entry once the formatter is collected.
+_DEFINITIONS: Dict[int, Tuple[ref, str, tuple, dict]] = {}
+
+
+def _remember_definition(
+    formatter: VariableFormatter, cls_name: str, args: list, kwargs: dict
+) -> None:
+    """*Keeps the definition a formatter was loaded with until the formatter is collected.*"""
+    cls = type(formatter)
+    if cls.definition is not VariableFormatter.definition:
+        # the formatter defines itself from its attributes.
+        return
+    if not args and not kwargs and cls_name == _class_name(cls):
+        # same as the definition by class alone.
+        return
+    key = id(formatter)
+    if key in _DEFINITIONS:
+        return
+    try:
+        reference = ref(formatter, lambda _, key=key: _DEFINITIONS.pop(key, None))
+    except TypeError:
+        # formatter class doesn't support weak references, it is defined by its class alone.
+        return
+    _DEFINITIONS[key] = (reference, cls_name, tuple(args), dict(kwargs))
+
+
+def _formatter_class(
+    cls_name: str, args: list, kwargs: dict
+) -> Type[VariableFormatter]:
+    """*Resolves the formatter class for cls_name, importing it the first time the name is used.*"""
+    _cls_instance = _FORMATTER_CLASSES.get(cls_name)
+    if _cls_instance is not None:
+        return _cls_instance
+
     index = cls_name.rfind(".")
     if index == -1:
         # we are using one referenced in this module.
@@ -102,17 +496,106 @@ def load_formatter(cls_name: str, args: list, kwargs: dict):
         _module, _cls = cls_name[0:index], cls_name[index + 1 :]
     try:
         _module_instance = importlib.import_module(_module)
-        _cls_instance: type[VariableFormatter] = getattr(
+        _cls_instance = getattr(
             _module_instance, _cls
         )  # will raise exception when class does not exist.
     except Exception as exc:
         raise UnknownFormatter(f"Unknown formatter class: {cls_name}") from exc
 
-    if not issubclass(_cls_instance, VariableFormatter):
+    if not isinstance(_cls_instance, type) or not issubclass(
+        _cls_instance, VariableFormatter
+    ):
         raise InvalidFormatter(formatter_cls=cls_name, args=args, kwargs=kwargs)
+    _FORMATTER_CLASSES[cls_name] = _cls_instance
+    return _cls_instance
+
+
+def _freeze(value: Any) -> Hashable:
+    """*Hashable version of a formatter argument that only equals arguments of the same type and value.*
+
+    ***Raises***
+    - **TypeError**: When value or something inside it can't be hashed.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return dict, frozenset((key, _freeze(item)) for key, item in value.items())
+    hash(value)
+    return type(value), value
+
+
+def _intern_key(cls: type, args: list, kwargs: dict) -> Hashable:
+    """*Key that formatters loaded with equal arguments share.*
+
+    ***Raises***
+    - **TypeError**: When the arguments can't be hashed.
+    """
     try:
-        return _cls_instance(*args, **kwargs)
+        key = (
+            cls,
+            tuple(args),
+            tuple(map(type, args)),
+            tuple(sorted(kwargs.items())),
+            tuple(map(type, kwargs.values())),
+        )
+        hash(key)
+        return key
+    except TypeError:
+        # nested containers, freeze them into something hashable instead.
+        return cls, _freeze(args), _freeze(kwargs)
+
+
+def clear_formatter_cache() -> None:
+    """*Forgets resolved formatter classes and shared formatter instances, e.g. after reloading the module of a custom formatter.*"""
+    _FORMATTER_CLASSES.clear()
+    _FORMATTER_INSTANCES.clear()
+
+
+def load_formatter(cls_name: str, args: list, kwargs: dict, intern: bool = False):
+    """*Loads a formatter dynamically by using the cls_name to dynamically discover the formatter cls_instance and passes in the args, and kwargs given to instance.*
+
+    Classes are resolved once per cls_name. With intern, loads with equal arguments return the same formatter instance unless the formatter class, or a formatter it wraps, sets `shareable` to False.
+
+    **Args**
+    - **cls_name (str)**: Fully-Qualified Classname for Formatter class or a Class Name for a formatter in the templatr formatter module.
+    - **args (list)**: Arguments you wish to pass to your formatter instance.
+    - **kwargs (dict)**: Key-Word Arguments you wish to pass to your formatter instance.
+    - **intern (bool)**: When True, share one formatter instance between loads with equal arguments. defaults to: `False`
+
+    ***Raises***
+    - **UnknownFormatter**: when given cls_name cannot be loaded correctly.
+    - **InvalidFormatter**: When given cls is not a variable formatter.
+    - **InvalidFormatter**: When given args and kwargs cannot create formatter class.
+
+    **Returns**
+    - **(VariableFormatter)**: VariableFormatter that was instantiated from the given arguments.
+    """
+    _cls_instance = _formatter_class(cls_name, args, kwargs)
+
+    key = None
+    if intern and _cls_instance._shareable_with(args, kwargs):
+        try:
+            key = _intern_key(_cls_instance, args, kwargs)
+            formatter = _FORMATTER_INSTANCES.get(key)
+        except TypeError:
+            # unhashable arguments, can't tell which instances are equal.
+            key = formatter = None
+        if formatter is not None:
+            return formatter
+
+    try:
+        formatter = _cls_instance(*args, **kwargs)
     except Exception as exc:
         raise InvalidFormatter(
             formatter_cls=cls_name, args=args, kwargs=kwargs
         ) from exc
+
+    if key is not None:
+        try:
+            formatter = _FORMATTER_INSTANCES.setdefault(key, formatter)
+        except TypeError:
+            # formatter class doesn't support weak references.
+            pass
+    # kept so the formatter can be written back out with the definition it was loaded with.
+    _remember_definition(formatter, cls_name, args, kwargs)
+    return formatter
@@ -1,4 +1,6 @@
-from typing import Any
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Dict, List
 
 
 class DictObjectView:
@@ -13,3 +15,30 @@ class DictObjectView:
 
     def __getattr__(self, name: str) -> Any:
         return self.__dict__.get(name)
+
+
+@lru_cache(maxsize=1024)
+def _compile_source(code: str) -> CodeType:
+    """*Compiles generated source, functions generated with the same body share the same code object.*"""
+    return compile(code, "<templatr>", "exec")
+
+
+def build_function(parameter: str, lines: List[str], names: Dict[str, Any]):
+    """*Internal helper that builds a function from generated source lines. Values the lines reference are bound as closure variables so the source only depends on the structure of what was generated.*
+
+    **Args**
+    - **parameter (str)**: name of the single parameter of the function.
+    - **lines (list[str])**: body of the function, indented relative to the body.
+    - **names (dict[str, Any])**: values referenced by name in lines.
+
+    **Returns**
+    - **(Callable[[Any], Any])**: the generated function.
+    """
+    code = "\n".join(
+        [f"def _factory({', '.join(names)}):", f"    def generated({parameter}):"]
+        + ["        " + line for line in lines]
+        + ["    return generated"]
+    )
+    namespace: Dict[str, Any] = {}
+    exec(_compile_source(code), namespace)
+    return namespace["_factory"](**names)
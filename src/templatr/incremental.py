@@ -0,0 +1,158 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from templatr.template import Template
+
+
+class IncrementalRender:
+    """*Output of a template kept up to date as the data it was rendered from changes. The formatted value of every variable and the rendered text of every field are kept, so `update` only resolves and formats the variables reading the paths that changed and re-renders the fields showing them.*
+
+    Variables whose paths didn't change keep their value, formatters are expected to give the same output for the same value. Changing the text or variables of the template is not tracked, call `refresh` afterwards.
+
+    **Args**
+    - **template (Template)**: template to render.
+    - **data (Any)**: Source of variables we will be puling from.
+
+    ***Raises***
+    - **MissingValue**: When a value could not be determined for a variable and no default has been set.
+    """
+
+    def __init__(self, template: "Template", data: Any) -> None:
+        self.template = template
+        self.refresh(data)
+
+    @property
+    def output(self) -> str:
+        """*Output for the data last given.*"""
+        return self._output
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        """*Formatted value of each variable for the data last given, keyed by variable key.*"""
+        return dict(self._values)
+
+    def refresh(self, data: Any) -> str:
+        """*Resolves every variable and renders the whole template again, e.g. after the template changed or when it is unknown what changed in data.*
+
+        **Args**
+        - **data (Any)**: Source of variables we will be puling from.
+
+        ***Raises***
+        - **MissingValue**: When a value could not be determined for a variable and no default has been set.
+
+        **Returns**
+        - **(str)**: the output, identical to `Template.format`.
+        """
+        template = self.template
+        variables = template._used_variables
+        by_path: Dict[Tuple[str, ...], List[int]] = {}
+        by_prefix: Dict[Tuple[str, ...], List[int]] = {}
+        # a variable is shadowed by a later variable with the same key, like in Template.format.
+        owners = {variable.key: index for index, variable in enumerate(variables)}
+        for index, variable in enumerate(variables):
+            if owners[variable.key] != index:
+                continue
+            path = tuple(variable._chain.path)
+            by_path.setdefault(path, []).append(index)
+            for end in range(len(path) + 1):
+                by_prefix.setdefault(path[:end], []).append(index)
+
+        values = {
+            variable.key: variable.formatter(variable._default_for(value))
+            for variable, value in zip(variables, template._paths.resolve(data))
+        }
+
+        parsed = template._parsed
+        segments = parsed.segments
+        fields: Dict[str, List[int]] = {}
+        parts: List[str] = []
+        if segments is None:
+            output = parsed.render(values)
+        else:
+            for position, segment in enumerate(segments):
+                if segment.__class__ is str:
+                    parts.append(segment)
+                    continue
+                fields.setdefault(segment.key, []).append(position)
+                if segment.plain:
+                    parts.append(format(values[segment.key], segment.spec))
+                else:
+                    parts.append(segment.render(values))
+            output = "".join(parts)
+
+        self._variables = variables
+        self._by_path = by_path
+        self._by_prefix = by_prefix
+        self._values = values
+        self._segments = segments
+        self._fields = fields
+        self._parts = parts
+        self._output = output
+        return output
+
+    def update(self, data: Any, changed: Iterable[Union[str, Sequence[str]]]) -> str:
+        """*Brings the output up to date with data, where only the values at the changed paths differ from the data last given.*
+
+        A variable is resolved again when a changed path is its path, part of its path, e.g. `user` for `user.name`, or inside its path, e.g. `items.0` for `items`. When a value can't be resolved nothing is updated.
+
+        **Args**
+        - **data (Any)**: Source of variables we will be puling from.
+        - **changed (Iterable[str | Sequence[str]])**: paths that changed, dotted or as parts, an empty path means everything changed.
+
+        ***Raises***
+        - **MissingValue**: When a value could not be determined for a variable and no default has been set.
+
+        **Returns**
+        - **(str)**: the output, identical to `Template.format` for data.
+        """
+        affected = self._affected(changed)
+        if not affected:
+            return self._output
+
+        variables = self._variables
+        updated = {}
+        for index in sorted(affected):
+            variable = variables[index]
+            updated[variable.key] = variable.resolve(data)
+        values = self._values
+        values.update(updated)
+
+        segments = self._segments
+        if segments is None:
+            self._output = self.template._parsed.render(values)
+            return self._output
+        parts = self._parts
+        for key in updated:
+            for position in self._fields.get(key, ()):
+                segment = segments[position]
+                if segment.plain:
+                    parts[position] = format(values[key], segment.spec)
+                else:
+                    parts[position] = segment.render(values)
+        self._output = "".join(parts)
+        return self._output
+
+    def _affected(self, changed: Iterable[Union[str, Sequence[str]]]) -> Set[int]:
+        """*Indexes of the variables that read a changed path.*"""
+        affected: Set[int] = set()
+        for path in changed:
+            if isinstance(path, str):
+                parts = tuple(path.split(".")) if path else ()
+            else:
+                parts = tuple(str(part) for part in path)
+            # variables reading the path or inside it.
+            affected.update(self._by_prefix.get(parts, ()))
+            # variables reading a parent of the path.
+            for end in range(len(parts)):
+                affected.update(self._by_path.get(parts[:end], ()))
+        return affected
@@ -0,0 +1,237 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional
+import logging
+import threading
+
+if TYPE_CHECKING:  # pragma: no cover
+    from templatr.template import Template
+
+# outcomes of resolving a variable.
+RESOLVED = "resolved"
+DEFAULTED = "defaulted"
+MISSING = "missing"
+
+
+class VariableRecord(NamedTuple):
+    """*How one variable was resolved and formatted during a render.*
+
+    **Args**
+    - **key (str)**: key of the variable.
+    - **offset_ns (int)**: nanoseconds from the start of the render to the start of resolving the variable.
+    - **resolve_ns (int)**: nanoseconds spent resolving the path of the variable.
+    - **format_ns (int)**: nanoseconds spent in the formatter of the variable.
+    - **outcome (str)**: `resolved`, `defaulted` when the default was used or `missing` when the render failed on it.
+    """
+
+    key: str
+    offset_ns: int
+    resolve_ns: int
+    format_ns: int
+    outcome: str
+
+
+class RenderRecord(NamedTuple):
+    """*Timings of one render of an instrumented template.*
+
+    **Args**
+    - **template (Template)**: template that was rendered.
+    - **start_time_ns (int)**: wall clock time the render started, in nanoseconds since the epoch.
+    - **duration_ns (int)**: nanoseconds the whole render took.
+    - **interpolate_ns (int)**: nanoseconds spent building the output from the formatted values.
+    - **variables (list[VariableRecord])**: records of the variables resolved, in order, up to the one that failed.
+    - **output_size (int)**: length of the output, 0 when the render failed.
+    - **error (BaseException, None)**: exception the render raised.
+    """
+
+    template: "Template"
+    start_time_ns: int
+    duration_ns: int
+    interpolate_ns: int
+    variables: List[VariableRecord]
+    output_size: int
+    error: Optional[BaseException]
+
+    @property
+    def defaulted(self) -> int:
+        """*Number of variables that used their default.*"""
+        return sum(record.outcome == DEFAULTED for record in self.variables)
+
+    @property
+    def missing(self) -> int:
+        """*Number of variables the render failed to find a value for.*"""
+        return sum(record.outcome == MISSING for record in self.variables)
+
+
+class Instrument:
+    """*Receives a record of every render of the templates it is attached to with `Template.instrument`. Subclass it and override `record`.*
+
+    Templates without an instrument render exactly as before, so instruments can be enabled from config without slowing down the templates that don't use them.
+    """
+
+    def record(self, render: RenderRecord) -> None:  # pragma: no cover
+        """*Called after every render, including renders that raised.*
+
+        **Args**
+        - **render (RenderRecord)**: timings of the render.
+        """
+        pass
+
+
+class StatsInstrument(Instrument):
+    """*Instrument that adds up renders and per variable timings and counts in memory, shared between threads safely.*"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """*Zeroes every total.*"""
+        with self._lock:
+            self._renders = self._errors = self._output_size = 0
+            self._duration_ns = self._interpolate_ns = 0
+            self._variables: Dict[str, Dict[str, int]] = {}
+
+    def record(self, render: RenderRecord) -> None:
+        with self._lock:
+            self._renders += 1
+            self._errors += render.error is not None
+            self._output_size += render.output_size
+            self._duration_ns += render.duration_ns
+            self._interpolate_ns += render.interpolate_ns
+            for record in render.variables:
+                totals = self._variables.get(record.key)
+                if totals is None:
+                    totals = self._variables[record.key] = dict.fromkeys(
+                        ("count", "resolve_ns", "format_ns", DEFAULTED, MISSING), 0
+                    )
+                totals["count"] += 1
+                totals["resolve_ns"] += record.resolve_ns
+                totals["format_ns"] += record.format_ns
+                if record.outcome != RESOLVED:
+                    totals[record.outcome] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """*Copy of the totals recorded so far.*
+
+        **Returns**
+        - **(dict)**: `renders`, `errors`, `output_size`, `duration_ns`, `interpolate_ns` and `variables`, the `count`, `resolve_ns`, `format_ns`, `defaulted` and `missing` totals keyed by variable key.
+        """
+        with self._lock:
+            return {
+                "renders": self._renders,
+                "errors": self._errors,
+                "output_size": self._output_size,
+                "duration_ns": self._duration_ns,
+                "interpolate_ns": self._interpolate_ns,
+                "variables": {
+                    key: dict(totals) for key, totals in self._variables.items()
+                },
+            }
+
+
+class LoggingInstrument(Instrument):
+    """*Instrument that logs a line per render with the time spent in each variable, the record is attached to the log record as `templatr_render`.*
+
+    **Args**
+    - **logger (logging.Logger, None)**: logger written to. defaults to: `logging.getLogger("templatr")`
+    - **level (int)**: level renders are logged at, failed renders are logged at `WARNING` or above. defaults to: `logging.DEBUG`
+    - **slow_ms (float, None)**: only renders taking at least this many milliseconds are logged, all when None. defaults to: `None`
+    - **name (str)**: name the template is logged as. defaults to: `"template"`
+    """
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.DEBUG,
+        slow_ms: Optional[float] = None,
+        name: str = "template",
+    ) -> None:
+        self.logger = logger or logging.getLogger("templatr")
+        self.level = level
+        self.slow_ns = None if slow_ms is None else int(slow_ms * 1_000_000)
+        self.name = name
+
+    def record(self, render: RenderRecord) -> None:
+        level = self.level if render.error is None else max(self.level, logging.WARNING)
+        if render.error is None and (
+            self.slow_ns is not None and render.duration_ns < self.slow_ns
+        ):
+            return
+        if not self.logger.isEnabledFor(level):
+            return
+        variables = ", ".join(
+            f"{record.key}={record.resolve_ns / 1e6:.3f}+{record.format_ns / 1e6:.3f}ms"
+            + ("" if record.outcome == RESOLVED else f" {record.outcome}")
+            for record in render.variables
+        )
+        self.logger.log(
+            level,
+            "rendered %s in %.3fms (interpolate %.3fms, %d chars%s) variables: %s",
+            self.name,
+            render.duration_ns / 1e6,
+            render.interpolate_ns / 1e6,
+            render.output_size,
+            "" if render.error is None else f", failed: {render.error!r}",
+            variables,
+            extra={"templatr_render": render},
+        )
+
+
+@lru_cache(maxsize=None)
+def _set_span_in_context() -> Optional[Callable[[Any], Any]]:
+    """*Imports `opentelemetry.trace` the first time a span is parented, None when it is not installed. Resolved once, python doesn't cache failed imports and retrying one on every render costs more than the render.*"""
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+    return trace.set_span_in_context
+
+
+def _span_context(span: Any) -> Any:
+    set_span_in_context = _set_span_in_context()
+    if set_span_in_context is None:
+        return None
+    return set_span_in_context(span)
+
+
+class SpanInstrument(Instrument):
+    """*Instrument that turns every render into a span with a child span per variable, through any tracer with the OpenTelemetry `start_span(name, context=None, start_time=None)` interface. Child spans are parented through `opentelemetry.trace` when it is installed.*
+
+    **Args**
+    - **tracer (Tracer)**: tracer the spans are started with.
+    - **name (str)**: name of the render span, variable spans are named `{name}.variable`. defaults to: `"templatr.render"`
+    - **variable_spans (bool)**: When False, only the render span is created. defaults to: `True`
+    """
+
+    def __init__(
+        self, tracer: Any, name: str = "templatr.render", variable_spans: bool = True
+    ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.variable_spans = variable_spans
+
+    def record(self, render: RenderRecord) -> None:
+        start = render.start_time_ns
+        span = self.tracer.start_span(self.name, start_time=start)
+        span.set_attribute("templatr.output_size", render.output_size)
+        span.set_attribute("templatr.interpolate_ns", render.interpolate_ns)
+        span.set_attribute("templatr.variables", len(render.variables))
+        span.set_attribute("templatr.defaulted", render.defaulted)
+        span.set_attribute("templatr.missing", render.missing)
+        if render.error is not None:
+            span.set_attribute("error", True)
+            if hasattr(span, "record_exception"):
+                span.record_exception(render.error)
+        if self.variable_spans:
+            context = _span_context(span)
+            for record in render.variables:
+                child_start = start + record.offset_ns
+                child = self.tracer.start_span(
+                    f"{self.name}.variable", context=context, start_time=child_start
+                )
+                child.set_attribute("templatr.key", record.key)
+                child.set_attribute("templatr.resolve_ns", record.resolve_ns)
+                child.set_attribute("templatr.format_ns", record.format_ns)
+                child.set_attribute("templatr.outcome", record.outcome)
+                child.end(end_time=child_start + record.resolve_ns + record.format_ns)
+        span.end(end_time=start + render.duration_ns)
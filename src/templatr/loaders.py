@@ -0,0 +1,82 @@
+from functools import lru_cache
+from typing import Any, Callable, Union
+
+from templatr.exceptions import UnsupportedSource
+
+
+@lru_cache(maxsize=None)
+def _load_json() -> Callable[[Union[str, bytes]], Any]:
+    """*Picks the fastest json parser installed the first time a json document is parsed, so importing templatr doesn't import the json parsers. Prefers orjson then ujson over the standard library.*"""
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+
+        return ujson.loads
+    except ImportError:
+        pass
+    import json
+
+    return json.loads
+
+
+@lru_cache(maxsize=None)
+def _load_yaml() -> Callable[[Union[str, bytes]], Any]:
+    """*Imports PyYAML the first time a yaml document is parsed, so templates that are never loaded from yaml don't pay for importing it. Picks the libyaml bindings when available, several times faster than the pure python loader.*"""
+    from yaml import load
+
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader as YamlLoader
+
+    return lambda content: load(content, Loader=YamlLoader)
+
+
+def read_source(path: Any) -> Union[str, bytes]:
+    """*Reads the whole content of a template source.*
+
+    **Args**
+    - **path (str, IO)**: path of the file to read or a text or binary file object.
+
+    ***Raises***
+    - **UnsupportedSource**: When path is neither a path nor a readable object.
+
+    **Returns**
+    - **(str, bytes)**: content of the source, bytes when read from a path.
+    """
+    if isinstance(path, str):
+        with open(path, "rb") as fp:
+            return fp.read()
+    try:
+        return path.read()
+    except AttributeError:
+        raise UnsupportedSource(type(path))
+
+
+def parse_json(content: Union[str, bytes]) -> Any:
+    """*Parses json content with the fastest json parser installed.*
+
+    **Args**
+    - **content (str, bytes)**: json document.
+
+    **Returns**
+    - **(Any)**: parsed document.
+    """
+    return _load_json()(content)
+
+
+def parse_yaml(content: Union[str, bytes]) -> Any:
+    """*Parses yaml content with the libyaml backed loader when available, otherwise the pure python safe loader.*
+
+    **Args**
+    - **content (str, bytes)**: yaml document.
+
+    **Returns**
+    - **(Any)**: parsed document.
+    """
+    return _load_yaml()(content)
@@ -0,0 +1,81 @@
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, field_validator
+
+from templatr.formatter import DefaultFormatter
+
+
+class FormatterData(BaseModel):
+    """*Internal class that we use to describe and parse out the value we need to define a formatter for a variable.*
+
+    **Args**
+    - **cls (str)**: class of formatter we are trying to load.
+    - **args (list)**: arguments for the formatter we are loading.
+    - **kwargs (dict[str, Any])**: keyword arguments for the formatter we are loading.
+    - **cache (bool, int)**: When set, results of the formatter are cached by value in a `CachedFormatter`, an int sets how many results are kept. defaults to: `False`
+    """
+
+    cls: str
+    args: list = []
+    kwargs: Dict[str, Any] = {}
+    cache: Union[bool, int] = False
+
+    @field_validator("args", mode="before")
+    def _default_args(cls, args: Optional[list]):
+        """*field validator to default None args to empty list instead.*
+
+        **Args**
+        - **args (list, None)**: optional list that will be set to args.
+
+        **Returns**
+        - **(list)**: list value to set to args.
+        """
+        if args is None:
+            return []
+        return args
+
+    @field_validator("kwargs", mode="before")
+    def _default_kwargs(cls, kwargs: Optional[Dict[str, Any]]):
+        """*field validator for kwargs to default None to empty dict.*
+
+        **Args**
+        - **kwargs (dict, None)**: possibly none kwargs we will be parsing.
+
+        **Returns**
+        - **(dict)**: dict to use as kwargs.
+        """
+        if kwargs is None:
+            return {}
+        return kwargs
+
+
+class VariableData(BaseModel):
+    """*Data to define a template variable.*
+
+    **Args**
+    - **key (str)**: The key you will be using in the template text string.
+    - **path (str, list[str], None)**: The path you will be looking at in the data that is seperated by dots e.g. `field.nested.value`, or its parts when one contains a dot.
+    - **default (Any, None)**: The default value you will use in place of value if we cannot grab value from data.
+    - **formatter (FormatterData)**: The formatter data to define how we want to render the value for the variable.
+    """
+
+    key: str
+    path: Union[str, List[str], None] = None
+    default: Optional[Any] = None
+    formatter: FormatterData = FormatterData(
+        cls=DefaultFormatter.__name__,
+        args=[],
+        kwargs={},
+    )
+
+
+class TemplateData(BaseModel):
+    """*Data to define a template, validated once when the template is loaded.*
+
+    **Args**
+    - **variables (list[VariableData])**: definitions of the variables used by template.
+    - **text (str)**: String text that we are formatting against.
+    """
+
+    variables: List[VariableData]
+    text: str
@@ -0,0 +1,168 @@
+from collections import deque
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import os
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future
+
+    from templatr.records import MappedJsonl
+    from templatr.template import Template
+
+# chunks queued per worker so workers never wait on the parent to hand out more.
+CHUNKS_PER_WORKER = 2
+
+_worker_template: Optional["Template"] = None
+
+
+def _init_worker(
+    template: "Template",
+    compiled: bool,
+    output_cache: Optional[Tuple[int, Optional[int]]] = None,
+) -> None:
+    """*Runs once in each worker process to keep the template it was shipped around for every chunk.*"""
+    global _worker_template
+    if compiled:
+        template.compile()
+    if output_cache is not None:
+        template.enable_output_cache(*output_cache)
+    _worker_template = template
+
+
+def _format_chunk(
+    records: List[Any], return_exceptions: bool
+) -> List[Union[str, Exception]]:
+    return list(_worker_template.format_many(records, return_exceptions))
+
+
+def _format_range(
+    reader: "MappedJsonl", start: int, end: int, return_exceptions: bool
+) -> List[Union[str, Exception]]:
+    return list(
+        _worker_template.format_many(reader.read_range(start, end), return_exceptions)
+    )
+
+
+def _chunked(records: Iterable[Any], chunksize: int) -> Iterator[List[Any]]:
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def format_parallel(
+    template: "Template",
+    records: Iterable[Any],
+    workers: Optional[int] = None,
+    chunksize: int = 1000,
+    return_exceptions: bool = False,
+    mp_context: Any = None,
+) -> Iterator[Union[str, Exception]]:
+    """*Formats records across a pool of worker processes. The template is sent to each worker once when it starts and records are sent in chunks, only a few chunks per worker are in flight at a time so records are read as output is consumed.*
+
+    Templates, their formatters and records have to be picklable, custom formatters have to be importable by their dotted path in the worker processes.
+
+    **Args**
+    - **template (Template)**: template to format records with, compiled in the workers when it is compiled here and given an output cache of the same size in each worker when it has one here.
+    - **records (Iterable[Any])**: Sources of variables, one output is produced per record.
+    - **workers (int, None)**: number of worker processes. defaults to: `os.cpu_count()`
+    - **chunksize (int)**: number of records sent to a worker at a time. defaults to: `1000`
+    - **return_exceptions (bool)**: When True, a record that fails to format yields its exception in place of its output instead of raising. defaults to: `False`
+    - **mp_context (multiprocessing.context.BaseContext, None)**: multiprocessing context used to start the workers. defaults to: `None`
+
+    ***Raises***
+    - **MissingValue**: When a record is missing a value and return_exceptions is False.
+
+    **Returns**
+    - **(Iterator[str | Exception])**: formatted strings in the same order as records.
+    """
+    tasks = (
+        (_format_chunk, (chunk, return_exceptions))
+        for chunk in _chunked(records, chunksize)
+    )
+    return _run_ordered(template, tasks, workers, mp_context)
+
+
+def format_jsonl_parallel(
+    template: "Template",
+    path: str,
+    workers: Optional[int] = None,
+    chunk_bytes: int = 1 << 20,
+    return_exceptions: bool = False,
+    mp_context: Any = None,
+) -> Iterator[Union[str, Exception]]:
+    """*Formats every record of a jsonl file across a pool of worker processes. The file is split into byte ranges that end at line ends and only the ranges are sent, each worker memory maps the file and reads the records of its own ranges, keeping only the fields the template reads.*
+
+    **Args**
+    - **template (Template)**: template to format records with, sent to the workers like `format_parallel`.
+    - **path (str)**: path of the jsonl file.
+    - **workers (int, None)**: number of worker processes. defaults to: `os.cpu_count()`
+    - **chunk_bytes (int)**: about how many bytes of the file a worker reads at a time. defaults to: `1048576`
+    - **return_exceptions (bool)**: When True, a record that fails to format yields its exception in place of its output instead of raising. defaults to: `False`
+    - **mp_context (multiprocessing.context.BaseContext, None)**: multiprocessing context used to start the workers. defaults to: `None`
+
+    ***Raises***
+    - **InvalidRecord**: When a line is not valid json.
+    - **MissingValue**: When a record is missing a value and return_exceptions is False.
+
+    **Returns**
+    - **(Iterator[str | Exception])**: formatted strings in the same order as the lines of the file.
+    """
+    from templatr.records import MappedJsonl, record_fields
+
+    reader = MappedJsonl(path, record_fields(template))
+    ranges = reader.ranges(max(1, reader.size() // chunk_bytes))
+    tasks = (
+        (_format_range, (reader, start, end, return_exceptions))
+        for start, end in ranges
+    )
+    return _run_ordered(template, tasks, workers, mp_context)
+
+
+def _run_ordered(
+    template: "Template",
+    tasks: Iterator[Tuple[Callable[..., List[Any]], tuple]],
+    workers: Optional[int],
+    mp_context: Any,
+) -> Iterator[Any]:
+    """*Runs tasks in worker processes holding template, keeping only a few tasks per worker in flight, and yields their results in the order of the tasks.*"""
+    # imported here so importing templatr doesn't load multiprocessing.
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    compiled = template._compiled is not None
+    output_cache = template.output_cache
+    if output_cache is not None:
+        output_cache = (output_cache.max_entries, output_cache.max_bytes)
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(template, compiled, output_cache),
+    )
+    pending: Deque["Future"] = deque()
+    try:
+        for fn, args in islice(tasks, workers * CHUNKS_PER_WORKER):
+            pending.append(executor.submit(fn, *args))
+        while pending:
+            results = pending.popleft().result()
+            for fn, args in islice(tasks, 1):
+                pending.append(executor.submit(fn, *args))
+            yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,244 @@
+from string import Formatter
+from itertools import repeat
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+import re
+import _string  # C helpers backing string.Formatter, same parser str.format uses.
+
+from templatr.helpers import build_function
+
+_CONVERSIONS: Dict[Optional[str], Optional[Callable[[Any], str]]] = {
+    None: None,
+    "r": repr,
+    "s": str,
+    "a": ascii,
+}
+_CONVERSION_FLAGS = {repr: "!r", str: "!s", ascii: "!a"}
+# format specs made of these characters can be written into the f-string as is.
+_INLINE_SPEC = re.compile(r"[\w <>=^+\-#,.%]*")
+
+
+class Field(NamedTuple):
+    """*Replacement field parsed out of template text e.g. `{name.first!r:>10}`.*
+
+    **Args**
+    - **key (str)**: Name of the value the field reads from, `name` in the example above.
+    - **lookups (tuple[tuple[bool, str | int], ...])**: Attribute (`True`) or index (`False`) lookups applied to the value, `.first` in the example above.
+    - **conversion (Callable, None)**: Conversion applied before formatting, one of `repr`, `str`, `ascii`.
+    - **spec (str)**: Format spec passed to `format`, `>10` in the example above.
+    - **plain (bool)**: True when the field is a bare key with no lookups or conversion.
+    """
+
+    key: str
+    lookups: Tuple[Tuple[bool, Union[str, int]], ...]
+    conversion: Optional[Callable[[Any], str]]
+    spec: str
+    plain: bool
+
+    def render(self, values: Dict[str, Any]) -> str:
+        """*Renders the field the same way `str.format` would render it.*
+
+        **Args**
+        - **values (dict[str, Any])**: values keyed by the template key.
+
+        ***Raises***
+        - **KeyError**: When the key of the field is not in values.
+
+        **Returns**
+        - **(str)**: the formatted value.
+        """
+        return self.format_value(values[self.key])
+
+    def format_value(self, value: Any) -> str:
+        """*Applies the lookups, conversion and format spec of the field to the value it reads.*
+
+        **Args**
+        - **value (Any)**: value stored under the key of the field.
+
+        **Returns**
+        - **(str)**: the formatted value.
+        """
+        for is_attr, name in self.lookups:
+            value = getattr(value, name) if is_attr else value[name]
+        if self.conversion is not None:
+            value = self.conversion(value)
+        return format(value, self.spec)
+
+
+Segment = Union[str, Field]
+
+
+class ParsedText:
+    """*Template text tokenized once into literal segments and replacement fields so rendering does not re-parse the text.*
+
+    Text that cannot be tokenized ahead of time (positional fields, nested format specs, invalid conversions or malformed text) keeps `segments` as `None` and renders through `str.format` so output and errors stay identical.
+
+    **Args**
+    - **text (str)**: The template text that was parsed.
+    - **segments (tuple[str | Field, ...], None)**: literal strings and fields in order of appearance.
+    """
+
+    __slots__ = ("text", "segments", "_join")
+
+    def __init__(self, text: str, segments: Optional[Tuple[Segment, ...]]) -> None:
+        self.text = text
+        self.segments = segments
+        self._join: Optional[Callable[[Dict[str, Any]], str]] = None
+
+    def __reduce__(self):
+        # the generated join can't be pickled, it is rebuilt on first render.
+        return ParsedText, (self.text, self.segments)
+
+    @property
+    def fields(self) -> List[Field]:
+        """*Fields referenced by the text in order of appearance, empty when text could not be tokenized.*"""
+        if self.segments is None:
+            return []
+        return [segment for segment in self.segments if segment.__class__ is Field]
+
+    def render(self, values: Dict[str, Any]) -> str:
+        """*Joins the precomputed segments with the given values, through an f-string generated on first render.*
+
+        **Args**
+        - **values (dict[str, Any])**: values keyed by the template key.
+
+        ***Raises***
+        - **KeyError**: When text references a key that is not in values.
+
+        **Returns**
+        - **(str)**: Output identical to `text.format(**values)`.
+        """
+        join = self._join
+        if join is None:
+            if self.segments is None:
+                return self.text.format(**values)
+            join = self._join = _build_join(self.segments)
+        return join(values)
+
+    def render_columns(
+        self, columns: Dict[str, Sequence[Any]], rows: int
+    ) -> Iterator[str]:
+        """*Lazily renders one string per row from values stored column by column without building a dict per row.*
+
+        **Args**
+        - **columns (dict[str, Sequence[Any]])**: values keyed by the template key, one value per row.
+        - **rows (int)**: number of rows in columns.
+
+        ***Raises***
+        - **KeyError**: When text references a key that is not in columns.
+
+        **Returns**
+        - **(Iterator[str])**: Output identical to `text.format(**row)` for each row.
+        """
+        segments = self.segments
+        if segments is None:
+            keys = list(columns)
+            rows_values = zip(*columns.values()) if columns else repeat((), rows)
+            return (self.text.format(**dict(zip(keys, row))) for row in rows_values)
+        parts = []
+        for segment in segments:
+            if segment.__class__ is str:
+                parts.append(repeat(segment, rows))
+            elif segment.plain:
+                parts.append(map(format, columns[segment.key], repeat(segment.spec)))
+            else:
+                parts.append(map(segment.format_value, columns[segment.key]))
+        if not parts:
+            return repeat("", rows)
+        return map("".join, zip(*parts))
+
+
+def _field_format(
+    expression: str,
+    conversion: Optional[Callable[[Any], str]],
+    spec: str,
+    name: Callable[[str, Any], str],
+) -> str:
+    """*Returns the f-string replacement field formatting the expression like `str.format` formats a field, registering closure values through `name`.*"""
+    flag = _CONVERSION_FLAGS.get(conversion, "")
+    if not spec:
+        return f"{{{expression}{flag}}}"
+    if _INLINE_SPEC.fullmatch(spec):
+        return f"{{{expression}{flag}:{spec}}}"
+    if conversion is not None:
+        expression = f"{name('C', conversion)}({expression})"
+    return f"{{format({expression}, {name('S', spec)})}}"
+
+
+def _build_join(segments: Tuple[Segment, ...]) -> Callable[[Dict[str, Any]], str]:
+    """*Generates a function rendering the segments with a single f-string, so fields are formatted and joined by the interpreter instead of a loop over the segments.*"""
+    names: Dict[str, Any] = {}
+
+    def name(prefix: str, value: Any) -> str:
+        name = f"{prefix}{len(names)}"
+        names[name] = value
+        return name
+
+    parts = []
+    for segment in segments:
+        if segment.__class__ is str:
+            parts.append(f"{{{name('L', segment)}}}")
+            continue
+        if segment.lookups:
+            parts.append(f"{{{name('R', segment.render)}(values)}}")
+            continue
+        parts.append(
+            _field_format(
+                f"values[{name('K', segment.key)}]",
+                segment.conversion,
+                segment.spec,
+                name,
+            )
+        )
+    return build_function("values", [f'return f"{"".join(parts)}"'], names)
+
+
+def _parse_field(field_name: str, conversion: Optional[str], spec: str) -> Field:
+    key, rest = _string.formatter_field_name_split(field_name)
+    if not isinstance(key, str) or not key:
+        raise ValueError("positional fields are rendered by str.format")
+    if "{" in spec:
+        raise ValueError("nested format specs are rendered by str.format")
+    lookups = tuple(rest)
+    return Field(
+        key=key,
+        lookups=lookups,
+        conversion=_CONVERSIONS[conversion],
+        spec=spec,
+        plain=not lookups and conversion is None,
+    )
+
+
+def parse_text(text: str) -> ParsedText:
+    """*Tokenizes template text into literal segments and replacement fields.*
+
+    **Args**
+    - **text (str)**: template text in `str.format` syntax.
+
+    **Returns**
+    - **(ParsedText)**: parsed text, with `segments` set to `None` when the text has to be rendered by `str.format`.
+    """
+    segments: List[Segment] = []
+    try:
+        for literal, field_name, spec, conversion in Formatter().parse(text):
+            if literal:
+                if segments and segments[-1].__class__ is str:
+                    # escaped braces split literals, merge them back together
+                    segments[-1] += literal
+                else:
+                    segments.append(literal)
+            if field_name is not None:
+                segments.append(_parse_field(field_name, conversion, spec))
+    except (ValueError, KeyError):
+        return ParsedText(text, None)
+    return ParsedText(text, tuple(segments))
@@ -0,0 +1,243 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+import csv
+import io
+import mmap
+import os
+import sys
+
+from templatr.exceptions import InvalidRecord
+from templatr.loaders import _load_json, parse_json
+
+if TYPE_CHECKING:  # pragma: no cover
+    from templatr.template import Template
+
+# formats records can be read from, by extension of the input.
+FORMATS = ("jsonl", "csv")
+
+
+def read_jsonl(fp: IO[bytes], source: str = "<input>") -> Iterator[Any]:
+    """*Lazily reads one json document per line, blank lines are skipped.*
+
+    **Args**
+    - **fp (IO[bytes])**: binary file object to read lines from.
+    - **source (str)**: name of the input used in errors. defaults to: `"<input>"`
+
+    ***Raises***
+    - **InvalidRecord**: When a line is not valid json.
+
+    **Returns**
+    - **(Iterator[Any])**: the parsed documents.
+    """
+    for line_number, line in enumerate(fp, 1):
+        if line.isspace():
+            continue
+        try:
+            yield parse_json(line)
+        except ValueError as error:
+            raise InvalidRecord(source, line_number, str(error))
+
+
+def read_csv(fp: IO[str]) -> Iterator[Dict[str, Any]]:
+    """*Lazily reads rows of a csv file with a header row as dicts, columns named with dotted paths, e.g. `user.name`, are read into nested dicts so they resolve like json records.*
+
+    **Args**
+    - **fp (IO[str])**: text file object opened with `newline=""`.
+
+    **Returns**
+    - **(Iterator[dict[str, Any]])**: the rows.
+    """
+    reader = csv.reader(fp)
+    header = next(reader, None)
+    if header is None:
+        return
+    paths = [name.split(".") for name in header]
+    if all(len(path) == 1 for path in paths):
+        for row in reader:
+            yield dict(zip(header, row))
+        return
+    for row in reader:
+        record: Dict[str, Any] = {}
+        for path, value in zip(paths, row):
+            parent = record
+            for part in path[:-1]:
+                parent = parent.setdefault(part, {})
+            parent[path[-1]] = value
+        yield record
+
+
+def record_fields(template: "Template") -> Set[str]:
+    """*Top level fields of records the template reads, the only ones `MappedJsonl` keeps.*
+
+    **Args**
+    - **template (Template)**: template records are read for.
+
+    **Returns**
+    - **(set[str])**: first part of the path of every variable the text references.
+    """
+    return {variable._chain.path[0] for variable in template._used_variables}
+
+
+def _memoryview_loads() -> Callable[[memoryview], Any]:
+    """*json parser that reads memoryview slices, orjson parses them in place, other parsers are given a copy of the bytes.*"""
+    loads = _load_json()
+    if getattr(loads, "__module__", None) == "orjson":
+        return loads
+    return lambda line: loads(bytes(line))
+
+
+class MappedJsonl:
+    """*JSONL file read through a read only memory map. Records are parsed straight from `memoryview` slices of the map, so lines are never copied into bytes objects when orjson is installed, and can be read by byte range so parallel workers each map and read only their own slice of the file.*
+
+    **Args**
+    - **path (str)**: path of the jsonl file.
+    - **fields (Collection[str], None)**: top level fields kept from each record, e.g. `record_fields(template)`, the rest are dropped as soon as a record is parsed. Records that are not objects are kept whole. Every field is kept when None. defaults to: `None`
+    """
+
+    def __init__(self, path: str, fields: Optional[Collection[str]] = None) -> None:
+        self.path = path
+        self.fields = None if fields is None else tuple(fields)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.read_range(0, None)
+
+    def size(self) -> int:
+        """*Size of the file in bytes.*"""
+        return os.path.getsize(self.path)
+
+    def ranges(self, parts: int) -> List[Tuple[int, int]]:
+        """*Splits the file into at most parts byte ranges of about the same size, each ending at the end of a line.*
+
+        **Args**
+        - **parts (int)**: number of ranges wanted.
+
+        **Returns**
+        - **(list[tuple[int, int]])**: start and end offsets of the ranges, in order and covering the whole file.
+        """
+        size = self.size()
+        if size == 0:
+            return []
+        with open(self.path, "rb") as fp, mmap.mmap(
+            fp.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            ranges = []
+            start = 0
+            for part in range(1, parts):
+                end = mapped.find(b"\n", max(start, size * part // parts))
+                if end == -1:
+                    break
+                end += 1
+                if end > start:
+                    ranges.append((start, end))
+                    start = end
+            if start < size:
+                ranges.append((start, size))
+        return ranges
+
+    def read_range(self, start: int, end: Optional[int]) -> Iterator[Any]:
+        """*Lazily reads the records of the lines in a byte range, blank lines are skipped.*
+
+        **Args**
+        - **start (int)**: offset of the first line of the range.
+        - **end (int, None)**: offset after the last line of the range, the end of the file when None.
+
+        ***Raises***
+        - **InvalidRecord**: When a line is not valid json.
+
+        **Returns**
+        - **(Iterator[Any])**: the parsed records.
+        """
+        if self.size() == 0:
+            return
+        loads = _memoryview_loads()
+        fields = self.fields
+        with open(self.path, "rb") as fp, mmap.mmap(
+            fp.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            end = len(mapped) if end is None else end
+            view = memoryview(mapped)
+            try:
+                position = start
+                while position < end:
+                    line_start = position
+                    line_end = mapped.find(b"\n", position, end)
+                    if line_end == -1:
+                        line_end = end
+                    position = line_end + 1
+                    line = view[line_start:line_end]
+                    try:
+                        record = loads(line)
+                    except ValueError as error:
+                        if not len(line) or bytes(line).isspace():
+                            continue
+                        line_number = mapped[:line_start].count(b"\n") + 1
+                        raise InvalidRecord(self.path, line_number, str(error))
+                    finally:
+                        line.release()
+                    if fields is not None and isinstance(record, dict):
+                        record = {
+                            field: record[field] for field in fields if field in record
+                        }
+                    yield record
+            finally:
+                view.release()
+
+
+def input_format(path: str, default: str = "jsonl") -> str:
+    """*Format of an input by its extension, `.csv` files are csv and everything else is jsonl.*
+
+    **Args**
+    - **path (str)**: path of the input, `-` for stdin.
+    - **default (str)**: format of stdin. defaults to: `"jsonl"`
+
+    **Returns**
+    - **(str)**: `jsonl` or `csv`.
+    """
+    if path == "-":
+        return default
+    return "csv" if os.path.splitext(path)[1].lower() == ".csv" else "jsonl"
+
+
+def read_records(
+    paths: List[str],
+    format: Optional[str] = None,
+    fields: Optional[Collection[str]] = None,
+) -> Iterator[Any]:
+    """*Lazily reads the records of each input in turn, opening each one when the records before it are used up. jsonl files are read through `MappedJsonl`.*
+
+    **Args**
+    - **paths (list[str])**: paths of the inputs, `-` reads stdin.
+    - **format (str, None)**: `jsonl` or `csv`, by extension of each path when None. defaults to: `None`
+    - **fields (Collection[str], None)**: top level fields kept from the records of jsonl files, see `MappedJsonl`. defaults to: `None`
+
+    ***Raises***
+    - **InvalidRecord**: When a jsonl line is not valid json.
+
+    **Returns**
+    - **(Iterator[Any])**: the records.
+    """
+    for path in paths:
+        kind = format or input_format(path)
+        if path == "-":
+            if kind == "csv":
+                yield from read_csv(
+                    io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+                )
+            else:
+                yield from read_jsonl(sys.stdin.buffer, "<stdin>")
+        elif kind == "csv":
+            with open(path, encoding="utf-8", newline="") as fp:
+                yield from read_csv(fp)
+        else:
+            yield from MappedJsonl(path, fields)
@@ -0,0 +1,270 @@
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import hashlib
+import os
+import threading
+import time
+
+from templatr.exceptions import UnknownTemplate
+from templatr.loaders import parse_json, parse_yaml
+from templatr.template import Template
+
+# extensions of files that are indexed as templates, in order of precedence.
+EXTENSIONS = (".yaml", ".yml", ".json")
+
+
+class RegistryStats(NamedTuple):
+    """*Snapshot of how a TemplateRegistry has been used.*
+
+    **Args**
+    - **hits (int)**: lookups served by an already loaded template.
+    - **misses (int)**: lookups that had to load the template.
+    - **reloads (int)**: loaded templates that were parsed again because their file changed.
+    - **evictions (int)**: loaded templates dropped to stay within the configured bounds.
+    - **loaded (int)**: templates currently loaded.
+    - **loaded_bytes (int)**: size of the sources of the templates currently loaded.
+    """
+
+    hits: int
+    misses: int
+    reloads: int
+    evictions: int
+    loaded: int
+    loaded_bytes: int
+
+
+class _Entry:
+    __slots__ = ("template", "mtime_ns", "size", "digest", "checked_at")
+
+    def __init__(
+        self, template: Template, mtime_ns: int, size: int, digest: str
+    ) -> None:
+        self.template = template
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.checked_at = time.monotonic()
+
+
+class TemplateRegistry:
+    """*Thread-safe registry of the templates in a directory tree that only parses a template the first time it is used.*
+
+    Templates are named by their path relative to root without the extension, e.g. `tenant/welcome` for `root/tenant/welcome.yaml`. A loaded template is reloaded when the modification time or size of its file changes and the content hash differs, and the least recently used templates are evicted once the count or source size bounds are exceeded.
+
+    **Args**
+    - **root (str)**: directory the templates are stored under.
+    - **max_templates (int, None)**: most templates kept loaded at once, unbounded when None. defaults to: `None`
+    - **max_bytes (int, None)**: most bytes of template source kept loaded at once, unbounded when None. defaults to: `None`
+    - **check_interval (float)**: seconds between checks of a loaded template's file for changes, checked on every lookup when 0. defaults to: `1.0`
+    - **strict (bool)**: When True, a template whose text references keys that no variable defines raises UndeclaredFields when it is loaded. defaults to: `False`
+    - **intern (bool)**: When True, variables of every template loaded share one formatter instance per formatter definition, see `load_formatter`. defaults to: `False`
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_templates: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        check_interval: float = 1.0,
+        strict: bool = False,
+        intern: bool = False,
+    ) -> None:
+        self.root = root
+        self.max_templates = max_templates
+        self.max_bytes = max_bytes
+        self.check_interval = check_interval
+        self.strict = strict
+        self.intern = intern
+        self._lock = threading.RLock()
+        self._paths: Dict[str, str] = {}
+        self._loaded: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._loaded_bytes = 0
+        self._hits = self._misses = self._reloads = self._evictions = 0
+        self.refresh()
+
+    def refresh(self) -> None:
+        """*Rescans root for template files, only file names are read so no template is parsed.*"""
+        paths: Dict[str, str] = {}
+        for directory, _, files in os.walk(self.root):
+            for file in files:
+                stem, extension = os.path.splitext(file)
+                if extension not in EXTENSIONS:
+                    continue
+                path = os.path.join(directory, file)
+                name = os.path.relpath(os.path.join(directory, stem), self.root)
+                name = name.replace(os.sep, "/")
+                current = paths.get(name)
+                if current is None or _precedence(path) < _precedence(current):
+                    paths[name] = path
+        with self._lock:
+            self._paths = paths
+            for name in [name for name in self._loaded if name not in paths]:
+                self._unload(name)
+
+    def names(self) -> List[str]:
+        """*Names of every template indexed, loaded or not.*"""
+        with self._lock:
+            return sorted(self._paths)
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._paths
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._paths)
+
+    def __getitem__(self, name: str) -> Template:
+        return self.get(name)
+
+    @property
+    def stats(self) -> RegistryStats:
+        """*Snapshot of the hit, miss, reload and eviction counters.*"""
+        with self._lock:
+            return RegistryStats(
+                hits=self._hits,
+                misses=self._misses,
+                reloads=self._reloads,
+                evictions=self._evictions,
+                loaded=len(self._loaded),
+                loaded_bytes=self._loaded_bytes,
+            )
+
+    def get(self, name: str) -> Template:
+        """*Returns the template with the given name, loading it on first use and reloading it when its file changed. Files are read and parsed outside of the registry lock, so loading one template never blocks lookups of templates already loaded.*
+
+        **Args**
+        - **name (str)**: name of the template, its path relative to root without the extension.
+
+        ***Raises***
+        - **UnknownTemplate**: When there is no template file for name.
+        - **UndeclaredFields**: When strict and the template references keys that no variable defines.
+
+        **Returns**
+        - **(Template)**: the loaded template.
+        """
+        with self._lock:
+            entry = self._fresh(name)
+            if entry is not None:
+                return entry.template
+            path = self._path(name)
+            loading = self._loading.setdefault(name, threading.Lock())
+        # one thread loads or checks a name at a time, the others wait for it and use its result.
+        with loading:
+            with self._lock:
+                entry = self._fresh(name)
+                if entry is not None:
+                    return entry.template
+                entry = self._loaded.get(name)
+                if entry is None:
+                    self._misses += 1
+            if entry is None:
+                return self._load(name, path).template
+            return self._check(name, path, entry).template
+
+    def _fresh(self, name: str) -> Optional[_Entry]:
+        """*The loaded entry of name when it was checked within check_interval, counted as a hit.*"""
+        entry = self._loaded.get(name)
+        if entry is None or time.monotonic() - entry.checked_at >= self.check_interval:
+            return None
+        self._hits += 1
+        self._loaded.move_to_end(name)
+        return entry
+
+    def _path(self, name: str) -> str:
+        path = self._paths.get(name)
+        if path is not None:
+            return path
+        if ".." not in name.split("/"):
+            # file may have been added since root was scanned.
+            for extension in EXTENSIONS:
+                candidate = os.path.join(self.root, *name.split("/")) + extension
+                if os.path.isfile(candidate):
+                    self._paths[name] = candidate
+                    return candidate
+        raise UnknownTemplate(name)
+
+    def _missing(self, name: str) -> UnknownTemplate:
+        """*Forgets a template whose file was removed.*"""
+        with self._lock:
+            self._unload(name)
+            self._paths.pop(name, None)
+        return UnknownTemplate(name)
+
+    def _read(self, name: str, path: str) -> Tuple[os.stat_result, bytes]:
+        try:
+            stat = os.stat(path)
+            with open(path, "rb") as fp:
+                return stat, fp.read()
+        except FileNotFoundError:
+            raise self._missing(name)
+
+    def _load(self, name: str, path: str) -> _Entry:
+        stat, content = self._read(name, path)
+        return self._store(
+            name, path, stat, content, hashlib.sha256(content).hexdigest()
+        )
+
+    def _store(
+        self, name: str, path: str, stat: os.stat_result, content: bytes, digest: str
+    ) -> _Entry:
+        entry = _Entry(
+            template=_parse(path, content, self.strict, self.intern),
+            mtime_ns=stat.st_mtime_ns,
+            size=len(content),
+            digest=digest,
+        )
+        with self._lock:
+            self._unload(name)
+            self._loaded[name] = entry
+            self._loaded_bytes += entry.size
+            self._evict()
+        return entry
+
+    def _check(self, name: str, path: str, entry: _Entry) -> _Entry:
+        """*Reloads the template when its file changed since it was loaded.*"""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise self._missing(name)
+        if (stat.st_mtime_ns, stat.st_size) != (entry.mtime_ns, entry.size):
+            stat, content = self._read(name, path)
+            digest = hashlib.sha256(content).hexdigest()
+            if digest != entry.digest:
+                with self._lock:
+                    self._reloads += 1
+                return self._store(name, path, stat, content, digest)
+            # touched without changing, keep the template we have.
+            entry.mtime_ns = stat.st_mtime_ns
+        with self._lock:
+            entry.checked_at = time.monotonic()
+            self._hits += 1
+            if name in self._loaded:
+                self._loaded.move_to_end(name)
+        return entry
+
+    def _unload(self, name: str) -> None:
+        entry = self._loaded.pop(name, None)
+        if entry is not None:
+            self._loaded_bytes -= entry.size
+
+    def _evict(self) -> None:
+        # the most recently used template is always kept, even when it is over the bounds alone.
+        while len(self._loaded) > 1 and (
+            (self.max_templates is not None and len(self._loaded) > self.max_templates)
+            or (self.max_bytes is not None and self._loaded_bytes > self.max_bytes)
+        ):
+            name = next(iter(self._loaded))
+            self._unload(name)
+            self._evictions += 1
+
+
+def _precedence(path: str) -> Tuple[int, str]:
+    return EXTENSIONS.index(os.path.splitext(path)[1]), path
+
+
+def _parse(path: str, content: bytes, strict: bool, intern: bool = False) -> Template:
+    if path.endswith(".json"):
+        return Template.from_dict(parse_json(content), strict=strict, intern=intern)
+    return Template.from_dict(parse_yaml(content), strict=strict, intern=intern)
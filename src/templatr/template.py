@@ -1,13 +1,59 @@
-from typing import Any, Dict, List, Optional, TypedDict
+from contextlib import contextmanager
+from time import perf_counter_ns, time_ns
+import inspect
+import io
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypedDict,
+    Union,
+)
 
-from pydantic import BaseModel
-from yaml import safe_load
-
-from templatr.exceptions import UnsupportedSource
-from templatr.helpers import DictObjectView
+from templatr.analysis import TemplateAnalysis, analyze_template, used_variables
+from templatr.accessors import PathTrie
+from templatr.cache import OutputCache
+from templatr.compiler import compile_template
+from templatr.exceptions import (
+    MismatchedColumns,
+    MissingValue,
+    UndeclaredFields,
+    UnsupportedSource,
+)
+from templatr.formatter import ChunkedValue
+from templatr.incremental import IncrementalRender
+from templatr.instrumentation import (
+    MISSING,
+    Instrument,
+    RenderRecord,
+    VariableRecord,
+)
+from templatr.loaders import parse_json, parse_yaml, read_source
+from templatr.parallel import format_parallel
+from templatr.parser import ParsedText, parse_text
 
 from .variable import Variable
 
+if TYPE_CHECKING:  # pragma: no cover
+    from templatr.models import TemplateData
+
+
+def __getattr__(name: str) -> Any:
+    # imported on first use so rendering never loads pydantic.
+    if name == "TemplateData":
+        from templatr.models import TemplateData
+
+        return TemplateData
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class FormatterDict(TypedDict):
     cls: str
@@ -17,8 +63,8 @@ class FormatterDict(TypedDict):
 
 class VariableDict(TypedDict):
     key: str
-    path: Optional[str]
-    default: Optional[str]
+    path: Union[str, List[str], None]
+    default: Optional[Any]
     formatter: FormatterDict
 
 
@@ -27,16 +73,195 @@ class TemplateDict(TypedDict):
     text: str
 
 
-class Template(BaseModel):
+class Template:
     """*Template that can be given a dict or object to pull values from.*
 
+    Templates are plain objects, definitions are validated by `TemplateData` when loaded with `from_dict` and the template keeps only what rendering needs. What it derives from its text and variables is rebuilt when either is assigned or a variable changes, assign a new list rather than changing `variables` in place.
+
     **Args**
-    - **variables (list[Variable])**: List of variables used by template.
+    - **variables (list[Variable])**: List of variables used by template, dicts are taken as the arguments of a Variable.
     - **text (str)**: String text that we are formatting against.
     """
 
-    variables: List[Variable]
-    text: str
+    __slots__ = (
+        "variables",
+        "text",
+        "_parsed_text",
+        "_used",
+        "_trie",
+        "_compiled",
+        "_output_cache",
+        "_instrument",
+        "_hooked",
+        "__weakref__",
+    )
+
+    def __init__(
+        self, variables: Iterable[Union[Variable, Mapping[str, Any]]], text: str
+    ) -> None:
+        object.__setattr__(self, "_output_cache", None)
+        object.__setattr__(self, "_instrument", None)
+        self.variables = [
+            Variable(**variable) if isinstance(variable, Mapping) else variable
+            for variable in variables
+        ]
+        self.text = text
+        # tokenize and prune up front so the first render doesn't pay for it.
+        self._used_variables
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name not in ("variables", "text"):
+            return
+        if name == "variables":
+            for variable in value:
+                variable._add_owner(self)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """*Drops state derived from the text and variables, it is rebuilt on next use. Called when either is assigned and when a variable of the template changes.*"""
+        object.__setattr__(self, "_parsed_text", None)
+        object.__setattr__(self, "_used", None)
+        object.__setattr__(self, "_trie", None)
+        object.__setattr__(self, "_compiled", None)
+        if self._output_cache is not None:
+            self._output_cache.clear()
+        self._hook()
+
+    def __eq__(self, value: object) -> bool:
+        if type(value) is not type(self):
+            return NotImplemented
+        return value.text == self.text and value.variables == self.variables
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(variables={self.variables!r}, text={self.text!r})"
+        )
+
+    def __reduce__(self):
+        # derived state holds generated functions that can't be pickled, it is rebuilt on next use.
+        return (type(self), (self.variables, self.text))
+
+    @property
+    def _parsed(self) -> ParsedText:
+        """*Text of the template tokenized into segments, parsed once per template.*"""
+        parsed = self._parsed_text
+        if parsed is None:
+            parsed = self._parsed_text = parse_text(self.text)
+        return parsed
+
+    @property
+    def _used_variables(self) -> List[Variable]:
+        """*Variables the text references, the only ones resolved and formatted when rendering.*"""
+        used = self._used
+        if used is None:
+            used = self._used = used_variables(self)
+        return used
+
+    @property
+    def _paths(self) -> PathTrie:
+        """*Paths of the used variables merged on their shared prefixes, so each prefix is read from the data once per render.*"""
+        trie = self._trie
+        if trie is None:
+            trie = self._trie = PathTrie(
+                [variable._chain.path for variable in self._used_variables]
+            )
+        return trie
+
+    def compile(self) -> Callable[[Any], str]:
+        """*Generates a python function specialized to this template and uses it for every following call to `format`. Assigning `text` or `variables`, or changing one of the variables, drops the function, call again afterwards to regenerate it.*
+
+        **Returns**
+        - **(Callable[[Any], str])**: the generated function, takes the data and returns the formatted string.
+        """
+        compiled = self._compiled = compile_template(self)
+        return compiled
+
+    def enable_output_cache(
+        self, max_entries: int = 1024, max_bytes: Optional[int] = None
+    ) -> OutputCache:
+        """*Caches rendered output by the formatted values of the variables, so records that format to the same values, e.g. everyone getting the same announcement, return the output rendered before. Used by `format`, `format_many` and `format_parallel`, where identical records in a batch are only rendered once.*
+
+        Variables are still resolved and formatted for every record, only building the output is skipped. Assigning `text` or `variables`, or changing one of the variables, empties the cache.
+
+        **Args**
+        - **max_entries (int)**: most outputs kept. defaults to: `1024`
+        - **max_bytes (int, None)**: most memory used by the outputs kept and the values they are keyed by, unbounded when None. defaults to: `None`
+
+        **Returns**
+        - **(OutputCache)**: the cache, see its `stats`.
+        """
+        output_cache = self._output_cache = OutputCache(max_entries, max_bytes)
+        self._hook()
+        return output_cache
+
+    def disable_output_cache(self) -> None:
+        """*Stops caching rendered output and drops the outputs cached.*"""
+        self._output_cache = None
+        self._hook()
+
+    @property
+    def output_cache(self) -> Optional[OutputCache]:
+        """*Cache of rendered output, None unless `enable_output_cache` was called.*"""
+        return self._output_cache
+
+    def instrument(self, instrument: Optional[Instrument]) -> Optional[Instrument]:
+        """*Attaches an instrument that is given a `RenderRecord` with the resolve and formatter time of every variable, defaulted and missing variables, interpolation time and output size of each render by `format` and `format_many`. None detaches it.*
+
+        Instrumented renders resolve each variable on its own so time can be attributed to it, paths sharing a prefix read it once per variable. Templates without an instrument don't pay anything for it.
+
+        **Args**
+        - **instrument (Instrument, None)**: instrument to attach, e.g. a `LoggingInstrument` or `SpanInstrument`.
+
+        **Returns**
+        - **(Instrument, None)**: the instrument attached before.
+        """
+        previous = self._instrument
+        self._instrument = instrument
+        self._hook()
+        return previous
+
+    @contextmanager
+    def instrumented(self, instrument: Instrument) -> Iterator[Instrument]:
+        """*Context manager attaching instrument for the renders within it, the instrument attached before is restored on exit.*
+
+        **Args**
+        - **instrument (Instrument)**: instrument to attach.
+
+        **Returns**
+        - **(Iterator[Instrument])**: the instrument.
+        """
+        previous = self.instrument(instrument)
+        try:
+            yield instrument
+        finally:
+            self.instrument(previous)
+
+    def _hook(self) -> None:
+        """*Builds the render function `format` hands over to while an output cache or instrument is enabled.*"""
+        self._hooked = None
+        if self._output_cache is not None or self._instrument is not None:
+            self._hooked = self._renderer()
+
+    def analyze(self) -> TemplateAnalysis:
+        """*Reports the variables the text never references, the fields of the text no variable defines and the data paths read when rendering.*
+
+        **Returns**
+        - **(TemplateAnalysis)**: the analysis of this template.
+        """
+        return analyze_template(self)
+
+    def check(self) -> None:
+        """*Checks every field of the text has a variable, so a template that would raise KeyError on every render fails when it is loaded instead.*
+
+        ***Raises***
+        - **UndeclaredFields**: When the text references keys that no variable defines.
+        """
+        undeclared = self.analyze().undeclared_fields
+        if undeclared:
+            raise UndeclaredFields(undeclared)
 
     def format(self, data: Any) -> str:
         """*Takes in data that will then be applied to the template to create the output string.*
@@ -47,67 +272,521 @@ class Template(BaseModel):
         **Returns**
         - **(str)**: String text with data that we formatted into it.
         """
+        hooked = self._hooked
+        if hooked is not None:
+            return hooked(data)
+
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled(data)
+
+        # every path is resolved before any default or formatter is applied, missing values still raise in the order of the variables.
         final_values = {
-            variable.key: variable.resolve(data) for variable in self.variables
+            variable.key: variable.formatter(variable._default_for(value))
+            for variable, value in zip(self._used_variables, self._paths.resolve(data))
+        }
+
+        return self._parsed.render(final_values)
+
+    def incremental(self, data: Any) -> IncrementalRender:
+        """*Renders the template into a handle that keeps its output up to date with `update(data, changed_paths)`, only resolving and formatting the variables reading the changed paths, e.g. for a live view of state that changes a field at a time.*
+
+        **Args**
+        - **data (Any)**: Source of variables we will be puling from.
+
+        ***Raises***
+        - **MissingValue**: When a value could not be determined for a variable and no default has been set.
+
+        **Returns**
+        - **(IncrementalRender)**: the handle, its `output` is the output of `format`.
+        """
+        return IncrementalRender(self, data)
+
+    def iter_chunks(self, data: Any) -> Iterator[str]:
+        """*Lazily renders the template as a sequence of strings, the literal text between fields and each formatted value in order, so the whole output is never built as one string.*
+
+        Every value is resolved and defaulted before the first chunk, so missing values raise before anything is produced. Formatters run when their first field is reached and their output is only kept when the text references it again. A `ChunkedValue` returned by a formatter is written chunk by chunk where the field has no conversion or format spec.
+
+        **Args**
+        - **data (Any)**: Source of variables we will be puling from.
+
+        ***Raises***
+        - **MissingValue**: When a value could not be determined for a variable and no default has been set.
+        - **KeyError**: When the text references a key that no variable defines.
+
+        **Returns**
+        - **(Iterator[str])**: chunks that join into the same output as `format`.
+        """
+        values = {
+            variable.key: (variable, variable._default_for(value))
+            for variable, value in zip(self._used_variables, self._paths.resolve(data))
+        }
+        segments = self._parsed.segments
+        if segments is None:
+            yield self._parsed.render(
+                {
+                    key: variable.formatter(value)
+                    for key, (variable, value) in values.items()
+                }
+            )
+            return
+
+        seen = set()
+        repeated = set()
+        for field in self._parsed.fields:
+            if field.key not in values:
+                raise KeyError(field.key)
+            if field.key in seen:
+                repeated.add(field.key)
+            seen.add(field.key)
+
+        formatted: Dict[str, Any] = {}
+        for segment in segments:
+            if segment.__class__ is str:
+                yield segment
+                continue
+            key = segment.key
+            if key in formatted:
+                value = formatted[key]
+            else:
+                variable, value = values[key]
+                value = variable.formatter(value)
+                if key in repeated:
+                    if isinstance(value, ChunkedValue):
+                        # chunks may read items that can only be read once, keep them as a string.
+                        value = str(value)
+                    formatted[key] = value
+            if segment.plain:
+                if not segment.spec and isinstance(value, ChunkedValue):
+                    yield from value
+                    continue
+                yield format(value, segment.spec)
+            else:
+                yield segment.format_value(value)
+
+    def render_to(
+        self,
+        data: Any,
+        fp: Any,
+        encoding: str = "utf-8",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    ) -> int:
+        """*Writes the rendered template to a text or binary stream chunk by chunk, see `iter_chunks`. Small chunks are gathered up to buffer_size before each write, so memory stays bounded by the largest value instead of the whole output.*
+
+        **Args**
+        - **data (Any)**: Source of variables we will be puling from.
+        - **fp (IO)**: writable stream, binary streams are written the output encoded with encoding.
+        - **encoding (str)**: encoding used for binary streams. defaults to: `"utf-8"`
+        - **buffer_size (int)**: characters gathered before writing to fp. defaults to: `io.DEFAULT_BUFFER_SIZE`
+
+        ***Raises***
+        - **MissingValue**: When a value could not be determined for a variable and no default has been set.
+
+        **Returns**
+        - **(int)**: number of characters written to a text stream, or bytes to a binary stream.
+        """
+        binary = _is_binary(fp)
+        written = 0
+        parts: List[str] = []
+        size = 0
+        for chunk in self.iter_chunks(data):
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= buffer_size:
+                written += _write(fp, "".join(parts), binary, encoding)
+                parts.clear()
+                size = 0
+        if parts:
+            written += _write(fp, "".join(parts), binary, encoding)
+        return written
+
+    async def aformat(self, data: Any, concurrency: Optional[int] = None) -> str:
+        """*Formats data like `format` but awaits values at the end of a variable path that are awaitable and formatters that are coroutines. Variables that need awaiting are resolved concurrently, the rest are formatted inline.*
+
+        **Args**
+        - **data (Any)**: Source of variables we will be puling from.
+        - **concurrency (int, None)**: Maximum number of variables awaited at once, unbounded when None. defaults to: `None`
+
+        ***Raises***
+        - **MissingValue**: When a value could not be determined for a variable and no default has been set.
+
+        **Returns**
+        - **(str)**: String text with data that we formatted into it.
+        """
+        values: List[Any] = []
+        # awaitable values, formatted once they are awaited.
+        awaitable_values: Dict[int, Awaitable[Any]] = {}
+        # results of formatters that are coroutines.
+        awaitable_results: Dict[int, Awaitable[Any]] = {}
+        variables = self._used_variables
+        try:
+            resolved = self._paths.resolve(data)
+            for index, (variable, value) in enumerate(zip(variables, resolved)):
+                value = variable._default_for(value)
+                if inspect.isawaitable(value):
+                    awaitable_values[index] = value
+                else:
+                    value = variable.formatter(value)
+                    if inspect.isawaitable(value):
+                        awaitable_results[index] = value
+                values.append(value)
+        except BaseException:
+            # nothing will await the coroutines formatters already started.
+            for awaitable in awaitable_results.values():
+                if inspect.iscoroutine(awaitable):
+                    awaitable.close()
+            raise
+
+        pending = {
+            index: variables[index]._aformat(value)
+            for index, value in awaitable_values.items()
         }
+        pending.update(awaitable_results)
+        if pending:
+            results = await _gather(list(pending.values()), concurrency)
+            for index, result in zip(pending, results):
+                values[index] = result
+
+        return self._parsed.render(
+            {variable.key: value for variable, value in zip(variables, values)}
+        )
+
+    def _renderer(self) -> Callable[[Any], str]:
+        """*Returns a function rendering a single record with all per template lookups done up front.*"""
+        output_cache = self._output_cache
+        instrument = self._instrument
+        if instrument is not None:
+            return self._instrumented_renderer(instrument, output_cache)
+        compiled = self._compiled
+        if compiled is not None and output_cache is None:
+            return compiled
+
+        finishers = [
+            (variable.key, variable._finisher()) for variable in self._used_variables
+        ]
+        resolve = self._paths.resolve
+        render = self._parsed.render
+
+        if output_cache is not None:
+            keys = [key for key, _ in finishers]
+            finishes = [finish for _, finish in finishers]
+            render_cached = output_cache.render
+
+            def render_data_cached(data: Any) -> str:
+                values = tuple(
+                    [finish(value) for finish, value in zip(finishes, resolve(data))]
+                )
+                return render_cached(keys, values, render)
+
+            return render_data_cached
+
+        def render_data(data: Any) -> str:
+            return render(
+                {
+                    key: finish(value)
+                    for (key, finish), value in zip(finishers, resolve(data))
+                }
+            )
+
+        return render_data
+
+    def _instrumented_renderer(
+        self, instrument: Instrument, output_cache: Optional[OutputCache]
+    ) -> Callable[[Any], str]:
+        """*Returns a function rendering a single record that times each step and hands the record of the render to instrument.*"""
+        template = self
+        variables = self._used_variables
+        keys = [variable.key for variable in variables]
+        render = self._parsed.render
+        record = instrument.record
+        if output_cache is None:
+
+            def interpolate(values: List[Any]) -> str:
+                return render(dict(zip(keys, values)))
+
+        else:
+            render_cached = output_cache.render
+
+            def interpolate(values: List[Any]) -> str:
+                return render_cached(keys, tuple(values), render)
+
+        def render_data(data: Any) -> str:
+            start_time = time_ns()
+            start = perf_counter_ns()
+            records: List[VariableRecord] = []
+            values: List[Any] = []
+            output = None
+            error = None
+            interpolate_ns = 0
+            try:
+                for variable in variables:
+                    try:
+                        value, measured = variable.measure(data, start)
+                    except MissingValue:
+                        offset = perf_counter_ns() - start
+                        records.append(
+                            VariableRecord(variable.key, offset, 0, 0, MISSING)
+                        )
+                        raise
+                    values.append(value)
+                    records.append(measured)
+                interpolated = perf_counter_ns()
+                output = interpolate(values)
+                interpolate_ns = perf_counter_ns() - interpolated
+                return output
+            except BaseException as exc:
+                error = exc
+                raise
+            finally:
+                record(
+                    RenderRecord(
+                        template=template,
+                        start_time_ns=start_time,
+                        duration_ns=perf_counter_ns() - start,
+                        interpolate_ns=interpolate_ns,
+                        variables=records,
+                        output_size=0 if output is None else len(output),
+                        error=error,
+                    )
+                )
+
+        return render_data
+
+    def format_many(
+        self, records: Iterable[Any], return_exceptions: bool = False
+    ) -> Iterator[Union[str, Exception]]:
+        """*Lazily formats each record, only holding one record and its output at a time so it can be used over streams of any length.*
+
+        **Args**
+        - **records (Iterable[Any])**: Sources of variables, one output is produced per record.
+        - **return_exceptions (bool)**: When True, a record that fails to format yields its exception in place of its output instead of raising. defaults to: `False`
+
+        ***Raises***
+        - **MissingValue**: When a record is missing a value and return_exceptions is False.
+
+        **Returns**
+        - **(Iterator[str | Exception])**: formatted strings in the same order as records.
+        """
+        render = self._renderer()
+        if not return_exceptions:
+            return map(render, records)
+        return _render_safely(render, records)
+
+    def format_parallel(
+        self,
+        records: Iterable[Any],
+        workers: Optional[int] = None,
+        chunksize: int = 1000,
+        return_exceptions: bool = False,
+    ) -> Iterator[Union[str, Exception]]:
+        """*Formats records across a pool of worker processes, see `templatr.parallel.format_parallel`.*
+
+        **Args**
+        - **records (Iterable[Any])**: Sources of variables, one output is produced per record.
+        - **workers (int, None)**: number of worker processes. defaults to: `os.cpu_count()`
+        - **chunksize (int)**: number of records sent to a worker at a time. defaults to: `1000`
+        - **return_exceptions (bool)**: When True, a record that fails to format yields its exception in place of its output instead of raising. defaults to: `False`
+
+        ***Raises***
+        - **MissingValue**: When a record is missing a value and return_exceptions is False.
+
+        **Returns**
+        - **(Iterator[str | Exception])**: formatted strings in the same order as records.
+        """
+        return format_parallel(
+            self,
+            records,
+            workers=workers,
+            chunksize=chunksize,
+            return_exceptions=return_exceptions,
+        )
+
+    def format_columns(self, columns: Any) -> Iterator[str]:
+        """*Formats data stored column by column instead of one record per row. Each variable is matched to its column once and formatted a column at a time, so no dict is built per row.*
+
+        **Args**
+        - **columns (Mapping[str, Sequence] | numpy structured array)**: columns of data keyed by column name, or a NumPy structured/record array. Columns are matched by the dotted path of each variable.
+
+        ***Raises***
+        - **MismatchedColumns**: When columns do not all have the same number of rows.
+        - **MissingValue**: When a row has no value for a variable and no default has been set.
+
+        **Returns**
+        - **(Iterator[str])**: formatted strings, one per row.
+        """
+        columns = _as_columns(columns)
+        lengths = {name: len(column) for name, column in columns.items()}
+        if len(set(lengths.values())) > 1:
+            raise MismatchedColumns(lengths)
+        rows = next(iter(lengths.values()), 0)
 
-        return self.text.format(**final_values)
+        values = {
+            variable.key: variable.resolve_column(columns, rows)
+            for variable in self._used_variables
+        }
+        return self._parsed.render_columns(values, rows)
 
     @classmethod
-    def from_dict(cls, data: TemplateDict):
+    def from_dict(cls, data: TemplateDict, strict: bool = False, intern: bool = False):
         """*Class method to be able to construct a template from a given dict that matches its structure that will parse variables into proper classes dynamically.*
 
         **Args**
         - **data (dict)**: template as a dict that defines variables and text to format against.
+        - **strict (bool)**: When True, checks every field of the text has a variable. defaults to: `False`
+        - **intern (bool)**: When True, variables share one formatter instance per formatter definition, see `load_formatter`. defaults to: `False`
+
+        ***Raises***
+        - **UndeclaredFields**: When strict and the text references keys that no variable defines.
 
         **Returns**
         - (Template): The template we were able to create from the given info.
         """
-        data = DictObjectView(data)
+        from templatr.models import TemplateData
+
+        template = cls.from_data(TemplateData.model_validate(data), intern=intern)
+        if strict:
+            template.check()
+        return template
+
+    @classmethod
+    def from_data(cls, data: "TemplateData", intern: bool = False):
+        """*Creates a template from its validated definition.*
+
+        **Args**
+        - **data (TemplateData)**: definition of the template.
+        - **intern (bool)**: When True, variables share one formatter instance per formatter definition, see `load_formatter`. defaults to: `False`
+
+        **Returns**
+        - **(Template)**: Template for the definition.
+        """
         return cls(
-            variables=[Variable.from_dict(variable) for variable in data.variables],
+            variables=[
+                Variable.from_data(variable, intern=intern)
+                for variable in data.variables
+            ],
             text=data.text,
         )
 
+    def to_data(self) -> "TemplateData":
+        """*Definition of the template, `from_data` creates an equal template from it.*
+
+        **Returns**
+        - **(TemplateData)**: definition of the template.
+        """
+        from templatr.models import TemplateData
+
+        return TemplateData(
+            variables=[variable.to_data() for variable in self.variables],
+            text=self.text,
+        )
+
+    def to_dict(self) -> TemplateDict:
+        """*Dict definition of the template, the inverse of `from_dict`, e.g. to write it out as YAML or JSON.*
 
-def load_yaml_template(path: Any) -> Template:
+        **Returns**
+        - **(dict)**: dict definition of the template.
+        """
+        return self.to_data().model_dump()
+
+
+def _as_columns(columns: Any) -> Mapping[str, Sequence[Any]]:
+    """*Reads the columns out of numpy structured arrays as lists of python values, other mappings are used as is.*"""
+    names = getattr(getattr(columns, "dtype", None), "names", None)
+    if names:
+        return {name: columns[name].tolist() for name in names}
+    return columns
+
+
+async def _gather(awaitables: List[Awaitable[Any]], concurrency: Optional[int]):
+    """*Awaits all awaitables concurrently, at most concurrency at a time, cancelling the rest when one fails.*"""
+    # imported here as it is only needed by aformat and costs more to import than the rest of the package.
+    import asyncio
+
+    if concurrency is not None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(awaitable: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await awaitable
+
+        awaitables = [bounded(awaitable) for awaitable in awaitables]
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _is_binary(fp: Any) -> bool:
+    """*Whether fp takes bytes, streams that aren't io streams are written text unless opened in a binary mode.*"""
+    if isinstance(fp, io.TextIOBase):
+        return False
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    mode = getattr(fp, "mode", "")
+    return isinstance(mode, str) and "b" in mode
+
+
+def _write(fp: Any, text: str, binary: bool, encoding: str) -> int:
+    if binary:
+        content = text.encode(encoding)
+        fp.write(content)
+        return len(content)
+    fp.write(text)
+    return len(text)
+
+
+def _render_safely(
+    render: Callable[[Any], str], records: Iterable[Any]
+) -> Iterator[Union[str, Exception]]:
+    for record in records:
+        try:
+            yield render(record)
+        except Exception as exc:
+            yield exc
+
+
+def load_yaml_template(
+    path: Any, strict: bool = False, intern: bool = False
+) -> Template:
     """*Loads yaml file as template object for you automatically.*
 
     **Args**
     - **path (str, IO)**: source of yaml content to format and parse into Template object
+    - **strict (bool)**: When True, checks every field of the text has a variable. defaults to: `False`
+    - **intern (bool)**: When True, variables share one formatter instance per formatter definition, see `load_formatter`. defaults to: `False`
 
     ***Raises***
     - **UnsupportedSource**: Failed to parse yaml into template
+    - **UndeclaredFields**: When strict and the text references keys that no variable defines.
 
     **Returns**
     - **(Template)**: template that was parsed.
     """
-    if isinstance(path, str):
-        with open(path, "r") as fp:
-            return Template.from_dict(safe_load(fp))
-    try:
-        return Template.from_dict(safe_load(path))
-    except AttributeError:
-        raise UnsupportedSource(type(path))
+    return Template.from_dict(
+        parse_yaml(read_source(path)), strict=strict, intern=intern
+    )
 
 
-def load_json_template(path: Any) -> Template:
+def load_json_template(
+    path: Any, strict: bool = False, intern: bool = False
+) -> Template:
     """*Loads json file as template for you automatically.*
 
     **Args**
     - **path (str, IO)**: Source of json to parse.
+    - **strict (bool)**: When True, checks every field of the text has a variable. defaults to: `False`
+    - **intern (bool)**: When True, variables share one formatter instance per formatter definition, see `load_formatter`. defaults to: `False`
 
     ***Raises***
     - **UnsupportedSource**: Failed to parse json into template.
+    - **UndeclaredFields**: When strict and the text references keys that no variable defines.
 
     **Returns**
     - **(Template)**: template that was parsed.
     """
-    if isinstance(path, str):
-        with open(path, "r") as fp:
-            return Template.from_dict(safe_load(fp))
-
-    try:
-        return Template.from_dict(safe_load(path))
-    except AttributeError:
-        raise UnsupportedSource(type(path))
+    return Template.from_dict(
+        parse_json(read_source(path)), strict=strict, intern=intern
+    )
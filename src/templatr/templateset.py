@@ -0,0 +1,95 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
+
+from templatr.accessors import PathTrie
+from templatr.template import Template, _render_safely
+from templatr.variable import Variable
+
+
+def _same_value(first: Variable, second: Variable) -> bool:
+    """*Whether two variables always produce the same formatted value from the same data.*"""
+    if first._chain.path != second._chain.path:
+        return False
+    # 1, 1.0 and True are equal but format differently.
+    if type(first.default) is not type(second.default) or not (
+        first.default == second.default
+    ):
+        return False
+    # equal formatters may still be configured differently, formatters that don't compare their arguments are only equal by type.
+    return first.formatter is second.formatter
+
+
+class TemplateSet:
+    """*Several templates rendered from the same data, e.g. the subject, bodies and sms of a notification. Variables of the members that read the same path with the same default and the same formatter instance are resolved and formatted once per record, and every member is rendered from the shared values. Load the members with `intern=True` to share one formatter instance between variables defining the same formatter.*
+
+    The set is built from the variables and text of the members when it is created, create a new set after changing a member. Members are rendered from their text, output caches and instruments attached to them are not used.
+
+    **Args**
+    - **templates (Mapping[str, Template])**: members of the set by name.
+    """
+
+    def __init__(self, templates: Mapping[str, Template]) -> None:
+        self.templates = dict(templates)
+        distinct: List[Variable] = []
+        members: List[
+            Tuple[str, Callable[[Dict[str, Any]], str], List[Tuple[str, int]]]
+        ] = []
+        for name, template in self.templates.items():
+            keys = []
+            for variable in template._used_variables:
+                for index, shared in enumerate(distinct):
+                    if _same_value(shared, variable):
+                        break
+                else:
+                    index = len(distinct)
+                    distinct.append(variable)
+                keys.append((variable.key, index))
+            members.append((name, template._parsed.render, keys))
+        self._variables = distinct
+        self._members = members
+        self._paths = PathTrie([variable._chain.path for variable in distinct])
+        self._finishers = [variable._finisher() for variable in distinct]
+
+    @property
+    def variables(self) -> List[Variable]:
+        """*The distinct variables resolved and formatted for each record, one for each group of member variables that produce the same value.*"""
+        return list(self._variables)
+
+    def format(self, data: Any) -> Dict[str, str]:
+        """*Renders every member from the data.*
+
+        **Args**
+        - **data (Any)**: Source of variables we will be puling from.
+
+        ***Raises***
+        - **MissingValue**: When a value could not be determined for a variable of any member and no default has been set.
+
+        **Returns**
+        - **(dict[str, str])**: output of each member by name.
+        """
+        values = [
+            finish(value)
+            for finish, value in zip(self._finishers, self._paths.resolve(data))
+        ]
+        return {
+            name: render({key: values[index] for key, index in keys})
+            for name, render, keys in self._members
+        }
+
+    def format_many(
+        self, records: Iterable[Any], return_exceptions: bool = False
+    ) -> Iterator[Union[Dict[str, str], Exception]]:
+        """*Lazily renders every member for each record, only holding one record and its outputs at a time.*
+
+        **Args**
+        - **records (Iterable[Any])**: Sources of variables, one dict of outputs is produced per record.
+        - **return_exceptions (bool)**: When True, a record that fails to format yields its exception in place of its outputs instead of raising. defaults to: `False`
+
+        ***Raises***
+        - **MissingValue**: When a record is missing a value and return_exceptions is False.
+
+        **Returns**
+        - **(Iterator[dict[str, str] | Exception])**: outputs of each member by name, in the same order as records.
+        """
+        if not return_exceptions:
+            return map(self.format, records)
+        return _render_safely(self.format, records)
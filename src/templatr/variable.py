@@ -1,73 +1,40 @@
-from typing import Any, ClassVar, Dict, List, Optional, Union
-from pydantic import BaseModel, ConfigDict, field_validator
-
+from time import perf_counter_ns
+import inspect
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from templatr.accessors import _UNSET, AccessorChain, resolve_path
 from templatr.exceptions import MissingValue
-from templatr.formatter import DefaultFormatter, VariableFormatter, load_formatter
-
+from templatr.instrumentation import DEFAULTED, RESOLVED, VariableRecord
+from templatr.formatter import (
+    CachedFormatter,
+    DefaultFormatter,
+    VariableFormatter,
+    load_formatter,
+)
 
-_UNSET = object()
+if TYPE_CHECKING:  # pragma: no cover
+    from templatr.models import VariableData
 
 
-class FormatterData(BaseModel):
-    """*Internal class that we use to describe and parse out the value we need to define a formatter for a variable.*
+def __getattr__(name: str) -> Any:
+    # definition models moved to templatr.models, imported on first use so rendering never loads pydantic.
+    if name in ("FormatterData", "VariableData"):
+        from templatr import models
 
-    **Args**
-    - **cls (str)**: class of formatter we are trying to load.
-    - **args (list)**: arguments for the formatter we are loading.
-    - **kwargs (dict[str, Any])**: keyword arguments for the formatter we are loading.
-    """
-
-    cls: str
-    args: list = []
-    kwargs: Dict[str, Any] = {}
-
-    @field_validator("args", mode="before")
-    def _default_args(cls, args: Optional[list]):
-        """*field validator to default None args to empty list instead.*
-
-        **Args**
-        - **args (list, None)**: optional list that will be set to args.
-
-        **Returns**
-        - **(list)**: list value to set to args.
-        """
-        if args is None:
-            return []
-        return args
-
-    @field_validator("kwargs", mode="before")
-    def _default_kwargs(cls, kwargs: Optional[Dict[str, Any]]):
-        """*field validator for kwargs to default None to empty dict.*
-
-        **Args**
-        - **kwargs (dict, None)**: possibly none kwargs we will be parsing.
-
-        **Returns**
-        - **(dict)**: dict to use as kwargs.
-        """
-        if kwargs is None:
-            return {}
-        return kwargs
-
-
-class VariableData(BaseModel):
-    """*Data to define a template variable.*
-
-    **Args**
-    - **key (str)**: The key you will be using in the template text string.
-    - **path (str)**: The path you will be looking at in the data that is seperated by dots e.g. `field.nested.value`
-    - **default (str)**: The default value you will use in place of value if we cannot grab value from data.
-    - **formatter (FormatterData)**: The formatter data to define how we want to render the value for the variable.
-    """
-
-    key: str
-    path: Optional[str] = None
-    default: Optional[str] = None
-    formatter: FormatterData = FormatterData(
-        cls=DefaultFormatter.__name__,
-        args=[],
-        kwargs={},
-    )
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _resolve_value(data: Any, path: List[str]):
@@ -81,55 +48,127 @@ def _resolve_value(data: Any, path: List[str]):
     - **(_UNSET)**: Singleton of class representing no value being able to parsed.
     - **(Any)**: Value that we resolved from data.
     """
-    current_value = data
-    for section in path:
-        if isinstance(current_value, dict):
-            current_value = current_value.get(section, _UNSET)
-            if current_value is _UNSET:
-                # value was not set so we can't continue
-                return _UNSET
-        else:
-            # assume it is a generic object
-            try:
-                current_value = getattr(current_value, section)
-            except AttributeError:
-                return _UNSET
-    # should be left with value we wanted to select from object
-    return current_value
+    return resolve_path(data, path)
+
+
+def _load_formatter(
+    cls_name: str,
+    args: list,
+    kwargs: Dict[str, Any],
+    cache: Union[bool, int] = False,
+    intern: bool = False,
+) -> VariableFormatter:
+    """*Loads the formatter of a variable definition, wrapped in a `CachedFormatter` when cache is set.*"""
+    if cache is False:
+        return load_formatter(cls_name, args, kwargs, intern=intern)
+    # loaded by definition so interned variables defining the same formatter share its cache.
+    return load_formatter(
+        CachedFormatter.__name__,
+        [{"cls": cls_name, "args": args, "kwargs": kwargs}],
+        {} if cache is True else {"max_size": cache},
+        intern=intern,
+    )
+
+
+def _path_definition(path: Optional[List[str]]) -> Union[str, List[str], None]:
+    """*Path as written in a definition, dotted unless a part contains a dot itself.*"""
+    if path is None or any("." in part for part in path):
+        return path
+    return ".".join(path)
 
 
-class Variable(BaseModel):
+class Variable:
     """*Variable to be used in the template.*
 
+    Variables are plain objects, `VariableData` validates their definitions once when they are loaded and the variable keeps only what rendering needs.
+
     **Args**
     - **key (str)**: Key in the template that the variable references
-    - **path (list[str], None)**: Path for variable value from incoming data, if None will default to key.
-    - **default (str, None)**: Default value for variable if not able to resolve from data.
+    - **path (str, list[str], None)**: Path for variable value from incoming data, a str is split on dots, if None will default to key. defaults to: `None`
+    - **default (Any, None)**: Default value for variable if not able to resolve from data. defaults to: `None`
     - **formatter (VariableFormatter)**: Formatter that will be used to change the object into something that can be put into your template. defaults to: `DefaultFormatter`
+
+    ***Raises***
+    - **TypeError**: When formatter is not a VariableFormatter.
     """
 
-    key: str
-    path: Optional[List[str]] = None
-    default: Optional[Any] = None
-    formatter: VariableFormatter = DefaultFormatter()
-    model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
+    __slots__ = ("key", "path", "default", "formatter", "_accessor_chain", "_owners")
+
+    def __init__(
+        self,
+        key: str,
+        path: Union[str, List[str], None] = None,
+        default: Optional[Any] = None,
+        formatter: VariableFormatter = DefaultFormatter(),
+    ) -> None:
+        # templates holding the variable, told to drop what they derived from it when it changes.
+        object.__setattr__(self, "_owners", None)
+        self.key = key
+        self.path = path
+        self.default = default
+        self.formatter = formatter
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "path" and isinstance(value, str):
+            value = value.split(".")
+        elif name == "formatter" and not isinstance(value, VariableFormatter):
+            raise TypeError(
+                f"formatter must be a VariableFormatter, got {type(value).__name__}"
+            )
+        object.__setattr__(self, name, value)
+        if name in ("key", "path"):
+            # drop state derived from the old values.
+            object.__setattr__(self, "_accessor_chain", None)
+        if name in ("key", "path", "default", "formatter") and self._owners is not None:
+            for owner in list(self._owners):
+                template = owner()
+                if template is not None:
+                    template._invalidate()
+
+    def _add_owner(self, template: Any) -> None:
+        """*Registers a template holding the variable, the reference is weak so the variable never keeps templates alive.*"""
+        owners = self._owners
+        if owners is None:
+            owners = []
+            object.__setattr__(self, "_owners", owners)
+        else:
+            # forget templates that were collected.
+            owners[:] = [owner for owner in owners if owner() is not None]
+            if any(owner() is template for owner in owners):
+                return
+        owners.append(weakref.ref(template))
+
+    def __eq__(self, value: object) -> bool:
+        if type(value) is not type(self):
+            return NotImplemented
+        return (
+            value.key == self.key
+            and value.path == self.path
+            and value.default == self.default
+            and value.formatter == self.formatter
+        )
 
-    @field_validator("path", mode="before")
-    def _split_path(cls, value: Union[None, str, List[str]]):
-        """*field validator to split up the path as parts of string based on dot.*
+    __hash__ = None  # type: ignore[assignment]
 
-        **Args**
-        - **value (str, list[str], None)**: Value we are working against in validator.
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(key={self.key!r}, path={self.path!r}, "
+            f"default={self.default!r}, formatter={self.formatter!r})"
+        )
 
-        **Returns**
-        - **(list[str])**: path for value of variable on data.
-        """
-        if value is None:
-            return value
-        elif isinstance(value, str):
-            return value.split(".")
-        else:
-            return value
+    def __reduce__(self):
+        # the accessor chain holds generated functions that can't be pickled, it is rebuilt on next use.
+        return (type(self), (self.key, self.path, self.default, self.formatter))
+
+    @property
+    def _chain(self) -> AccessorChain:
+        """*Accessor chain for the path of the variable, caches the accessor used for each type of data seen.*"""
+        chain = self._accessor_chain
+        if chain is None:
+            chain = AccessorChain(self.path or [self.key])
+            # cached without __setattr__, building it doesn't change the variable.
+            object.__setattr__(self, "_accessor_chain", chain)
+        return chain
 
     def resolve(self, data: Any) -> Any:
         """*Resolves value from data using the given path of the configured variable otherwise defaults to value of given default.*
@@ -143,33 +182,156 @@ class Variable(BaseModel):
         **Returns**
         - **(Any)**: the formatted data that was resolved from the given data.
         """
-        # use the path that given but if not set or empty default to key
-        value_path = self.path or [self.key]
-        value = _resolve_value(data, value_path)
+        chain = self._chain
+        value = chain.resolve(data)
         if value is _UNSET:
             if self.default is None:
-                raise MissingValue(self.key, self.path)
+                raise MissingValue(self.key, list(chain.path))
             value = self.default
 
         return self.formatter(value)
 
+    def measure(self, data: Any, origin_ns: int = 0) -> Tuple[Any, VariableRecord]:
+        """*Resolves value from data like `resolve` and times resolving the path and running the formatter, used by instrumented templates.*
+
+        **Args**
+        - **data (Any)**: the data we are pulling the value from.
+        - **origin_ns (int)**: `time.perf_counter_ns()` at the start of the render, the record stores the offset from it. defaults to: `0`
+
+        ***Raises***
+        - **MissingValue**: When value could not be determined for variable and no default has been set.
+
+        **Returns**
+        - **(tuple[Any, VariableRecord])**: the formatted value and the timings of the variable.
+        """
+        start = perf_counter_ns()
+        value = self._chain.resolve(data)
+        resolved = perf_counter_ns()
+        outcome = RESOLVED
+        if value is _UNSET:
+            value = self._default_for(value)
+            outcome = DEFAULTED
+        value = self.formatter(value)
+        return value, VariableRecord(
+            key=self.key,
+            offset_ns=start - origin_ns,
+            resolve_ns=resolved - start,
+            format_ns=perf_counter_ns() - resolved,
+            outcome=outcome,
+        )
+
+    def resolve_column(
+        self, columns: Mapping[str, Sequence[Any]], rows: int
+    ) -> Sequence[Any]:
+        """*Resolves the variable for every row of data stored column by column. The column is matched once by the full dotted path or the longest leading part of the path, any remaining path is resolved from each value in that column.*
+
+        **Args**
+        - **columns (Mapping[str, Sequence[Any]])**: columns of data keyed by column name, one value per row.
+        - **rows (int)**: number of rows in columns.
+
+        ***Raises***
+        - **MissingValue**: When a row has no value for the variable and no default has been set.
+
+        **Returns**
+        - **(Sequence[Any])**: the formatted values, one per row.
+        """
+        path = self._chain.path
+        for end in range(len(path), 0, -1):
+            name = ".".join(path[:end])
+            if name in columns:
+                column = columns[name]
+                if end < len(path):
+                    resolve = AccessorChain(path[end:]).resolve
+                    column = [resolve(value) for value in column]
+                    if any(value is _UNSET for value in column):
+                        column = [self._default_for(value) for value in column]
+                break
+        else:
+            column = [self._default_for(_UNSET)] * rows if rows else []
+
+        return self.formatter.format_column(column)
+
+    def _default_for(self, value: Any) -> Any:
+        if value is not _UNSET:
+            return value
+        if self.default is None:
+            raise MissingValue(self.key, list(self._chain.path))
+        return self.default
+
+    async def aresolve(self, data: Any) -> Any:
+        """*Resolves value from data like `resolve`, awaiting the value when it is awaitable and the result of the formatter when it is a coroutine.*
+
+        **Args**
+        - **data (Any)**: the data we are pulling the value from.
+
+        ***Raises***
+        - **MissingValue**: When value could not be determined for variable and no default has been set.
+
+        **Returns**
+        - **(Any)**: the formatted data that was resolved from the given data.
+        """
+        return await self._aformat(self._default_for(self._chain.resolve(data)))
+
+    async def _aformat(self, value: Any) -> Any:
+        """*Awaits value when it is awaitable and formats it, awaiting the formatter when it is a coroutine.*"""
+        if inspect.isawaitable(value):
+            value = await value
+        value = self.formatter(value)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    def _finisher(self) -> Callable[[Any], Any]:
+        """*Returns a function that takes the value resolved from the path of the variable, `_UNSET` when it is missing, and applies the default and formatter like `resolve`, used when the path was resolved along with the paths of other variables.*"""
+        key, path, default, formatter = (
+            self.key,
+            self._chain.path,
+            self.default,
+            self.formatter,
+        )
+
+        def finish(value: Any) -> Any:
+            if value is _UNSET:
+                if default is None:
+                    raise MissingValue(key, list(path))
+                value = default
+            return formatter(value)
+
+        return finish
+
     @classmethod
-    def from_dict(cls, data: dict):
+    def from_dict(cls, data: dict, intern: bool = False):
         """*Creates a variable from a dict definition.*
 
         **Args**
         - **data (dict)**: dict definition of variable that matches the format in VariableData.
+        - **intern (bool)**: When True, loads share one formatter instance per formatter definition, see `load_formatter`. defaults to: `False`
 
         **Returns**
         - **(Variable)**: Variable parsed from dict.
         """
-        data: VariableData = VariableData.model_validate(data)
-        formatter_args = data.formatter
+        from templatr.models import VariableData
 
-        formatter = load_formatter(
+        return cls.from_data(VariableData.model_validate(data), intern=intern)
+
+    @classmethod
+    def from_data(cls, data: "VariableData", intern: bool = False):
+        """*Creates a variable from its validated definition.*
+
+        **Args**
+        - **data (VariableData)**: definition of the variable.
+        - **intern (bool)**: When True, loads share one formatter instance per formatter definition, see `load_formatter`. defaults to: `False`
+
+        **Returns**
+        - **(Variable)**: Variable for the definition.
+        """
+        formatter_args = data.formatter
+        formatter = _load_formatter(
             formatter_args.cls,
             formatter_args.args,
             formatter_args.kwargs,
+            formatter_args.cache,
+            intern=intern,
         )
 
         return cls(
@@ -178,3 +340,26 @@ class Variable(BaseModel):
             default=data.default,
             formatter=formatter,
         )
+
+    def to_data(self) -> "VariableData":
+        """*Definition of the variable, `from_data` creates an equal variable from it.*
+
+        **Returns**
+        - **(VariableData)**: definition of the variable.
+        """
+        from templatr.models import FormatterData, VariableData
+
+        return VariableData(
+            key=self.key,
+            path=_path_definition(self.path),
+            default=self.default,
+            formatter=FormatterData.model_validate(self.formatter.definition()),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """*Dict definition of the variable, the inverse of `from_dict`.*
+
+        **Returns**
+        - **(dict)**: dict definition of the variable.
+        """
+        return self.to_data().model_dump()
@@ -80,3 +80,23 @@ def test_load_yaml_template__when_given_a_file_path__loads_template(
 def test_load_yaml_template__when_unsupported_type__raises_UnsupportedSource():
     with pytest.raises(UnsupportedSource):
         load_yaml_template(object())
+
+
+def test_load_json_template__when_given_a_binary_file_pointer__loads_template(
+    resources_path,
+):
+    with open(os.path.join(resources_path, json_file), mode="rb") as fp:
+        template = load_json_template(fp)
+
+    assert template.text == TEMPLATE
+    assert template.variables == VARIABLES
+
+
+def test_load_yaml_template__when_given_a_binary_file_pointer__loads_template(
+    resources_path,
+):
+    with open(os.path.join(resources_path, yaml_file), mode="rb") as fp:
+        template = load_yaml_template(fp)
+
+    assert template.text == TEMPLATE
+    assert template.variables == VARIABLES
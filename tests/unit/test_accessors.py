@@ -0,0 +1,146 @@
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import pytest
+from pydantic import BaseModel
+
+from templatr.accessors import (
+    _UNSET,
+    MAX_SHAPES,
+    AccessorChain,
+    PathTrie,
+    access,
+    accessor_for,
+)
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+@dataclass
+class DataPoint:
+    x: int
+    y: int
+
+
+class ModelPoint(BaseModel):
+    x: int
+    y: int
+
+
+class SlotPoint:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"x": 1, "y": 2},
+        OrderedDict(x=1, y=2),
+        MappingProxyType({"x": 1, "y": 2}),
+        Point(1, 2),
+        DataPoint(1, 2),
+        ModelPoint(x=1, y=2),
+        SlotPoint(1, 2),
+    ],
+)
+def test_access__when_value_has_section__returns_value(value):
+    assert access(value, "y") == 2
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"x": 1},
+        MappingProxyType({"x": 1}),
+        Point(1, 2),
+        DataPoint(1, 2),
+        ModelPoint(x=1, y=2),
+        SlotPoint(1, 2),
+    ],
+)
+def test_access__when_value_does_not_have_section__returns_unset(value):
+    assert access(value, "z") is _UNSET
+
+
+def test_accessor_for__when_called_twice_for_same_type__returns_same_accessor():
+    assert accessor_for(DataPoint, "x") is accessor_for(DataPoint, "x")
+
+
+def test_accessor_chain__when_resolving_nested_path__returns_value():
+    sut = AccessorChain(["point", "y"])
+
+    assert sut.resolve({"point": Point(1, 2)}) == 2
+
+
+def test_accessor_chain__when_path_is_missing__returns_unset():
+    sut = AccessorChain(["point", "z"])
+
+    assert sut.resolve({"point": Point(1, 2)}) is _UNSET
+
+
+def test_accessor_chain__when_type_of_data_changes__adapts_to_new_type():
+    sut = AccessorChain(["point", "x"])
+
+    assert sut.resolve({"point": Point(1, 2)}) == 1
+    assert sut.resolve({"point": DataPoint(3, 4)}) == 3
+    assert sut.resolve(ModelPoint(x=5, y=6)) is _UNSET
+
+
+def test_accessor_chain__when_resolving_same_shape_twice__reuses_specialized_resolver():
+    sut = AccessorChain(["point", "x"])
+    sut.resolve({"point": Point(1, 2)})
+    resolver = sut.resolve
+
+    assert sut.resolve({"point": Point(3, 4)}) == 3
+    assert sut.resolve is resolver
+
+
+def test_accessor_chain__when_path_was_missing_and_later_exists__resolves_value():
+    sut = AccessorChain(["point", "x"])
+
+    assert sut.resolve({}) is _UNSET
+    assert sut.resolve({"point": {"x": 1}}) == 1
+
+
+def test_accessor_chain__when_seeing_more_shapes_than_max__still_resolves_values():
+    sut = AccessorChain(["point"])
+    shapes = [
+        type(f"Shape{index}", (), {"point": index}) for index in range(MAX_SHAPES + 2)
+    ]
+
+    assert [sut.resolve(shape()) for shape in shapes] == list(range(MAX_SHAPES + 2))
+
+
+class Counting:
+    reads = 0
+
+    def __init__(self, **values) -> None:
+        self._values = values
+
+    def __getattr__(self, name: str):
+        Counting.reads += 1
+        return self._values[name]
+
+
+def test_path_trie__when_paths_share_prefixes__reads_each_prefix_once():
+    Counting.reads = 0
+    data = {"order": Counting(customer=Counting(name="Jeffery", city="Austin"))}
+    sut = PathTrie([["order", "customer", "name"], ["order", "customer", "city"]])
+
+    assert sut.resolve(data) == ("Jeffery", "Austin")
+    assert Counting.reads == 3
+
+
+def test_path_trie__when_prefix_is_missing__returns_unset_for_paths_under_it():
+    sut = PathTrie([["a", "b", "c"], ["a", "d"], ["e"], ["a", "d"]])
+
+    assert sut.resolve({"a": {"d": 1}}) == (_UNSET, 1, _UNSET, 1)
+
+
+def test_path_trie__when_given_no_paths__returns_empty_tuple():
+    assert PathTrie([]).resolve({}) == ()
@@ -0,0 +1,51 @@
+from templatr.analysis import analyze_template, used_variables
+from templatr.template import Template
+from templatr.variable import Variable
+
+
+def test_used_variables__when_text_skips_variables__returns_referenced_in_order():
+    template = Template(
+        variables=[Variable(key="B"), Variable(key="A"), Variable(key="C")],
+        text="{A} {B} {A}",
+    )
+
+    assert [variable.key for variable in used_variables(template)] == ["B", "A"]
+
+
+def test_used_variables__when_text_cannot_be_tokenized__returns_every_variable():
+    template = Template(
+        variables=[Variable(key="A"), Variable(key="B")], text="{A:{B}}"
+    )
+
+    assert [variable.key for variable in used_variables(template)] == ["A", "B"]
+
+
+def test_analyze_template__when_analyzing__reports_fields_unused_undeclared_and_paths():
+    template = Template(
+        variables=[
+            Variable(key="NAME", path=["person", "name"]),
+            Variable(key="AGE", path=["person", "age"]),
+            Variable(key="ALIAS", path=["person", "name"]),
+            Variable(key="UNUSED", path=["other"]),
+        ],
+        text="{NAME} {AGE} {ALIAS} {MISSING} {NAME}",
+    )
+
+    result = analyze_template(template)
+
+    assert result.tokenized
+    assert result.fields == ["NAME", "AGE", "ALIAS", "MISSING"]
+    assert result.unused_variables == ["UNUSED"]
+    assert result.undeclared_fields == ["MISSING"]
+    assert result.read_paths == ["person.name", "person.age"]
+
+
+def test_analyze_template__when_text_cannot_be_tokenized__reports_nothing_unused():
+    template = Template(variables=[Variable(key="A")], text="{0}")
+
+    result = analyze_template(template)
+
+    assert not result.tokenized
+    assert result.unused_variables == []
+    assert result.undeclared_fields == []
+    assert result.read_paths == ["A"]
@@ -0,0 +1,150 @@
+import json
+import marshal
+import os
+import sys
+
+import pytest
+
+from templatr import artifacts
+from templatr.artifacts import (
+    artifact_path,
+    compile_source,
+    dump_artifact,
+    load_artifact,
+    load_template_file,
+    source_hash,
+)
+from templatr.exceptions import (
+    StaleArtifact,
+    UndeclaredFields,
+    UnserializableVariable,
+)
+from templatr.template import load_yaml_template
+
+resources_path = os.path.join(os.path.dirname(__file__), "..", "resources")
+
+DATA = {"age": 30, "reasons": ["fast", "simple"]}
+
+
+def _write(path, text: str) -> str:
+    path.write_text(json.dumps({"text": text, "variables": [{"key": "name"}]}))
+    return str(path)
+
+
+def test_compile_source__when_loaded_back__equals_template_loaded_from_source(
+    tmp_path,
+):
+    source = os.path.join(resources_path, "example.yaml")
+    output = str(tmp_path / "example.yaml.tplc")
+
+    assert compile_source(source, output) == output
+    with open(source, "rb") as fp:
+        content_hash = source_hash(fp.read())
+    result = load_artifact(output, content_hash)
+
+    assert result == load_yaml_template(source)
+    assert result.format(DATA) == load_yaml_template(source).format(DATA)
+
+
+def test_load_artifact__when_loading__does_not_validate_definition(
+    tmp_path, monkeypatch
+):
+    source = _write(tmp_path / "welcome.json", "Welcome {name}")
+    compile_source(source)
+    monkeypatch.setitem(sys.modules, "templatr.models", None)
+
+    assert load_artifact(artifact_path(source)).format({"name": "a"}) == "Welcome a"
+
+
+def test_load_artifact__when_source_changed__raises_StaleArtifact(tmp_path):
+    source = _write(tmp_path / "welcome.json", "Welcome {name}")
+    compile_source(source)
+
+    with pytest.raises(StaleArtifact):
+        load_artifact(artifact_path(source), source_hash(b"changed"))
+
+
+def test_load_artifact__when_built_by_other_version__raises_StaleArtifact(
+    tmp_path, monkeypatch
+):
+    source = _write(tmp_path / "welcome.json", "Welcome {name}")
+    compile_source(source)
+    monkeypatch.setattr(artifacts, "__version__", "99.0.0")
+
+    with pytest.raises(StaleArtifact):
+        load_artifact(artifact_path(source))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not an artifact",
+        artifacts.MAGIC + b"\xff",
+        artifacts.MAGIC + marshal.dumps((1, "hash", "text", ())),
+    ],
+)
+def test_load_artifact__when_file_is_not_an_artifact__raises_StaleArtifact(
+    tmp_path, content: bytes
+):
+    path = tmp_path / "template.tplc"
+    path.write_bytes(content)
+
+    with pytest.raises(StaleArtifact):
+        load_artifact(str(path))
+
+
+@pytest.mark.parametrize(
+    "variable, part",
+    [
+        ("  - key: name\n    default: 2024-01-01\n", "default"),
+        (
+            "  - key: name\n    formatter:\n      cls: tests.unit.test_formatter.ArgsFormatter\n      args: [2024-01-01]\n",
+            "formatter",
+        ),
+    ],
+)
+def test_dump_artifact__when_variable_is_not_plain_value__raises_UnserializableVariable(
+    tmp_path, variable: str, part: str
+):
+    source = tmp_path / "welcome.yaml"
+    source.write_text(f"text: Welcome {{name}}\nvariables:\n{variable}")
+    template = load_yaml_template(str(source))
+
+    with pytest.raises(UnserializableVariable) as exc_info:
+        dump_artifact(template, "hash", str(tmp_path / "template.tplc"))
+    assert (exc_info.value.key, exc_info.value.part) == ("name", part)
+    assert os.listdir(tmp_path) == ["welcome.yaml"]
+
+
+def test_load_template_file__when_artifact_is_current__loads_artifact(
+    tmp_path, monkeypatch
+):
+    source = _write(tmp_path / "welcome.json", "Welcome {name}")
+    compile_source(source)
+    monkeypatch.setattr(artifacts, "_parse", None)
+
+    assert load_template_file(source).format({"name": "a"}) == "Welcome a"
+
+
+def test_load_template_file__when_source_changed__parses_source(tmp_path):
+    source = _write(tmp_path / "welcome.json", "Welcome {name}")
+    compile_source(source)
+    _write(tmp_path / "welcome.json", "Hi {name}")
+
+    assert load_template_file(source).format({"name": "a"}) == "Hi a"
+
+
+def test_load_template_file__when_no_artifact__parses_source(tmp_path):
+    source = _write(tmp_path / "welcome.json", "Welcome {name}")
+
+    assert load_template_file(source).format({"name": "a"}) == "Welcome a"
+
+
+def test_load_template_file__when_strict_and_artifact_has_undeclared_fields__raises_UndeclaredFields(
+    tmp_path,
+):
+    source = _write(tmp_path / "welcome.json", "Welcome {name} {other}")
+    compile_source(source)
+
+    with pytest.raises(UndeclaredFields):
+        load_template_file(source, strict=True)
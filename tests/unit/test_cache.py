@@ -0,0 +1,119 @@
+from decimal import Decimal
+import sys
+
+import pytest
+
+from templatr.cache import OutputCache
+
+
+def _render(values: dict) -> str:
+    return "|".join(f"{key}={value}" for key, value in values.items())
+
+
+def test_output_cache__when_rendering_same_values_again__returns_cached_output():
+    rendered = []
+    sut = OutputCache()
+
+    def render(values: dict) -> str:
+        rendered.append(values)
+        return _render(values)
+
+    first = sut.render(["a"], (1,), render)
+    second = sut.render(["a"], (1,), render)
+
+    assert first == second == "a=1"
+    assert second is first
+    assert len(rendered) == 1
+    assert sut.stats.hits == 1
+    assert sut.stats.misses == 1
+
+
+def test_output_cache__when_values_are_equal_but_of_different_types__renders_apart():
+    sut = OutputCache()
+
+    assert sut.render(["a"], (1,), _render) == "a=1"
+    assert sut.render(["a"], (1.0,), _render) == "a=1.0"
+    assert sut.render(["a"], (True,), _render) == "a=True"
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (0.0, -0.0),
+        (Decimal("1.5"), Decimal("1.50")),
+        ((1.0,), (1,)),
+    ],
+)
+def test_output_cache__when_equal_values_format_differently__renders_apart(
+    first, second
+):
+    sut = OutputCache()
+
+    assert sut.render(["a"], (first,), _render) == f"a={first}"
+    assert sut.render(["a"], (second,), _render) == f"a={second}"
+    assert sut.stats.misses == 2
+
+
+def test_output_cache__when_counting_bytes__counts_values_kept_in_keys():
+    value = "x" * 1_000
+    sut = OutputCache()
+
+    sut.render(["a"], (value,), lambda values: "short")
+
+    assert sut.stats.size_bytes == _entry_size("short", (value,))
+    assert sut.stats.size_bytes > sys.getsizeof(value)
+
+
+def test_output_cache__when_values_are_unhashable__bypasses_cache():
+    sut = OutputCache()
+
+    assert sut.render(["a"], ([1],), _render) == "a=[1]"
+    assert sut.stats.bypassed == 1
+    assert sut.stats.size == 0
+
+
+def test_output_cache__when_over_max_entries__evicts_least_recently_used():
+    sut = OutputCache(max_entries=2)
+
+    for value in (1, 2, 1, 3):
+        sut.render(["a"], (value,), _render)
+    sut.render(["a"], (1,), _render)
+
+    assert sut.stats.evictions == 1
+    assert sut.stats.hits == 2
+
+
+def _entry_size(output: str, values: tuple) -> int:
+    """*Bytes an entry for simple values is counted as, the output and its key.*"""
+    types = tuple(map(type, values))
+    return (
+        sys.getsizeof(output)
+        + sys.getsizeof((types, values))
+        + sys.getsizeof(types)
+        + sys.getsizeof(values)
+        + sum(map(sys.getsizeof, values))
+    )
+
+
+def test_output_cache__when_over_max_bytes__evicts_until_within_bound():
+    size = _entry_size("a=1", (1,))
+    sut = OutputCache(max_bytes=size * 2)
+
+    for value in (1, 2, 3):
+        sut.render(["a"], (value,), _render)
+
+    assert sut.stats.size == 2
+    assert sut.stats.size_bytes == size * 2
+
+
+def test_output_cache__when_output_is_bigger_than_max_bytes__does_not_cache_it():
+    sut = OutputCache(max_bytes=1)
+
+    sut.render(["a"], (1,), _render)
+
+    assert sut.stats.size == 0
+
+
+def test_output_cache__when_given_max_entries_below_one__raises_ValueError():
+    with pytest.raises(ValueError):
+        OutputCache(max_entries=0)
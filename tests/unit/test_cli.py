@@ -0,0 +1,229 @@
+import json
+
+import pytest
+
+from templatr.artifacts import load_artifact
+from templatr.cli import main
+
+
+def _write(path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"text": text, "variables": [{"key": "name"}]}))
+
+
+def test_cli_compile__when_given_file__writes_artifact_next_to_it(tmp_path, capsys):
+    _write(tmp_path / "welcome.json", "Welcome {name}")
+
+    assert main(["compile", str(tmp_path / "welcome.json")]) == 0
+
+    artifact = str(tmp_path / "welcome.json.tplc")
+    assert capsys.readouterr().out.split() == [artifact]
+    assert load_artifact(artifact).format({"name": "a"}) == "Welcome a"
+
+
+def test_cli_compile__when_given_directory_and_output_dir__mirrors_directory(
+    tmp_path,
+):
+    _write(tmp_path / "src" / "welcome.json", "Welcome {name}")
+    _write(tmp_path / "src" / "tenant" / "bye.json", "Bye {name}")
+    (tmp_path / "src" / "notes.txt").write_text("not a template")
+
+    assert main(["compile", str(tmp_path / "src"), "-o", str(tmp_path / "out")]) == 0
+
+    result = load_artifact(str(tmp_path / "out" / "tenant" / "bye.json.tplc"))
+    assert result.format({"name": "a"}) == "Bye a"
+    assert sorted(path.name for path in (tmp_path / "out").rglob("*.tplc")) == [
+        "bye.json.tplc",
+        "welcome.json.tplc",
+    ]
+
+
+def test_cli_compile__when_strict_and_template_has_undeclared_fields__exits_with_1(
+    tmp_path, capsys
+):
+    _write(tmp_path / "welcome.json", "Welcome {name} {other}")
+
+    assert main(["compile", "--strict", str(tmp_path / "welcome.json")]) == 1
+    assert "other" in capsys.readouterr().err
+
+
+def test_cli_compile__when_default_is_not_plain_value__exits_with_1(tmp_path, capsys):
+    (tmp_path / "welcome.yaml").write_text(
+        "text: Welcome {name}\nvariables:\n  - key: name\n    default: 2024-01-01\n"
+    )
+
+    assert main(["compile", str(tmp_path / "welcome.yaml")]) == 1
+    assert "variable name" in capsys.readouterr().err
+    assert not (tmp_path / "welcome.yaml.tplc").exists()
+
+
+@pytest.fixture
+def template(tmp_path) -> str:
+    path = tmp_path / "greeting.json"
+    path.write_text(
+        json.dumps(
+            {
+                "text": "Hi {name} from {city}",
+                "variables": [
+                    {"key": "name"},
+                    {"key": "city", "path": "address.city", "default": "?"},
+                ],
+            }
+        )
+    )
+    return str(path)
+
+
+def _records(path, count: int, missing: tuple = ()) -> str:
+    path.write_text(
+        "\n".join(
+            json.dumps({} if index in missing else {"name": f"n{index}"})
+            for index in range(count)
+        )
+        + "\n"
+    )
+    return str(path)
+
+
+def test_cli_render__when_given_jsonl__writes_each_output_to_stdout(
+    template, tmp_path, capsys
+):
+    records = _records(tmp_path / "records.jsonl", 3)
+
+    assert main(["render", template, records]) == 0
+
+    captured = capsys.readouterr()
+    assert captured.out == "Hi n0 from ?\nHi n1 from ?\nHi n2 from ?\n"
+    assert "rendered 3 records with 0 errors" in captured.err
+
+
+def test_cli_render__when_given_csv_with_dotted_columns__reads_nested_records(
+    template, tmp_path, capsys
+):
+    records = tmp_path / "records.csv"
+    records.write_text("name,address.city\nann,Austin\nbob,Boston\n")
+
+    assert main(["render", template, str(records), "-q"]) == 0
+
+    assert capsys.readouterr().out == "Hi ann from Austin\nHi bob from Boston\n"
+
+
+def test_cli_render__when_records_fail__counts_errors_and_exits_with_1(
+    template, tmp_path, capsys
+):
+    records = _records(tmp_path / "records.jsonl", 3, missing=(1,))
+    output = tmp_path / "out.jsonl"
+
+    result = main(
+        ["render", template, records, "-o", str(output), "--output-format", "jsonl"]
+    )
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert result == 1
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert "error" in lines[1]
+    assert "1 errors" in capsys.readouterr().err
+
+
+def test_cli_render__when_output_format_is_files__writes_file_per_record(
+    template, tmp_path
+):
+    records = _records(tmp_path / "records.jsonl", 2)
+
+    main(
+        [
+            "render",
+            template,
+            records,
+            "-o",
+            str(tmp_path / "out"),
+            "--output-format",
+            "files",
+            "--name",
+            "{index}.md",
+        ]
+    )
+
+    assert (tmp_path / "out" / "1.md").read_text() == "Hi n1 from ?"
+
+
+def test_cli_render__when_using_workers__keeps_order_of_records(template, tmp_path):
+    records = _records(tmp_path / "records.jsonl", 50)
+    output = tmp_path / "out.txt"
+
+    assert (
+        main(
+            [
+                "render",
+                template,
+                records,
+                "-o",
+                str(output),
+                "--workers",
+                "2",
+                "--chunksize",
+                "7",
+                "--chunk-bytes",
+                "64",
+                "-q",
+            ]
+        )
+        == 0
+    )
+
+    assert output.read_text().splitlines() == [
+        f"Hi n{index} from ?" for index in range(50)
+    ]
+
+
+@pytest.mark.parametrize(
+    "option", ["--checkpoint-every", "--chunksize", "--chunk-bytes", "--workers"]
+)
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_cli_render__when_count_option_is_not_positive__exits_with_usage_error(
+    template, tmp_path, capsys, option, value
+):
+    records = _records(tmp_path / "records.jsonl", 2)
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["render", template, records, "-q", option, value])
+
+    assert exc_info.value.code == 2
+    assert option in capsys.readouterr().err
+
+
+def test_cli_render__when_resumed_from_checkpoint__continues_after_last_record_saved(
+    template, tmp_path
+):
+    records = tmp_path / "records.jsonl"
+    _records(records, 5)
+    with records.open("a") as fp:
+        fp.write("not json\n")
+    output = tmp_path / "out.txt"
+    args = ["render", template, str(records), "-o", str(output), "-q"]
+    args += ["--checkpoint", str(tmp_path / "job.json"), "--checkpoint-every", "2"]
+
+    assert main(args) == 1
+
+    _records(records, 8)
+    assert main(args) == 0
+
+    assert output.read_text().splitlines() == [
+        f"Hi n{index} from ?" for index in range(8)
+    ]
+    assert json.loads((tmp_path / "job.json").read_text())["records"] == 8
+
+
+def test_cli_render__when_checkpoint_belongs_to_other_job__exits_with_2(
+    template, tmp_path
+):
+    records = _records(tmp_path / "records.jsonl", 2)
+    checkpoint = str(tmp_path / "job.json")
+    main(["render", template, records, "-q", "--checkpoint", checkpoint])
+
+    result = main(
+        ["render", template, records, "-q", "-o", str(tmp_path / "other.txt")]
+        + ["--checkpoint", checkpoint]
+    )
+
+    assert result == 2
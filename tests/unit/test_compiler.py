@@ -0,0 +1,105 @@
+from typing import Any
+
+import pytest
+
+from templatr.compiler import compile_template
+from templatr.exceptions import MissingValue
+from templatr.formatter import ListFormatter, VariableFormatter
+from templatr.template import Template
+from templatr.variable import Variable
+
+
+class Obj:
+    def __init__(self, **kwargs) -> None:
+        self.__dict__.update(kwargs)
+
+
+class CallFormatter(VariableFormatter):
+    def format(self, value: Any) -> Any:
+        return value
+
+    def __call__(self, value: Any) -> Any:
+        return f"called {value}"
+
+
+DATA = {
+    "name": "Jeffery",
+    "age": 20,
+    "user": Obj(address={"city": "Austin"}),
+    "items": [1, 2, 3],
+}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "BASIC",
+        "Hello {name}! {name!r:>12} {age:05d} {{escaped}}",
+        'quotes " and \' and \\ backslashes {name:"^11}',
+        "{city} {items}",
+        "{items[0]} {name.upper}",
+        "{age:{age}}",
+        "unicode ✓\n{name:✓<10}",
+    ],
+)
+def test_compile_template__when_rendering__matches_template_format(text: str):
+    template = Template(
+        variables=[
+            Variable(key="name"),
+            Variable(key="age"),
+            Variable(key="city", path="user.address.city"),
+            Variable(key="items", formatter=ListFormatter(", ")),
+        ],
+        text=text,
+    )
+    sut = compile_template(template)
+
+    assert sut(DATA) == template.format(DATA)
+
+
+def test_compile_template__when_value_is_missing_and_default_set__uses_default():
+    template = Template(
+        variables=[Variable(key="key", path="not.there", default="NOT SET")],
+        text="{key}",
+    )
+    sut = compile_template(template)
+
+    assert sut({"not": Obj()}) == "NOT SET"
+
+
+def test_compile_template__when_value_is_missing_and_default_not_set__raises_MissingValue():
+    template = Template(variables=[Variable(key="key", path="not.there")], text="{key}")
+    sut = compile_template(template)
+
+    with pytest.raises(MissingValue):
+        sut({"not": {}})
+
+
+def test_compile_template__when_text_references_undeclared_key__raises_KeyError():
+    template = Template(variables=[], text="{key}")
+    sut = compile_template(template)
+
+    with pytest.raises(KeyError):
+        sut({})
+
+
+def test_compile_template__when_formatter_overrides_call__uses_call():
+    template = Template(
+        variables=[Variable(key="key", formatter=CallFormatter())], text="{key}"
+    )
+    sut = compile_template(template)
+
+    assert sut({"key": 1}) == "called 1"
+
+
+def test_compile_template__when_templates_share_structure__reuses_code():
+    first = Template(variables=[Variable(key="a")], text="Hello {a}")
+    second = Template(variables=[Variable(key="b")], text="Bye {b}")
+
+    first_render = compile_template(first)
+    second_render = compile_template(second)
+
+    assert first_render.__code__ is second_render.__code__
+    assert first_render({"a": 1}) == "Hello 1"
+    assert second_render({"b": 2}) == "Bye 2"
@@ -0,0 +1,36 @@
+import pickle
+
+import pytest
+
+from templatr.exceptions import (
+    InvalidFormatter,
+    InvalidRecord,
+    MismatchedColumns,
+    MissingValue,
+    StaleArtifact,
+    UndeclaredFields,
+    UnknownFormatter,
+    UnserializableVariable,
+    UnsupportedSource,
+)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        InvalidFormatter("ListFormatter", [], {}),
+        UnknownFormatter("FakeFormatter"),
+        UnsupportedSource(object),
+        MissingValue("key", ["path", "key"]),
+        MismatchedColumns({"first": 1, "second": 2}),
+        UndeclaredFields(["first", "second"]),
+        StaleArtifact("template.yaml.tplc", "source changed"),
+        InvalidRecord("records.jsonl", 3, "unexpected end of data"),
+        UnserializableVariable("created", "default"),
+    ],
+)
+def test_exceptions__when_pickled__round_trip_with_same_message(exc: Exception):
+    result = pickle.loads(pickle.dumps(exc))
+
+    assert type(result) is type(exc)
+    assert str(result) == str(exc)
@@ -1,11 +1,19 @@
+from decimal import Decimal
 from typing import Any
+import gc
+import importlib
+import pickle
 
 import pytest
+from templatr import formatter as formatter_module
 from templatr.exceptions import InvalidFormatter, UnknownFormatter
 from templatr.formatter import (
+    CachedFormatter,
+    ChunkedValue,
     DefaultFormatter,
     ListFormatter,
     VariableFormatter,
+    clear_formatter_cache,
     load_formatter,
 )
 
@@ -29,6 +37,77 @@ def test_list_formatter__when_given_list_with_single_item__returns_item_as_strin
     assert value == "1"
 
 
+class UpperFormatter(VariableFormatter):
+    def format(self, value: Any) -> str:
+        return str(value).upper()
+
+
+def test_list_formatter__when_given_item_formatter__formats_each_item():
+    sut = ListFormatter(", ", item_formatter=UpperFormatter())
+    assert sut.format(["a", "b"]) == "A, B"
+
+
+def test_list_formatter__when_given_item_formatter_definition__loads_item_formatter():
+    sut = ListFormatter(
+        ", ", item_formatter={"cls": "ListFormatter", "args": ["-"], "kwargs": None}
+    )
+    assert sut.format([["a", "b"], ["c"]]) == "a-b, c"
+
+
+@pytest.mark.parametrize(
+    "items, expected",
+    [([1, 2], "1, 2"), ([1, 2, 3], "1, 2, 3"), ([1, 2, 3, 4], "1, 2, 3, ...")],
+)
+def test_list_formatter__when_given_max_items__truncates_extra_items(
+    items: list, expected: str
+):
+    sut = ListFormatter(", ", max_items=3)
+    assert sut.format(items) == expected
+
+
+def test_list_formatter__when_truncating_generator__reads_one_item_past_max_items():
+    consumed = []
+
+    def items():
+        for item in range(1_000):
+            consumed.append(item)
+            yield item
+
+    sut = ListFormatter(", ", max_items=2)
+
+    assert sut.format(items()) == "0, 1, ..."
+    assert consumed == [0, 1, 2]
+
+
+def test_list_formatter__when_streaming__returns_chunks_read_lazily():
+    consumed = []
+
+    def items():
+        for item in range(3):
+            consumed.append(item)
+            yield item
+
+    sut = ListFormatter(", ", stream=True)
+    value = sut.format(items())
+
+    assert isinstance(value, ChunkedValue)
+    assert consumed == []
+    assert list(value) == ["0", ", 1", ", 2"]
+
+
+def test_list_formatter__when_streaming__formats_like_joined_string():
+    value = ListFormatter(", ", stream=True).format([1, 2])
+
+    assert str(value) == "1, 2"
+    assert f"[{value:>6}]" == "[  1, 2]"
+
+
+def test_list_formatter__when_compared_with_different_options__is_not_equal():
+    assert ListFormatter(", ") == ListFormatter(", ")
+    assert ListFormatter(", ") != ListFormatter(", ", max_items=1)
+    assert ListFormatter(", ") != ListFormatter(", ", stream=True)
+
+
 def test_load_formatter__when_given_formatter_in_module__loads_formatter_correctly():
     formatter = load_formatter("DefaultFormatter", [], {})
     assert isinstance(formatter, DefaultFormatter)
@@ -72,3 +151,293 @@ def test_load_formatter__when_too_many_parameters_for_formatter__raises_InvalidF
 def test_load_formatter__when_class_loaded_is_not_formatter__raises_InvalidFormatter():
     with pytest.raises(InvalidFormatter):
         load_formatter("pydantic.BaseModel", [], {})
+
+
+def test_default_formatter__when_formatting_column__returns_column_as_is():
+    sut = DefaultFormatter()
+    expected = ["value"]
+    assert sut.format_column(expected) is expected
+
+
+def test_list_formatter__when_formatting_column__joins_each_list():
+    sut = ListFormatter(seperator=", ")
+    assert sut.format_column([[1, 2], [3]]) == ["1, 2", "3"]
+
+
+def test_variable_formatter__when_formatting_column__formats_each_value():
+    sut = CustomFormatter()
+    assert sut.format_column([1, 2]) == ["Custom: 1", "Custom: 2"]
+
+
+class StatefulFormatter(VariableFormatter):
+    shareable = False
+
+    def format(self, value: Any) -> Any:
+        return value
+
+
+def test_load_formatter__when_loading_same_formatter_twice__returns_same_instance():
+    first = load_formatter("ListFormatter", ["\n"], {}, intern=True)
+    second = load_formatter("ListFormatter", ["\n"], {}, intern=True)
+
+    assert first is second
+
+
+def test_load_formatter__when_arguments_differ__returns_different_instances():
+    first = load_formatter("ListFormatter", ["\n"], {}, intern=True)
+    second = load_formatter("ListFormatter", [], {"seperator": "\n"}, intern=True)
+    third = load_formatter("ListFormatter", [", "], {}, intern=True)
+
+    assert first is not second
+    assert first is not third
+
+
+def test_load_formatter__when_arguments_are_equal_but_different_types__returns_different_instances():
+    first = load_formatter(
+        "tests.unit.test_formatter.ArgsFormatter", [1], {}, intern=True
+    )
+    second = load_formatter(
+        "tests.unit.test_formatter.ArgsFormatter", [True], {}, intern=True
+    )
+
+    assert first is not second
+
+
+def test_load_formatter__when_arguments_are_unhashable__returns_new_instances():
+    first = load_formatter(
+        "tests.unit.test_formatter.ArgsFormatter", [{1, 2}], {}, intern=True
+    )
+    second = load_formatter(
+        "tests.unit.test_formatter.ArgsFormatter", [{1, 2}], {}, intern=True
+    )
+
+    assert first is not second
+
+
+def test_load_formatter__when_formatter_is_not_shareable__returns_new_instances():
+    first = load_formatter(
+        "tests.unit.test_formatter.StatefulFormatter", [], {}, intern=True
+    )
+    second = load_formatter(
+        "tests.unit.test_formatter.StatefulFormatter", [], {}, intern=True
+    )
+
+    assert first is not second
+
+
+@pytest.mark.parametrize(
+    "cls_name, args, kwargs",
+    [
+        (
+            "CachedFormatter",
+            [{"cls": "tests.unit.test_formatter.StatefulFormatter"}],
+            {},
+        ),
+        (
+            "CachedFormatter",
+            [],
+            {"formatter": {"cls": "tests.unit.test_formatter.StatefulFormatter"}},
+        ),
+        (
+            "ListFormatter",
+            [", "],
+            {"item_formatter": {"cls": "tests.unit.test_formatter.StatefulFormatter"}},
+        ),
+    ],
+)
+def test_load_formatter__when_wrapped_formatter_is_not_shareable__returns_new_instances(
+    cls_name, args, kwargs
+):
+    first = load_formatter(cls_name, args, kwargs, intern=True)
+    second = load_formatter(cls_name, args, kwargs, intern=True)
+
+    assert first is not second
+
+
+def test_load_formatter__when_wrapped_formatter_is_shareable__returns_same_instance():
+    args = [{"cls": "ListFormatter", "args": [", "]}]
+
+    first = load_formatter("CachedFormatter", args, {}, intern=True)
+    second = load_formatter("CachedFormatter", args, {}, intern=True)
+
+    assert first is second
+
+
+def test_load_formatter__when_not_interning__returns_new_instances():
+    first = load_formatter("ListFormatter", ["\n"], {})
+    second = load_formatter("ListFormatter", ["\n"], {})
+
+    assert first is not second
+
+
+def test_load_formatter__when_loading_class_twice__resolves_class_once(monkeypatch):
+    load_formatter("DefaultFormatter", [], {})
+    monkeypatch.setattr(importlib, "import_module", None)
+
+    assert isinstance(load_formatter("DefaultFormatter", [], {}), DefaultFormatter)
+
+
+def test_clear_formatter_cache__when_cleared__resolves_class_again(monkeypatch):
+    load_formatter("DefaultFormatter", [], {})
+    clear_formatter_cache()
+    monkeypatch.setattr(importlib, "import_module", None)
+
+    with pytest.raises(UnknownFormatter):
+        load_formatter("DefaultFormatter", [], {})
+
+
+def test_load_formatter__when_class_loaded_is_not_a_class__raises_InvalidFormatter():
+    with pytest.raises(InvalidFormatter):
+        load_formatter("templatr.formatter.load_formatter", [], {})
+
+
+class ArgsFormatter(VariableFormatter):
+    def __init__(self, *args) -> None:
+        self.args = args
+
+    def format(self, value: Any) -> Any:
+        return value
+
+
+class CountingUpperFormatter(VariableFormatter):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def format(self, value: Any) -> str:
+        self.calls += 1
+        return str(value).upper()
+
+
+def test_cached_formatter__when_formatting_same_value_again__reuses_result():
+    inner = CountingUpperFormatter()
+    sut = CachedFormatter(inner)
+
+    assert [sut("a"), sut("b"), sut("a"), sut("a")] == ["A", "B", "A", "A"]
+    assert inner.calls == 2
+    assert sut.stats.hits == 2
+    assert sut.stats.misses == 2
+    assert sut.stats.hit_rate == 0.5
+
+
+def test_cached_formatter__when_over_max_size__evicts_least_recently_used():
+    inner = CountingUpperFormatter()
+    sut = CachedFormatter(inner, max_size=2)
+
+    sut("a"), sut("b"), sut("a"), sut("c"), sut("a"), sut("b")
+
+    assert inner.calls == 4
+    assert sut.stats.evictions == 2
+    assert sut.stats.size == 2
+
+
+def test_cached_formatter__when_value_is_unhashable__bypasses_cache():
+    inner = CountingUpperFormatter()
+    sut = CachedFormatter(inner)
+
+    assert sut(["a"]) == "['A']"
+    assert sut(["a"]) == "['A']"
+    assert inner.calls == 2
+    assert sut.stats.bypassed == 2
+    assert sut.stats.size == 0
+
+
+def test_cached_formatter__when_values_are_equal_but_of_different_types__caches_apart():
+    sut = CachedFormatter(CountingUpperFormatter())
+
+    assert [sut(1), sut(1.0), sut(True)] == ["1", "1.0", "TRUE"]
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (0.0, -0.0),
+        (Decimal("1.5"), Decimal("1.50")),
+        ((1.0,), (1,)),
+        ((0.0, "a"), (-0.0, "a")),
+    ],
+)
+def test_cached_formatter__when_equal_values_format_differently__caches_apart(
+    first, second
+):
+    sut = CachedFormatter(DefaultFormatter())
+
+    assert str(sut(first)) == str(first)
+    assert str(sut(second)) == str(second)
+    assert sut.stats.misses == 2
+
+
+@pytest.mark.parametrize("value", [frozenset({1}), ("a", ["b"]), object()])
+def test_cached_formatter__when_value_type_is_not_known_to_format_exactly__bypasses_cache(
+    value,
+):
+    sut = CachedFormatter(DefaultFormatter())
+
+    sut(value)
+    sut(value)
+
+    assert sut.stats.bypassed == 2
+    assert sut.stats.size == 0
+
+
+def test_cached_formatter__when_given_formatter_definition__loads_formatter():
+    sut = load_formatter(
+        "CachedFormatter",
+        [{"cls": "ListFormatter", "args": [", "]}],
+        {"max_size": 10},
+    )
+
+    assert sut.formatter == ListFormatter(", ")
+    assert sut((1, 2)) == "1, 2"
+
+
+def test_cached_formatter__when_given_max_size_below_one__raises_InvalidFormatter():
+    with pytest.raises(InvalidFormatter):
+        load_formatter(
+            "CachedFormatter", [{"cls": "DefaultFormatter"}], {"max_size": 0}
+        )
+
+
+def test_cached_formatter__when_pickled__round_trips_with_empty_cache():
+    sut = CachedFormatter(ListFormatter(", "))
+    sut((1, 2))
+
+    result = pickle.loads(pickle.dumps(sut))
+
+    assert result == sut
+    assert result.stats.size == 0
+    assert result((1, 2)) == "1, 2"
+
+
+def test_formatter_definition__when_formatter_created_directly__loads_equal_formatter():
+    sut = CachedFormatter(
+        ListFormatter(", ", item_formatter=CustomFormatter(), max_items=2), max_size=4
+    )
+    definition = sut.definition()
+
+    result = load_formatter(definition["cls"], definition["args"], definition["kwargs"])
+
+    assert definition["cache"] == 4
+    assert result == sut.formatter
+
+
+def test_formatter_definition__when_loaded__returns_definition_without_changing_formatter():
+    sut = load_formatter("tests.unit.test_formatter.ArgsFormatter", [1], {})
+
+    assert sut.definition() == {
+        "cls": "tests.unit.test_formatter.ArgsFormatter",
+        "args": [1],
+        "kwargs": {},
+    }
+    assert vars(sut) == {"args": (1,)}
+    assert pickle.loads(pickle.dumps(sut)).args == (1,)
+
+
+def test_formatter_definition__when_loaded_formatter_is_collected__forgets_definition():
+    sut = load_formatter("tests.unit.test_formatter.ArgsFormatter", [1], {})
+    key = id(sut)
+    assert key in formatter_module._DEFINITIONS
+
+    del sut
+    gc.collect()
+
+    assert key not in formatter_module._DEFINITIONS
@@ -1,4 +1,4 @@
-from templatr.helpers import DictObjectView
+from templatr.helpers import DictObjectView, build_function
 
 
 def test_dict_object_view__when_getting_value_that_does_exist_in_dict__returns_from_getattr():
@@ -13,3 +13,17 @@ def test_dict_object_view__when_getting_value_that_does_not_exist_in_dict__retur
     sut = DictObjectView(value)
 
     assert sut.dne is None
+
+
+def test_build_function__when_given_lines_and_names__builds_function_using_names():
+    sut = build_function("value", ["return value + OFFSET"], {"OFFSET": 1})
+
+    assert sut(1) == 2
+
+
+def test_build_function__when_building_same_lines_twice__shares_code():
+    first = build_function("value", ["return value + OFFSET"], {"OFFSET": 1})
+    second = build_function("value", ["return value + OFFSET"], {"OFFSET": 2})
+
+    assert first.__code__ is second.__code__
+    assert second(1) == 3
@@ -0,0 +1,125 @@
+from typing import Any
+
+import pytest
+
+from templatr.exceptions import MissingValue
+from templatr.formatter import ListFormatter, VariableFormatter
+from templatr.template import Template
+from templatr.variable import Variable
+
+
+class CountingFormatter(VariableFormatter):
+    def __init__(self) -> None:
+        self.values = []
+
+    def format(self, value: Any) -> Any:
+        self.values.append(value)
+        return value
+
+
+def _state() -> dict:
+    return {
+        "user": {"name": "ann", "status": "away"},
+        "unread": 3,
+        "items": ["a", "b"],
+    }
+
+
+@pytest.fixture
+def counter() -> CountingFormatter:
+    return CountingFormatter()
+
+
+@pytest.fixture
+def template(counter: CountingFormatter) -> Template:
+    return Template(
+        [
+            Variable("name", path="user.name", formatter=counter),
+            Variable("status", path="user.status"),
+            Variable("unread", formatter=counter),
+            Variable("items", formatter=ListFormatter(", ")),
+        ],
+        "{name} ({status!r}) has {unread:>3} unread: {items}. Bye {name}",
+    )
+
+
+def test_incremental__when_created__output_matches_format(template: Template):
+    assert template.incremental(_state()).output == template.format(_state())
+
+
+@pytest.mark.parametrize(
+    "changed, expected",
+    [
+        (["unread"], [5]),
+        (["user.name"], ["bob"]),
+        (["user"], ["bob"]),
+        ([("user", "name")], ["bob"]),
+        (["user.status"], []),
+        (["items.0"], []),
+        ([""], ["bob", 5]),
+    ],
+)
+def test_incremental__when_paths_changed__formats_only_affected_variables(
+    template: Template, counter: CountingFormatter, changed, expected
+):
+    sut = template.incremental(_state())
+    counter.values.clear()
+    state = _state()
+    state["user"]["name"] = "bob"
+    state["unread"] = 5
+    state["user"]["status"] = "online"
+    state["items"][0] = "z"
+
+    sut.update(state, changed)
+
+    assert counter.values == expected
+
+
+def test_incremental__when_updated__output_matches_format(template: Template):
+    sut = template.incremental(_state())
+    state = _state()
+    state["user"]["status"] = "online"
+    state["items"].append("c")
+
+    assert sut.update(state, ["user.status", "items.2"]) == template.format(state)
+    assert sut.output == template.format(state)
+    assert sut.values["items"] == "a, b, c"
+
+
+def test_incremental__when_nothing_affected__returns_same_output(template: Template):
+    sut = template.incremental(_state())
+
+    assert sut.update(_state(), ["other.path"]) is sut.output
+
+
+def test_incremental__when_value_goes_missing__raises_and_keeps_previous_output(
+    template: Template,
+):
+    sut = template.incremental(_state())
+    previous = sut.output
+    state = _state()
+    state["user"]["name"] = "bob"
+    del state["unread"]
+
+    with pytest.raises(MissingValue):
+        sut.update(state, ["user.name", "unread"])
+
+    assert sut.output == previous
+    assert sut.values["name"] == "ann"
+
+
+def test_incremental__when_text_is_not_tokenized__output_matches_format():
+    template = Template([Variable("name"), Variable("width")], "{name:{width}}")
+    sut = template.incremental({"name": "a", "width": 3})
+
+    assert template._parsed.segments is None
+    assert sut.update({"name": "b", "width": 3}, ["name"]) == "b  "
+
+
+def test_incremental__when_variables_share_a_key__uses_last_like_format():
+    template = Template(
+        [Variable("name", path="first"), Variable("name", path="second")], "{name}"
+    )
+    sut = template.incremental({"first": "a", "second": "b"})
+
+    assert sut.update({"first": "c", "second": "b"}, ["first"]) == "b"
@@ -1,5 +1,53 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
 import templatr
 
 
 def test_init__templatr_sets_version_in_init():
     assert getattr(templatr, "__version__")
+
+
+@pytest.mark.parametrize("name", templatr.__all__)
+def test_init__when_accessing_exported_name__imports_it(name: str):
+    assert getattr(templatr, name) is not None
+
+
+def test_init__when_accessing_unknown_name__raises_AttributeError():
+    with pytest.raises(AttributeError):
+        templatr.not_a_name
+
+
+def _imported_modules(code: str) -> set:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return set(result.stdout.split())
+
+
+def test_init__when_rendering_template_built_in_code__does_not_import_pydantic_or_yaml():
+    modules = _imported_modules(
+        "from templatr import Template, Variable\n"
+        "Template([Variable('name')], '{name}').format({'name': 'x'})"
+    )
+
+    assert "templatr.template" in modules
+    assert "pydantic" not in modules
+    assert "yaml" not in modules
+
+
+def test_init__when_loading_template_from_dict__imports_pydantic():
+    modules = _imported_modules(
+        "from templatr import Template\n"
+        "Template.from_dict({'text': '{name}', 'variables': [{'key': 'name'}]})"
+    )
+
+    assert "pydantic" in modules
+    assert "yaml" not in modules
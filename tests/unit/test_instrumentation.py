@@ -0,0 +1,228 @@
+import builtins
+import logging
+from typing import Any, Dict, List
+
+import pytest
+
+from templatr import instrumentation
+from templatr.exceptions import MissingValue
+from templatr.formatter import ListFormatter
+from templatr.instrumentation import (
+    DEFAULTED,
+    MISSING,
+    RESOLVED,
+    Instrument,
+    LoggingInstrument,
+    RenderRecord,
+    SpanInstrument,
+    StatsInstrument,
+)
+from templatr.template import Template
+from templatr.variable import Variable
+
+
+class ListInstrument(Instrument):
+    def __init__(self) -> None:
+        self.renders: List[RenderRecord] = []
+
+    def record(self, render: RenderRecord) -> None:
+        self.renders.append(render)
+
+
+def _template() -> Template:
+    return Template(
+        variables=[
+            Variable(key="NAME", path="user.name"),
+            Variable(key="TITLE", path="user.title", default="friend"),
+            Variable(key="TAGS", path="user.tags", formatter=ListFormatter(", ")),
+        ],
+        text="{TITLE} {NAME}: {TAGS}",
+    )
+
+
+DATA = {"user": {"name": "Bob", "tags": ["a", "b"]}}
+
+
+def test_instrumented_template__when_rendering__records_each_variable():
+    instrument = ListInstrument()
+    sut = _template()
+    sut.instrument(instrument)
+
+    output = sut.format(DATA)
+
+    [render] = instrument.renders
+    assert render.template is sut
+    assert render.output_size == len(output)
+    assert render.error is None
+    assert [record.key for record in render.variables] == ["NAME", "TITLE", "TAGS"]
+    assert [record.outcome for record in render.variables] == [
+        RESOLVED,
+        DEFAULTED,
+        RESOLVED,
+    ]
+    assert render.defaulted == 1
+    assert render.duration_ns >= sum(
+        record.resolve_ns + record.format_ns for record in render.variables
+    )
+
+
+def test_instrumented_template__when_value_is_missing__records_failed_render():
+    instrument = ListInstrument()
+    sut = _template()
+    sut.instrument(instrument)
+
+    with pytest.raises(MissingValue):
+        sut.format({"user": {"tags": []}})
+
+    [render] = instrument.renders
+    assert isinstance(render.error, MissingValue)
+    assert render.variables[-1].key == "NAME"
+    assert render.variables[-1].outcome == MISSING
+    assert render.missing == 1
+    assert render.output_size == 0
+
+
+def test_instrumented_template__when_formatting_many__records_every_render():
+    instrument = StatsInstrument()
+    sut = _template()
+    sut.compile()
+    sut.instrument(instrument)
+
+    outputs = list(sut.format_many([DATA, DATA], return_exceptions=True))
+    list(sut.format_many([{}], return_exceptions=True))
+
+    snapshot = instrument.snapshot()
+    assert snapshot["renders"] == 3
+    assert snapshot["errors"] == 1
+    assert snapshot["output_size"] == sum(map(len, outputs))
+    assert snapshot["variables"]["TITLE"]["defaulted"] == 2
+    assert snapshot["variables"]["NAME"]["missing"] == 1
+    assert snapshot["variables"]["TAGS"]["count"] == 2
+
+
+def test_instrumented_template__when_context_exits__restores_previous_instrument():
+    first, second = ListInstrument(), ListInstrument()
+    sut = _template()
+    sut.instrument(first)
+
+    with sut.instrumented(second):
+        sut.format(DATA)
+    sut.format(DATA)
+    sut.instrument(None)
+    sut.format(DATA)
+
+    assert len(first.renders) == 1
+    assert len(second.renders) == 1
+
+
+def test_instrumented_template__when_output_is_cached__still_records_renders():
+    instrument = ListInstrument()
+    sut = _template()
+    sut.enable_output_cache()
+    sut.instrument(instrument)
+
+    assert sut.format(DATA) == sut.format(DATA) == "friend Bob: a, b"
+    assert len(instrument.renders) == 2
+    assert sut.output_cache.stats.hits == 1
+
+
+def test_logging_instrument__when_recording__logs_render_with_variable_timings(
+    caplog,
+):
+    sut = _template()
+    sut.instrument(LoggingInstrument(name="welcome"))
+
+    with caplog.at_level(logging.DEBUG, logger="templatr"):
+        sut.format(DATA)
+
+    [log] = caplog.records
+    assert log.levelno == logging.DEBUG
+    assert "rendered welcome in" in log.getMessage()
+    assert "TITLE=" in log.getMessage() and "defaulted" in log.getMessage()
+    assert log.templatr_render.output_size == len("friend Bob: a, b")
+
+
+def test_logging_instrument__when_render_is_faster_than_slow_ms__logs_nothing(
+    caplog,
+):
+    sut = _template()
+    sut.instrument(LoggingInstrument(slow_ms=60_000))
+
+    with caplog.at_level(logging.DEBUG, logger="templatr"):
+        sut.format(DATA)
+        with pytest.raises(MissingValue):
+            sut.format({})
+
+    [log] = caplog.records
+    assert log.levelno == logging.WARNING
+
+
+class FakeSpan:
+    def __init__(self, name: str, context: Any, start_time: int) -> None:
+        self.name = name
+        self.context = context
+        self.start_time = start_time
+        self.end_time = None
+        self.attributes: Dict[str, Any] = {}
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, end_time: int = None) -> None:
+        self.end_time = end_time
+
+
+class FakeTracer:
+    def __init__(self) -> None:
+        self.spans: List[FakeSpan] = []
+
+    def start_span(self, name: str, context: Any = None, start_time: int = None):
+        span = FakeSpan(name, context, start_time)
+        self.spans.append(span)
+        return span
+
+
+def test_span_instrument__when_recording__creates_render_and_variable_spans():
+    tracer = FakeTracer()
+    sut = _template()
+    sut.instrument(SpanInstrument(tracer))
+
+    sut.format(DATA)
+
+    render, *variables = tracer.spans
+    assert render.name == "templatr.render"
+    assert render.attributes["templatr.defaulted"] == 1
+    assert render.end_time > render.start_time
+    assert [span.attributes["templatr.key"] for span in variables] == [
+        "NAME",
+        "TITLE",
+        "TAGS",
+    ]
+    for span in variables:
+        assert render.start_time <= span.start_time <= span.end_time <= render.end_time
+
+
+def test_span_instrument__when_opentelemetry_is_not_installed__imports_it_once(
+    monkeypatch,
+):
+    imports = []
+    original_import = builtins.__import__
+
+    def counting_import(name, *args, **kwargs):
+        if name == "opentelemetry":
+            imports.append(name)
+            raise ImportError(name)
+        return original_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", counting_import)
+    instrumentation._set_span_in_context.cache_clear()
+    tracer = FakeTracer()
+    sut = _template()
+    sut.instrument(SpanInstrument(tracer))
+
+    sut.format(DATA)
+    sut.format(DATA)
+    instrumentation._set_span_in_context.cache_clear()
+
+    assert imports == ["opentelemetry"]
+    assert all(span.context is None for span in tracer.spans)
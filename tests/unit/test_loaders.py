@@ -0,0 +1,53 @@
+import io
+import json
+import sys
+
+import pytest
+
+from templatr.exceptions import UnsupportedSource
+from templatr.loaders import _load_json, parse_json, parse_yaml, read_source
+
+
+def test_read_source__when_given_path__reads_bytes(tmp_path):
+    path = tmp_path / "template.json"
+    path.write_text("{}")
+
+    assert read_source(str(path)) == b"{}"
+
+
+@pytest.mark.parametrize("source", [io.StringIO("{}"), io.BytesIO(b"{}")])
+def test_read_source__when_given_file_object__reads_content(source):
+    assert read_source(source) in ("{}", b"{}")
+
+
+def test_read_source__when_given_unreadable_object__raises_UnsupportedSource():
+    with pytest.raises(UnsupportedSource):
+        read_source(object())
+
+
+@pytest.mark.parametrize("content", ['{"text": "✓"}', '{"text": "✓"}'.encode()])
+def test_parse_json__when_given_json__parses_document(content):
+    assert parse_json(content) == {"text": "✓"}
+
+
+def test_parse_json__when_given_invalid_json__raises_ValueError():
+    with pytest.raises(ValueError):
+        parse_json("{")
+
+
+@pytest.mark.parametrize("content", ["text: ✓", "text: ✓".encode()])
+def test_parse_yaml__when_given_yaml__parses_document(content):
+    assert parse_yaml(content) == {"text": "✓"}
+
+
+def test_load_json__when_no_faster_parser_installed__uses_standard_library(
+    monkeypatch,
+):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "ujson", None)
+    _load_json.cache_clear()
+
+    try:
+        assert _load_json() is json.loads
+    finally:
+        _load_json.cache_clear()
@@ -0,0 +1,73 @@
+import pytest
+
+from templatr.exceptions import MissingValue
+from templatr.formatter import load_formatter
+from templatr.parallel import format_jsonl_parallel, format_parallel
+from templatr.template import Template
+from templatr.variable import Variable
+
+
+def _template() -> Template:
+    return Template(variables=[Variable(key="name")], text="Hello {name}")
+
+
+def test_format_parallel__when_given_records__yields_output_in_record_order():
+    records = [{"name": str(index)} for index in range(25)]
+    result = format_parallel(_template(), records, workers=2, chunksize=3)
+
+    assert list(result) == [f"Hello {index}" for index in range(25)]
+
+
+def test_format_parallel__when_given_no_records__yields_nothing():
+    assert list(format_parallel(_template(), [], workers=2)) == []
+
+
+def test_format_parallel__when_record_is_missing_value__raises_MissingValue():
+    with pytest.raises(MissingValue):
+        list(format_parallel(_template(), [{"name": "Bob"}, {}], workers=1))
+
+
+def test_format_parallel__when_returning_exceptions__yields_exception_in_place():
+    result = list(
+        format_parallel(_template(), [{}, {"name": "Bob"}], return_exceptions=True)
+    )
+
+    assert isinstance(result[0], MissingValue)
+    assert result[1] == "Hello Bob"
+
+
+def test_format_parallel__when_template_uses_custom_formatter__formats_in_workers():
+    formatter = load_formatter("tests.unit.test_formatter.CustomFormatter", [], {})
+    template = Template(
+        variables=[Variable(key="name", formatter=formatter)], text="{name}"
+    )
+    result = format_parallel(template, [{"name": "Bob"}], workers=1)
+
+    assert list(result) == ["Custom: Bob"]
+
+
+def test_format_parallel__when_template_is_compiled__formats_in_workers():
+    template = _template()
+    template.compile()
+    result = template.format_parallel([{"name": "Bob"}], workers=1)
+
+    assert list(result) == ["Hello Bob"]
+
+
+def test_format_parallel__when_template_caches_output__caches_in_workers():
+    template = _template()
+    template.enable_output_cache(max_entries=4)
+    result = template.format_parallel([{"name": "Bob"}] * 3, workers=1)
+
+    assert list(result) == ["Hello Bob"] * 3
+
+
+def test_format_jsonl_parallel__when_file_spans_many_ranges__yields_output_in_line_order(
+    tmp_path,
+):
+    path = tmp_path / "records.jsonl"
+    path.write_text("".join(f'{{"name": "{index}"}}\n' for index in range(40)))
+
+    result = format_jsonl_parallel(_template(), str(path), workers=2, chunk_bytes=50)
+
+    assert list(result) == [f"Hello {index}" for index in range(40)]
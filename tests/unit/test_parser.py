@@ -0,0 +1,117 @@
+import pickle
+
+import pytest
+
+from templatr.parser import Field, parse_text
+
+
+class Person:
+    def __init__(self) -> None:
+        self.first = "Jeffery"
+        self.tags = ["a", "b"]
+
+
+VALUES = {
+    "name": "Jeffery",
+    "age": 20,
+    "price": 3.14159,
+    "person": Person(),
+    "mapping": {"key": "value", 0: "zero"},
+}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "BASIC",
+        "Hello {name}!",
+        "{name}{name}{age}",
+        "{age:>5}|{age:<5}|{age:^5}|{age:05d}",
+        "{price:.2f} {price:e} {price!s:>12}",
+        "{name!r} {name!s} {name!a}",
+        "{person.first} {person.tags[1]} {mapping[key]} {mapping[0]}",
+        "{{escaped}} {{{name}}} }}{{",
+        "unicode ✓ {name:✓^11}",
+        "{name!r:>12} {age:=+6} {age:,} {price:.1%}",
+        "quotes ' \" and \\ {name:\"^9} {name!r:'<12}",
+    ],
+)
+def test_parse_text__when_rendering__matches_str_format(text: str):
+    sut = parse_text(text)
+
+    assert sut.segments is not None
+    assert sut.render(VALUES) == text.format(**VALUES)
+
+
+def test_parse_text__when_given_fields__splits_text_into_literals_and_fields():
+    sut = parse_text("Hello {name!r:>10}, {{age}}")
+
+    assert sut.segments == (
+        "Hello ",
+        Field(key="name", lookups=(), conversion=repr, spec=">10", plain=False),
+        ", {age}",
+    )
+
+
+def test_parse_text__when_given_lookups__stores_attribute_and_index_lookups():
+    sut = parse_text("{person.tags[0]}")
+
+    assert sut.fields[0].lookups == ((True, "tags"), (False, 0))
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["{}", "{0}", "{age:{name}}", "{name!z}", "{name", "name}"],
+)
+def test_parse_text__when_text_cannot_be_tokenized__falls_back_to_str_format(
+    text: str,
+):
+    sut = parse_text(text)
+
+    assert sut.segments is None
+    assert sut.fields == []
+
+
+def test_parse_text__when_falling_back__raises_same_error_as_str_format():
+    sut = parse_text("{name")
+
+    with pytest.raises(ValueError):
+        sut.render(VALUES)
+
+
+def test_parse_text__when_falling_back_with_nested_spec__renders_with_str_format():
+    sut = parse_text("{age:{width}}")
+
+    assert sut.render({"age": 20, "width": 5}) == "   20"
+
+
+def test_parsed_text__when_key_is_missing__raises_KeyError():
+    sut = parse_text("{name} {missing}")
+
+    with pytest.raises(KeyError):
+        sut.render(VALUES)
+
+
+def test_parsed_text__when_rendering_columns__matches_str_format_per_row():
+    text = "{name!r:>12} is {age:03d}"
+    columns = {"name": ["Jeffery", "Billy"], "age": [20, 7]}
+    sut = parse_text(text)
+
+    assert list(sut.render_columns(columns, 2)) == [
+        text.format(name="Jeffery", age=20),
+        text.format(name="Billy", age=7),
+    ]
+
+
+def test_parsed_text__when_rendering_columns_of_untokenized_text__uses_str_format():
+    sut = parse_text("{age:{width}}")
+
+    assert list(sut.render_columns({"age": [1], "width": [3]}, 1)) == ["  1"]
+
+
+def test_parsed_text__when_pickled__renders_after_loading():
+    sut = parse_text("Hello {name!r:>10}")
+    sut.render(VALUES)
+
+    assert pickle.loads(pickle.dumps(sut)).render(VALUES) == "Hello  'Jeffery'"
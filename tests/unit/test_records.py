@@ -0,0 +1,132 @@
+import io
+
+import pytest
+
+from templatr.exceptions import InvalidRecord
+from templatr.records import (
+    MappedJsonl,
+    input_format,
+    read_csv,
+    read_jsonl,
+    read_records,
+    record_fields,
+)
+from templatr.template import Template
+
+
+def test_read_jsonl__when_given_blank_lines__skips_them():
+    fp = io.BytesIO(b'{"a": 1}\n\n  \n{"a": 2}')
+
+    assert list(read_jsonl(fp)) == [{"a": 1}, {"a": 2}]
+
+
+def test_read_jsonl__when_line_is_not_json__raises_InvalidRecord_with_line_number():
+    fp = io.BytesIO(b'{"a": 1}\n{"a":\n')
+
+    with pytest.raises(InvalidRecord) as error:
+        list(read_jsonl(fp, "records.jsonl"))
+
+    assert error.value.line == 2
+    assert error.value.source == "records.jsonl"
+
+
+def test_read_csv__when_columns_are_dotted_paths__reads_nested_records():
+    fp = io.StringIO("id,user.name,user.city\n1,ann,Austin\n")
+
+    assert list(read_csv(fp)) == [
+        {"id": "1", "user": {"name": "ann", "city": "Austin"}}
+    ]
+
+
+def test_read_csv__when_empty__reads_no_records():
+    assert list(read_csv(io.StringIO(""))) == []
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [("-", "jsonl"), ("a.csv", "csv"), ("a.CSV", "csv"), ("a.jsonl", "jsonl")],
+)
+def test_input_format__when_given_path__picks_format_by_extension(path, expected):
+    assert input_format(path) == expected
+
+
+def test_read_records__when_given_several_inputs__reads_them_in_order(tmp_path):
+    (tmp_path / "a.jsonl").write_text('{"n": 1}\n')
+    (tmp_path / "b.csv").write_text("n\n2\n")
+
+    result = read_records([str(tmp_path / "a.jsonl"), str(tmp_path / "b.csv")])
+
+    assert list(result) == [{"n": 1}, {"n": "2"}]
+
+
+def _jsonl(tmp_path, lines) -> str:
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(b"\n".join(lines) + b"\n")
+    return str(path)
+
+
+def test_mapped_jsonl__when_iterated__reads_records_like_read_jsonl(tmp_path):
+    lines = [b'{"a": 1}', b"", b"  ", b"null", b'[1, "\xe2\x9c\x93"]', b'{"a": 2}\r']
+    path = _jsonl(tmp_path, lines)
+
+    with open(path, "rb") as fp:
+        assert list(MappedJsonl(path)) == list(read_jsonl(fp))
+
+
+def test_mapped_jsonl__when_given_fields__keeps_only_those_fields(tmp_path):
+    path = _jsonl(tmp_path, [b'{"a": 1, "b": {"c": 2}, "d": 3}', b"[1]"])
+
+    assert list(MappedJsonl(path, fields=["a", "b"])) == [
+        {"a": 1, "b": {"c": 2}},
+        [1],
+    ]
+
+
+def test_mapped_jsonl__when_line_is_not_json__raises_InvalidRecord_with_line_number(
+    tmp_path,
+):
+    path = _jsonl(tmp_path, [b'{"a": 1}', b"", b'{"a":'])
+
+    with pytest.raises(InvalidRecord) as error:
+        list(MappedJsonl(path))
+
+    assert error.value.line == 3
+
+
+def test_mapped_jsonl__when_file_is_empty__reads_no_records(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(b"")
+
+    assert list(MappedJsonl(str(path))) == []
+    assert MappedJsonl(str(path)).ranges(4) == []
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 100])
+def test_mapped_jsonl__when_split_into_ranges__ranges_cover_file_on_line_ends(
+    tmp_path, parts: int
+):
+    path = _jsonl(tmp_path, [b'{"n": %d}' % index for index in range(20)])
+    sut = MappedJsonl(path)
+
+    ranges = sut.ranges(parts)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == sut.size()
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert len(ranges) <= parts
+    assert [
+        record for start, end in ranges for record in sut.read_range(start, end)
+    ] == [{"n": index} for index in range(20)]
+
+
+def test_record_fields__when_given_template__returns_first_part_of_used_paths():
+    template = Template(
+        [
+            {"key": "name", "path": "user.name"},
+            {"key": "city", "path": "user.address.city"},
+            {"key": "total"},
+            {"key": "unused", "path": "other"},
+        ],
+        "{name} {city} {total}",
+    )
+
+    assert record_fields(template) == {"user", "total"}
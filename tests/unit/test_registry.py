@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+
+import pytest
+
+from templatr import registry
+from templatr.exceptions import UndeclaredFields, UnknownTemplate
+from templatr.registry import TemplateRegistry
+
+
+def _write(path, text: str, mtime_ns: int = 1_000_000_000) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"text": text, "variables": [{"key": "name"}]}))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def root(tmp_path):
+    _write(tmp_path / "welcome.json", "Welcome {name}")
+    _write(tmp_path / "tenant" / "bye.yaml", "Bye {name}")
+    (tmp_path / "notes.txt").write_text("not a template")
+    return tmp_path
+
+
+def test_template_registry__when_created__indexes_templates_without_loading_them(
+    root,
+):
+    sut = TemplateRegistry(str(root))
+
+    assert sut.names() == ["tenant/bye", "welcome"]
+    assert "tenant/bye" in sut
+    assert len(sut) == 2
+    assert sut.stats.loaded == 0
+
+
+def test_template_registry__when_getting_template__loads_it_once(root):
+    sut = TemplateRegistry(str(root))
+
+    first = sut.get("tenant/bye")
+    second = sut["tenant/bye"]
+
+    assert first is second
+    assert first.format({"name": "Bob"}) == "Bye Bob"
+    assert sut.stats.misses == 1
+    assert sut.stats.hits == 1
+
+
+def test_template_registry__when_getting_unknown_template__raises_UnknownTemplate(
+    root,
+):
+    sut = TemplateRegistry(str(root))
+
+    with pytest.raises(UnknownTemplate):
+        sut.get("missing")
+
+
+def test_template_registry__when_strict_and_template_has_undeclared_fields__raises_UndeclaredFields(
+    root,
+):
+    _write(root / "broken.json", "Hi {nickname}")
+    sut = TemplateRegistry(str(root), strict=True)
+
+    assert sut.get("welcome").format({"name": "Bob"}) == "Welcome Bob"
+    with pytest.raises(UndeclaredFields):
+        sut.get("broken")
+
+
+def test_template_registry__when_name_leaves_root__raises_UnknownTemplate(root):
+    sut = TemplateRegistry(str(root / "tenant"))
+
+    with pytest.raises(UnknownTemplate):
+        sut.get("../welcome")
+
+
+def test_template_registry__when_template_added_after_scan__loads_it(root):
+    sut = TemplateRegistry(str(root))
+    _write(root / "added.yml", "Added {name}")
+
+    assert sut.get("added").format({"name": "Bob"}) == "Added Bob"
+
+
+def test_template_registry__when_same_name_has_yaml_and_json__prefers_yaml(root):
+    _write(root / "welcome.yaml", "Yaml {name}")
+    sut = TemplateRegistry(str(root))
+
+    assert sut.get("welcome").text == "Yaml {name}"
+
+
+def test_template_registry__when_file_changes__reloads_template(root):
+    sut = TemplateRegistry(str(root), check_interval=0)
+    sut.get("welcome")
+    _write(root / "welcome.json", "Hello again {name}", mtime_ns=2_000_000_000)
+
+    assert sut.get("welcome").text == "Hello again {name}"
+    assert sut.stats.reloads == 1
+
+
+def test_template_registry__when_file_touched_without_changes__keeps_template(root):
+    sut = TemplateRegistry(str(root), check_interval=0)
+    template = sut.get("welcome")
+    os.utime(root / "welcome.json", ns=(2_000_000_000, 2_000_000_000))
+
+    assert sut.get("welcome") is template
+    assert sut.stats.reloads == 0
+
+
+def test_template_registry__when_file_changes_within_check_interval__keeps_template(
+    root,
+):
+    sut = TemplateRegistry(str(root), check_interval=3600)
+    template = sut.get("welcome")
+    _write(root / "welcome.json", "Hello again {name}", mtime_ns=2_000_000_000)
+
+    assert sut.get("welcome") is template
+
+
+def test_template_registry__when_file_removed__raises_UnknownTemplate(root):
+    sut = TemplateRegistry(str(root), check_interval=0)
+    sut.get("welcome")
+    os.remove(root / "welcome.json")
+
+    with pytest.raises(UnknownTemplate):
+        sut.get("welcome")
+    assert sut.stats.loaded == 0
+
+
+def test_template_registry__when_over_max_templates__evicts_least_recently_used(
+    root,
+):
+    sut = TemplateRegistry(str(root), max_templates=1)
+    sut.get("welcome")
+    sut.get("tenant/bye")
+
+    assert sut.stats.loaded == 1
+    assert sut.stats.evictions == 1
+    sut.get("tenant/bye")
+    assert sut.stats.hits == 1
+
+
+def test_template_registry__when_over_max_bytes__evicts_least_recently_used(root):
+    size = os.path.getsize(root / "welcome.json")
+    sut = TemplateRegistry(str(root), max_bytes=size)
+    sut.get("welcome")
+    sut.get("tenant/bye")
+
+    assert sut.stats.loaded == 1
+    assert sut.stats.evictions == 1
+
+
+def test_template_registry__when_used_from_threads__loads_template_once(root):
+    sut = TemplateRegistry(str(root))
+    results = []
+
+    def get():
+        results.append(sut.get("welcome"))
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(result is results[0] for result in results)
+    assert sut.stats.misses == 1
+
+
+def test_template_registry__when_template_is_loading__serves_loaded_templates(
+    root, monkeypatch
+):
+    sut = TemplateRegistry(str(root))
+    welcome = sut.get("welcome")
+    parsing = threading.Event()
+    release = threading.Event()
+    parse = registry._parse
+
+    def slow_parse(*args):
+        parsing.set()
+        release.wait(5)
+        return parse(*args)
+
+    monkeypatch.setattr(registry, "_parse", slow_parse)
+    loader = threading.Thread(target=sut.get, args=("tenant/bye",))
+    loader.start()
+    assert parsing.wait(5)
+
+    hit = []
+    reader = threading.Thread(target=lambda: hit.append(sut.get("welcome")))
+    reader.start()
+    reader.join(1)
+    release.set()
+    loader.join()
+
+    assert hit == [welcome]
+    assert sut.stats.loaded == 2
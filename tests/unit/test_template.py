@@ -1,3 +1,15 @@
+import asyncio
+import io
+import itertools
+import pickle
+from typing import Any
+
+import pytest
+
+from templatr import template as template_module
+from templatr.exceptions import MismatchedColumns, MissingValue, UndeclaredFields
+from templatr.formatter import ListFormatter, VariableFormatter
+from templatr.parser import parse_text
 from templatr.template import Template
 from templatr.variable import Variable
 
@@ -87,3 +99,623 @@ def test_template__when_parsing_dict_with_variable__parses_into_template_as_expe
 
     assert sut.text == "{name}"
     assert sut.variables == [Variable(key="name")]
+
+
+def test_template__when_text_uses_conversions_and_format_specs__formats_like_str_format():
+    sut = Template(
+        variables=[
+            Variable(key="name"),
+            Variable(key="age"),
+        ],
+        text="{name!r} is {age:>5} years old",
+    )
+    result = sut.format({"name": "Jeffery", "age": 20})
+
+    assert result == "'Jeffery' is    20 years old"
+
+
+def test_template__when_text_is_reassigned__formats_with_new_text():
+    sut = Template(variables=[Variable(key="name")], text="Hello {name}")
+    sut.format({"name": "Jeffery"})
+    sut.text = "Bye {name}"
+
+    assert sut.format({"name": "Jeffery"}) == "Bye Jeffery"
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+@pytest.mark.parametrize(
+    "change, expected",
+    [
+        (lambda variables: setattr(variables[0], "path", "b"), "B"),
+        (lambda variables: setattr(variables[1], "key", "name"), "C"),
+        (
+            lambda variables: setattr(variables[0], "formatter", ListFormatter("-")),
+            "a-a",
+        ),
+    ],
+)
+def test_template__when_variable_changes__formats_with_changed_variable(
+    compiled: bool, change, expected: str
+):
+    sut = Template(
+        variables=[Variable(key="name", path="a"), Variable(key="other", path="c")],
+        text="{name}",
+    )
+    if compiled:
+        sut.compile()
+    sut.format({"a": "aa", "b": "B", "c": "C"})
+
+    change(sut.variables)
+
+    assert sut.format({"a": "aa", "b": "B", "c": "C"}) == expected
+
+
+def test_template__when_variables_are_read__keeps_compiled_function():
+    sut = Template(variables=[Variable(key="name", path="user.name")], text="{name}")
+    compiled = sut.compile()
+
+    sut.variables[0].resolve({"user": {"name": "ann"}})
+    list(sut.iter_chunks({"user": {"name": "ann"}}))
+
+    assert sut._compiled is compiled
+
+
+def test_template__when_rendering_first_time__parses_text_once(monkeypatch):
+    parsed = []
+
+    def counting_parse_text(text: str):
+        parsed.append(text)
+        return parse_text(text)
+
+    monkeypatch.setattr(template_module, "parse_text", counting_parse_text)
+    sut = Template(variables=[Variable(key="name", path="user.name")], text="{name}")
+    output_cache = sut.enable_output_cache()
+
+    sut.format({"user": {"name": "ann"}})
+    sut.format({"user": {"name": "ann"}})
+
+    assert parsed == ["{name}"]
+    assert output_cache.stats.hits == 1
+
+
+def test_template__when_variable_default_changes__uses_new_default():
+    variable = Variable(key="name", default="a")
+    first = Template(variables=[variable], text="{name}")
+    second = Template(variables=[variable], text="{name}!")
+    first.compile()
+    first.format({})
+
+    variable.default = "b"
+
+    assert first.format({}) == "b"
+    assert second.format({}) == "b!"
+
+
+class CountingFormatter(VariableFormatter):
+    calls = 0
+
+    def format(self, value: Any) -> str:
+        CountingFormatter.calls += 1
+        return str(value)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_template__when_variables_are_not_referenced__skips_resolving_them(
+    compiled: bool,
+):
+    CountingFormatter.calls = 0
+    sut = Template(
+        variables=[
+            Variable(key="NAME", path=["name"]),
+            Variable(key="UNUSED", path=["missing"], formatter=CountingFormatter()),
+        ],
+        text="Hello {NAME}!",
+    )
+    if compiled:
+        sut.compile()
+
+    assert sut.format({"name": "Jeffery"}) == "Hello Jeffery!"
+    assert list(sut.format_many([{"name": "Billy"}])) == ["Hello Billy!"]
+    assert CountingFormatter.calls == 0
+
+
+def test_template__when_text_is_reassigned__prunes_against_new_text():
+    sut = Template(
+        variables=[Variable(key="A", path=["a"]), Variable(key="B", path=["b"])],
+        text="{A}",
+    )
+    sut.text = "{B}"
+
+    assert sut.analyze().unused_variables == ["A"]
+    assert sut.format({"b": 2}) == "2"
+
+
+def test_template__when_checking_text_with_undeclared_fields__raises_UndeclaredFields():
+    sut = Template(variables=[Variable(key="A")], text="{A} {B} {C}")
+
+    with pytest.raises(UndeclaredFields) as exc_info:
+        sut.check()
+
+    assert exc_info.value.fields == ["B", "C"]
+
+
+def test_template__when_parsing_dict_strictly_with_undeclared_fields__raises_UndeclaredFields():
+    with pytest.raises(UndeclaredFields):
+        Template.from_dict({"variables": [], "text": "{A}"}, strict=True)
+
+
+class Customer:
+    reads = 0
+
+    @property
+    def address(self) -> dict:
+        Customer.reads += 1
+        return {"city": "Austin", "zip": "78701"}
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_template__when_paths_share_a_prefix__reads_prefix_once_per_render(
+    compiled: bool,
+):
+    Customer.reads = 0
+    sut = Template(
+        variables=[
+            Variable(key="CITY", path="customer.address.city"),
+            Variable(key="ZIP", path="customer.address.zip"),
+        ],
+        text="{CITY} {ZIP}",
+    )
+    if compiled:
+        sut.compile()
+
+    assert sut.format({"customer": Customer()}) == "Austin 78701"
+    assert list(sut.format_many([{"customer": Customer()}])) == ["Austin 78701"]
+    assert Customer.reads == 2
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_template__when_several_values_are_missing__raises_for_first_variable(
+    compiled: bool,
+):
+    sut = Template(
+        variables=[
+            Variable(key="A", path="a.x"),
+            Variable(key="B", path="b"),
+            Variable(key="C", path="a.y"),
+        ],
+        text="{A} {B} {C}",
+    )
+    if compiled:
+        sut.compile()
+
+    with pytest.raises(MissingValue) as exc_info:
+        sut.format({"b": 1})
+
+    assert exc_info.value.key == "A"
+
+
+def test_template__when_compiled__formats_with_compiled_function():
+    sut = Template(variables=[Variable(key="name")], text="Hello {name}")
+    render = sut.compile()
+
+    assert sut.format({"name": "Jeffery"}) == "Hello Jeffery"
+    assert render({"name": "Jeffery"}) == "Hello Jeffery"
+
+
+def test_template__when_compiled__still_equals_uncompiled_template():
+    sut = Template(variables=[Variable(key="name")], text="Hello {name}")
+    sut.compile()
+
+    assert sut == Template(variables=[Variable(key="name")], text="Hello {name}")
+
+
+def test_template__when_formatting_many__formats_each_record_in_order():
+    sut = Template(variables=[Variable(key="name")], text="Hello {name}")
+    result = sut.format_many([{"name": "Jeffery"}, {"name": "Billy"}])
+
+    assert list(result) == ["Hello Jeffery", "Hello Billy"]
+
+
+def test_template__when_formatting_many__consumes_records_lazily():
+    sut = Template(variables=[Variable(key="name")], text="Hello {name}")
+    records = ({"name": str(index)} for index in itertools.count())
+
+    result = sut.format_many(records)
+
+    assert list(itertools.islice(result, 2)) == ["Hello 0", "Hello 1"]
+
+
+def test_template__when_formatting_many_with_missing_value__raises_MissingValue():
+    sut = Template(variables=[Variable(key="name")], text="Hello {name}")
+
+    with pytest.raises(MissingValue):
+        list(sut.format_many([{"name": "Jeffery"}, {}]))
+
+
+def test_template__when_formatting_many_returning_exceptions__yields_exception_in_place():
+    sut = Template(variables=[Variable(key="name")], text="Hello {name}")
+    result = list(sut.format_many([{}, {"name": "Billy"}], return_exceptions=True))
+
+    assert isinstance(result[0], MissingValue)
+    assert result[1] == "Hello Billy"
+
+
+def test_template__when_compiled_and_formatting_many__uses_compiled_function():
+    sut = Template(variables=[Variable(key="name")], text="Hello {name}")
+    sut.compile()
+    result = sut.format_many([{"name": "Jeffery"}], return_exceptions=True)
+
+    assert list(result) == ["Hello Jeffery"]
+
+
+def test_template__when_formatting_columns__formats_each_row():
+    sut = Template(
+        variables=[
+            Variable(key="name"),
+            Variable(key="reasons", formatter=ListFormatter(", ")),
+        ],
+        text="{name:>5}: {reasons}",
+    )
+    result = sut.format_columns(
+        {"name": ["Bob", "Billy"], "reasons": [["a", "b"], ["c"]]}
+    )
+
+    assert list(result) == ["  Bob: a, b", "Billy: c"]
+
+
+def test_template__when_formatting_columns__matches_dotted_path_to_column():
+    sut = Template(
+        variables=[Variable(key="city", path="user.address.city")],
+        text="{city}",
+    )
+    result = sut.format_columns({"user.address.city": ["Austin", "Dallas"]})
+
+    assert list(result) == ["Austin", "Dallas"]
+
+
+def test_template__when_formatting_columns__resolves_rest_of_path_from_column_values():
+    sut = Template(
+        variables=[Variable(key="city", path="user.address.city", default="?")],
+        text="{city}",
+    )
+    result = sut.format_columns({"user": [{"address": {"city": "Austin"}}, {}]})
+
+    assert list(result) == ["Austin", "?"]
+
+
+def test_template__when_formatting_columns_without_column_for_variable__uses_default():
+    sut = Template(
+        variables=[Variable(key="name"), Variable(key="unset", default="NOT SET")],
+        text="{name} {unset}",
+    )
+    result = sut.format_columns({"name": ["Bob", "Billy"]})
+
+    assert list(result) == ["Bob NOT SET", "Billy NOT SET"]
+
+
+def test_template__when_formatting_columns_without_column_or_default__raises_MissingValue():
+    sut = Template(variables=[Variable(key="name")], text="{name}")
+
+    with pytest.raises(MissingValue):
+        sut.format_columns({"other": [1]})
+
+
+def test_template__when_formatting_columns_of_different_lengths__raises_MismatchedColumns():
+    sut = Template(variables=[Variable(key="name")], text="{name}")
+
+    with pytest.raises(MismatchedColumns):
+        sut.format_columns({"name": [1, 2], "other": [1]})
+
+
+def test_template__when_formatting_numpy_record_array__formats_each_row():
+    numpy = pytest.importorskip("numpy")
+    records = numpy.array(
+        [("Bob", 20), ("Billy", 22)], dtype=[("name", "U10"), ("age", "i4")]
+    )
+    sut = Template(
+        variables=[Variable(key="name"), Variable(key="age")],
+        text="{name} is {age:>3}",
+    )
+
+    assert list(sut.format_columns(records)) == ["Bob is  20", "Billy is  22"]
+
+
+def test_template__when_pickled_after_rendering__round_trips():
+    sut = Template(variables=[Variable(key="name", path="user.name")], text="{name}")
+    sut.format({"user": {"name": "Bob"}})
+    sut.compile()
+
+    result = pickle.loads(pickle.dumps(sut))
+
+    assert result == sut
+    assert result.format({"user": {"name": "Bob"}}) == "Bob"
+
+
+class AsyncFormatter(VariableFormatter):
+    def __init__(self) -> None:
+        self.running = 0
+        self.most_running = 0
+
+    async def format(self, value: Any) -> Any:
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return f"async {value}"
+
+
+async def _lazy(value: Any) -> Any:
+    await asyncio.sleep(0)
+    return value
+
+
+def test_template__when_async_formatting_awaitable_values__awaits_values():
+    sut = Template(
+        variables=[Variable(key="name"), Variable(key="age")],
+        text="{name} is {age:>3}",
+    )
+    result = asyncio.run(sut.aformat({"name": _lazy("Bob"), "age": 20}))
+
+    assert result == "Bob is  20"
+
+
+def test_template__when_async_formatting_with_async_formatters__runs_them_concurrently():
+    formatter = AsyncFormatter()
+    sut = Template(
+        variables=[
+            Variable(key="first", formatter=formatter),
+            Variable(key="second", formatter=formatter),
+        ],
+        text="{first}, {second}",
+    )
+    result = asyncio.run(sut.aformat({"first": 1, "second": _lazy(2)}))
+
+    assert result == "async 1, async 2"
+    assert formatter.most_running == 2
+
+
+def test_template__when_async_formatting_with_concurrency__bounds_running_formatters():
+    formatter = AsyncFormatter()
+    sut = Template(
+        variables=[
+            Variable(key="first", formatter=formatter),
+            Variable(key="second", formatter=formatter),
+        ],
+        text="{first}, {second}",
+    )
+    result = asyncio.run(sut.aformat({"first": 1, "second": 2}, concurrency=1))
+
+    assert result == "async 1, async 2"
+    assert formatter.most_running == 1
+
+
+def test_template__when_async_formatting_missing_value__raises_MissingValue():
+    sut = Template(
+        variables=[Variable(key="first"), Variable(key="second")],
+        text="{first}, {second}",
+    )
+
+    with pytest.raises(MissingValue):
+        asyncio.run(sut.aformat({"first": 1}))
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "BASIC", "Hi {NAME}, {NAME!r:>12} is {AGE:03d}.", "{AGE:{NAME}}"],
+)
+def test_template__when_iterating_chunks__joins_into_same_output_as_format(
+    text: str,
+):
+    sut = Template(
+        variables=[
+            Variable(key="NAME", path=["name"]),
+            Variable(key="AGE", path=["age"]),
+        ],
+        text=text,
+    )
+    data = {"name": "5", "age": 7}
+
+    assert "".join(sut.iter_chunks(data)) == sut.format(data)
+
+
+def test_template__when_iterating_chunks__yields_literals_and_values_separately():
+    sut = Template(
+        variables=[Variable(key="NAME", path=["name"])], text="Hi {NAME}, bye {NAME}"
+    )
+
+    assert list(sut.iter_chunks({"name": "Bob"})) == ["Hi ", "Bob", ", bye ", "Bob"]
+
+
+def test_template__when_iterating_chunks_with_repeated_key__formats_value_once():
+    CountingFormatter.calls = 0
+    sut = Template(
+        variables=[Variable(key="A", path=["a"], formatter=CountingFormatter())],
+        text="{A}{A}{A}",
+    )
+
+    assert "".join(sut.iter_chunks({"a": 1})) == "111"
+    assert CountingFormatter.calls == 1
+
+
+def test_template__when_iterating_chunks_with_missing_value__raises_before_first_chunk():
+    sut = Template(
+        variables=[Variable(key="A", path=["a"]), Variable(key="B", path=["b"])],
+        text="start {A} {B}",
+    )
+
+    with pytest.raises(MissingValue):
+        next(sut.iter_chunks({"a": 1}))
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_template__when_rendering_to_stream__writes_same_output_as_format(
+    binary: bool,
+):
+    sut = Template(
+        variables=[Variable(key="NAME", path=["name"])], text="Hé {NAME} " * 10
+    )
+    fp = io.BytesIO() if binary else io.StringIO()
+
+    written = sut.render_to({"name": "Bob"}, fp, buffer_size=16)
+
+    expected = sut.format({"name": "Bob"})
+    if binary:
+        assert fp.getvalue() == expected.encode("utf-8")
+        assert written == len(expected.encode("utf-8"))
+    else:
+        assert fp.getvalue() == expected
+        assert written == len(expected)
+
+
+def test_template__when_rendering_to_file_opened_in_binary_mode__encodes_output(
+    tmp_path,
+):
+    sut = Template(variables=[Variable(key="NAME", path=["name"])], text="Hé {NAME}")
+    path = tmp_path / "out.txt"
+
+    with open(path, "wb") as fp:
+        sut.render_to({"name": "Bob"}, fp, encoding="latin-1")
+
+    assert path.read_bytes() == "Hé Bob".encode("latin-1")
+
+
+def test_template__when_rendering_streamed_list__writes_items_lazily():
+    written = []
+
+    class Recorder(io.StringIO):
+        def write(self, text: str) -> int:
+            written.append(text)
+            return super().write(text)
+
+    sut = Template(
+        variables=[
+            Variable(
+                key="ITEMS",
+                path=["items"],
+                formatter=ListFormatter("\n", stream=True, max_items=1_000),
+            )
+        ],
+        text="Items:\n{ITEMS}\nend",
+    )
+    fp = Recorder()
+
+    sut.render_to(
+        {"items": (f"item {index}" for index in range(10_000))}, fp, buffer_size=1_024
+    )
+
+    assert (
+        fp.getvalue()
+        == "Items:\n"
+        + "\n".join(f"item {index}" for index in range(1_000))
+        + "\n...\nend"
+    )
+    assert max(map(len, written)) < 1_100
+
+
+def test_template__when_streamed_list_is_referenced_twice__writes_it_both_times():
+    sut = Template(
+        variables=[
+            Variable(
+                key="ITEMS", path=["items"], formatter=ListFormatter(",", stream=True)
+            )
+        ],
+        text="{ITEMS}|{ITEMS}",
+    )
+
+    result = "".join(sut.iter_chunks({"items": iter([1, 2])}))
+
+    assert result == "1,2|1,2"
+    assert sut.format({"items": iter([1, 2])}) == "1,2|1,2"
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_template__when_streamed_list_is_converted__renders_like_joined_string(
+    compiled: bool,
+):
+    sut = Template(
+        variables=[
+            Variable(
+                key="ITEMS", path=["items"], formatter=ListFormatter(",", stream=True)
+            )
+        ],
+        text="{ITEMS!r} {ITEMS!a}",
+    )
+    if compiled:
+        sut.compile()
+    expected = "'é,2' '\\xe9,2'"
+
+    assert sut.format({"items": ["é", 2]}) == expected
+    assert "".join(sut.iter_chunks({"items": ["é", 2]})) == expected
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_template__when_output_cache_is_enabled__renders_each_projection_once(
+    compiled: bool,
+):
+    sut = Template(
+        variables=[Variable(key="NAME", path=["product", "name"])],
+        text="New: {NAME}",
+    )
+    if compiled:
+        sut.compile()
+    cache = sut.enable_output_cache()
+    records = [
+        {"product": {"name": name}, "user": index} for index, name in enumerate("aabab")
+    ]
+
+    assert list(sut.format_many(records)) == [f"New: {name}" for name in "aabab"]
+    assert sut.format(records[0]) == "New: a"
+    assert cache.stats.misses == 2
+    assert cache.stats.hits == 4
+    assert sut.output_cache is cache
+
+
+def test_template__when_output_cache_is_enabled_and_text_changes__drops_outputs():
+    sut = Template(variables=[Variable(key="A", path=["a"])], text="{A}")
+    sut.enable_output_cache()
+    sut.format({"a": 1})
+
+    sut.text = "[{A}]"
+
+    assert sut.format({"a": 1}) == "[1]"
+
+
+def test_template__when_output_cache_is_disabled__no_longer_caches():
+    sut = Template(variables=[Variable(key="A", path=["a"])], text="{A}")
+    sut.enable_output_cache()
+
+    sut.disable_output_cache()
+
+    assert sut.output_cache is None
+    assert sut.format({"a": 1}) == "1"
+    assert sut == Template(variables=[Variable(key="A", path=["a"])], text="{A}")
+
+
+def test_template__when_converted_to_dict__round_trips_through_from_dict():
+    definition = {
+        "text": "{names} owe {total}",
+        "variables": [
+            {"key": "names", "formatter": {"cls": "ListFormatter", "args": [", "]}},
+            {"key": "total", "path": "bill.total", "default": 0},
+        ],
+    }
+    sut = Template.from_dict(definition)
+
+    result = Template.from_dict(sut.to_dict())
+
+    assert result == sut
+    assert result.format({"names": ["a", "b"]}) == "a, b owe 0"
+
+
+def test_template__when_created__keeps_no_instance_dict():
+    sut = Template(variables=[Variable(key="name")], text="Hello {name}")
+    sut.compile()
+
+    assert not hasattr(sut, "__dict__")
+    assert not hasattr(sut.variables[0], "__dict__")
+
+
+def test_template__when_given_variables_as_dicts__creates_variables():
+    sut = Template(variables=[{"key": "name", "path": "user.name"}], text="{name}")
+
+    assert sut.variables == [Variable(key="name", path=["user", "name"])]
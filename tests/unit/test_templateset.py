@@ -0,0 +1,173 @@
+from typing import Any
+
+import pytest
+
+from templatr.exceptions import MissingValue
+from templatr.formatter import ListFormatter, VariableFormatter, load_formatter
+from templatr.template import Template
+from templatr.templateset import TemplateSet
+from templatr.variable import Variable
+
+
+class CountingFormatter(VariableFormatter):
+    calls = 0
+
+    def format(self, value: Any) -> Any:
+        CountingFormatter.calls += 1
+        return str(value).upper()
+
+
+class StatefulFormatter(VariableFormatter):
+    shareable = False
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def format(self, value: Any) -> Any:
+        self.calls += 1
+        return value
+
+
+@pytest.fixture
+def notification() -> TemplateSet:
+    upper = CountingFormatter()
+    listing = ListFormatter(", ")
+    return TemplateSet(
+        {
+            "subject": Template(
+                [Variable("name", path="user.name", formatter=upper)],
+                "Hi {name}",
+            ),
+            "body": Template(
+                [
+                    Variable("who", path="user.name", formatter=upper),
+                    Variable("items", formatter=listing),
+                ],
+                "Dear {who}, you bought {items}",
+            ),
+            "sms": Template(
+                [
+                    Variable("name", path="user.name"),
+                    Variable("items", formatter=listing),
+                ],
+                "{name}: {items}",
+            ),
+        }
+    )
+
+
+DATA = {"user": {"name": "ann"}, "items": ["a", "b"]}
+
+
+def test_template_set__when_formatting__renders_every_member_like_format(
+    notification: TemplateSet,
+):
+    result = notification.format(DATA)
+
+    assert result == {
+        name: template.format(DATA) for name, template in notification.templates.items()
+    }
+
+
+def test_template_set__when_variables_produce_same_value__formats_them_once(
+    notification: TemplateSet,
+):
+    CountingFormatter.calls = 0
+    notification.format(DATA)
+
+    assert CountingFormatter.calls == 1
+    assert [variable.key for variable in notification.variables] == [
+        "name",
+        "items",
+        "name",
+    ]
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        (Variable("a", default=1), Variable("b", path="a", default=True)),
+        (Variable("a", default="x"), Variable("b", path="a", default="y")),
+        (Variable("a"), Variable("b", path="a", formatter=ListFormatter(", "))),
+    ],
+)
+def test_template_set__when_default_or_formatter_differs__formats_separately(
+    first: Variable, second: Variable
+):
+    sut = TemplateSet(
+        {"first": Template([first], "{a}"), "second": Template([second], "{b}")}
+    )
+
+    assert len(sut.variables) == 2
+
+
+class PrefixFormatter(VariableFormatter):
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+
+    def format(self, value: Any) -> Any:
+        return f"{self.prefix}{value}"
+
+
+def test_template_set__when_formatters_are_equal_but_configured_differently__formats_separately():
+    sut = TemplateSet(
+        {
+            "a": Template([Variable("v", formatter=PrefixFormatter("A:"))], "{v}"),
+            "b": Template([Variable("v", formatter=PrefixFormatter("B:"))], "{v}"),
+        }
+    )
+
+    assert sut.format({"v": 1}) == {"a": "A:1", "b": "B:1"}
+    assert len(sut.variables) == 2
+
+
+def test_template_set__when_members_loaded_interned__shares_equal_formatter_definitions():
+    definition = {
+        "text": "{v}",
+        "variables": [
+            {
+                "key": "v",
+                "formatter": {
+                    "cls": "tests.unit.test_templateset.PrefixFormatter",
+                    "args": ["A:"],
+                },
+            }
+        ],
+    }
+    sut = TemplateSet(
+        {
+            "a": Template.from_dict(definition, intern=True),
+            "b": Template.from_dict(definition, intern=True),
+        }
+    )
+
+    assert sut.format({"v": 1}) == {"a": "A:1", "b": "A:1"}
+    assert len(sut.variables) == 1
+
+
+def test_template_set__when_formatter_is_not_shareable__formats_separately():
+    first = load_formatter("tests.unit.test_templateset.StatefulFormatter", [], {})
+    second = load_formatter("tests.unit.test_templateset.StatefulFormatter", [], {})
+    sut = TemplateSet(
+        {
+            "first": Template([Variable("a", formatter=first)], "{a}"),
+            "second": Template([Variable("a", formatter=second)], "{a}"),
+        }
+    )
+
+    sut.format({"a": 1})
+
+    assert (first.calls, second.calls) == (1, 1)
+
+
+def test_template_set__when_formatting_many__yields_outputs_per_record(
+    notification: TemplateSet,
+):
+    records = [DATA, {"items": []}]
+
+    result = list(notification.format_many(records, return_exceptions=True))
+
+    assert result[0]["sms"] == "ann: a, b"
+    assert isinstance(result[1], MissingValue)
+    with pytest.raises(MissingValue):
+        list(notification.format_many(records))
@@ -1,6 +1,8 @@
+import asyncio
+
 import pytest
 from templatr.exceptions import MissingValue
-from templatr.formatter import DefaultFormatter, ListFormatter
+from templatr.formatter import CachedFormatter, DefaultFormatter, ListFormatter
 from templatr.variable import FormatterData, Variable, VariableData
 
 
@@ -185,6 +187,62 @@ def test_variable__when_from_dict__given_dict_defining_configurable_formatter__p
     assert sut.formatter.seperator == "\n"
 
 
+@pytest.mark.parametrize("cache, max_size", [(True, 1024), (16, 16)])
+def test_variable__when_from_dict__given_cached_formatter__wraps_formatter_in_cache(
+    cache, max_size: int
+):
+    _input = {
+        "key": "key",
+        "formatter": {"cls": "ListFormatter", "args": ["\n"], "cache": cache},
+    }
+    sut = Variable.from_dict(_input)
+
+    assert isinstance(sut.formatter, CachedFormatter)
+    assert sut.formatter.formatter == ListFormatter("\n")
+    assert sut.formatter.max_size == max_size
+
+
+def test_variable__when_from_dict__given_same_cached_formatter_twice__keeps_caches_apart():
+    _input = {
+        "key": "key",
+        "formatter": {"cls": "ListFormatter", "args": [","], "cache": True},
+    }
+
+    assert (
+        Variable.from_dict(_input).formatter is not Variable.from_dict(_input).formatter
+    )
+
+
+def test_variable__when_from_dict_interned__given_same_cached_formatter_twice__shares_cache():
+    _input = {
+        "key": "key",
+        "formatter": {"cls": "ListFormatter", "args": [","], "cache": True},
+    }
+
+    assert (
+        Variable.from_dict(_input, intern=True).formatter
+        is Variable.from_dict(_input, intern=True).formatter
+    )
+
+
+def test_variable__when_measuring__returns_formatted_value_and_timings():
+    sut = Variable(key="key", path="items", formatter=ListFormatter(", "))
+
+    value, record = sut.measure({"items": [1, 2]}, origin_ns=0)
+
+    assert value == "1, 2"
+    assert record.key == "key"
+    assert record.outcome == "resolved"
+    assert record.offset_ns > 0
+
+
+def test_variable__when_measuring_missing_value_with_default__records_defaulted():
+    sut = Variable(key="key", default="NOT SET")
+
+    assert sut.measure({})[0] == "NOT SET"
+    assert sut.measure({})[1].outcome == "defaulted"
+
+
 def test_variable__when_resolving_value_for_variable_that_is_given_no_path__uses_key_as_path():
     sut = Variable(key="key")
     _input = {"key": "Whats up"}
@@ -255,3 +313,81 @@ def test_variable__when_resolving_path_on_object__returns_value():
             self.super = "Value"
 
     assert sut.resolve(Obj()) == "Value"
+
+
+def test_variable__when_resolving_missing_value_without_path__raises_MissingValue_with_key_as_path():
+    sut = Variable(key="key")
+
+    with pytest.raises(MissingValue) as exc_info:
+        sut.resolve({})
+
+    assert exc_info.value.path == ["key"]
+
+
+def test_variable__when_path_is_reassigned__resolves_new_path():
+    sut = Variable(key="key", path="first")
+    sut.resolve({"first": 1})
+    sut.path = ["second"]
+
+    assert sut.resolve({"second": 2}) == 2
+
+
+def test_variable__when_async_resolving_awaitable_value__returns_awaited_value():
+    async def lazy():
+        return [1, 2]
+
+    sut = Variable(key="key", formatter=ListFormatter(", "))
+
+    assert asyncio.run(sut.aresolve({"key": lazy()})) == "1, 2"
+
+
+def test_variable__when_async_resolving_plain_value__returns_formatted_value():
+    sut = Variable(key="key", formatter=ListFormatter(", "))
+
+    assert asyncio.run(sut.aresolve({"key": [1, 2]})) == "1, 2"
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        {"key": "name"},
+        {"key": "name", "path": "user.name", "default": {"first": "?"}},
+        {"key": "name", "path": ["user", "first.last"]},
+        {"key": "names", "formatter": {"cls": "ListFormatter", "args": [", "]}},
+        {
+            "key": "names",
+            "formatter": {
+                "cls": "ListFormatter",
+                "kwargs": {"seperator": ", ", "max_items": 2},
+                "cache": 8,
+            },
+        },
+    ],
+)
+def test_variable__when_converted_to_dict__round_trips_through_from_dict(
+    definition: dict,
+):
+    sut = Variable.from_dict(definition)
+
+    assert Variable.from_dict(sut.to_dict()) == sut
+
+
+def test_variable__when_given_formatter_that_is_not_a_formatter__raises_TypeError():
+    with pytest.raises(TypeError):
+        Variable(key="name", formatter=str)
+
+
+def test_variable__when_from_dict_interned__given_cached_stateful_formatter__keeps_caches_apart():
+    _input = {
+        "key": "key",
+        "formatter": {
+            "cls": "tests.unit.test_formatter.StatefulFormatter",
+            "cache": True,
+        },
+    }
+
+    first = Variable.from_dict(_input, intern=True).formatter
+    second = Variable.from_dict(_input, intern=True).formatter
+
+    assert first is not second
+    assert first.formatter is not second.formatter